@@ -0,0 +1,168 @@
+"""Groq sohbet tamamlama uç noktasının yerel taklidi
+
+Ağ ve API anahtarı gerektirmeden AI koç akışlarını denemek için kullanılır.
+Groq istemcisine base_url olarak verilir (veya GROQ_BASE_URL ortam
+değişkeniyle). Normal ve akışlı (SSE) yanıtları destekler; yanıt gecikmesi,
+parça başına gecikme ve belirli sayıda 429/5xx hatası ayarlanabilir.
+
+Komut satırından: python araclar/sahte_groq.py --port 8765 --parca-gecikmesi 0.02
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+VARSAYILAN_YANIT = (
+    "## Haftalık Plan\n\n"
+    + "Öncelikli konulara her gün düzenli zaman ayır ve her oturumun sonunda kısa bir test çöz. " * 40
+)
+
+
+class _HttpSunucu(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def handle_error(self, request, client_address):
+        # İstemci zaman aşımıyla bağlantıyı kestiğinde çıkan yazma hatalarını yut
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class SahteGroqSunucu:
+    """Arka planda çalışan sahte Groq sunucusu
+
+        with SahteGroqSunucu(parca_gecikmesi=0.01) as sunucu:
+            client = Groq(api_key="test", base_url=sunucu.adres)
+    """
+
+    def __init__(self, yanit=VARSAYILAN_YANIT, ilk_gecikme=0.0, parca_gecikmesi=0.0,
+                 parca_boyutu=8, hatalar=(), port=0):
+        # Sabit metin ya da istek gövdesinden metin üreten fonksiyon
+        self.yanit = yanit
+        self.ilk_gecikme = ilk_gecikme
+        self.parca_gecikmesi = parca_gecikmesi
+        self.parca_boyutu = parca_boyutu
+        # Sıradaki isteklere dönülecek HTTP hata kodları, örn. (429, 503)
+        self.hatalar = list(hatalar)
+        self.istek_sayisi = 0
+        self.istekler = []
+        self._kilit = threading.Lock()
+        self._sunucu = _HttpSunucu(('127.0.0.1', port), self._isleyici_sinifi())
+        self._is_parcacigi = None
+
+    @property
+    def adres(self):
+        host, port = self._sunucu.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def baslat(self):
+        self._is_parcacigi = threading.Thread(target=self._sunucu.serve_forever, daemon=True)
+        self._is_parcacigi.start()
+        return self
+
+    def durdur(self):
+        self._sunucu.shutdown()
+        self._sunucu.server_close()
+
+    def __enter__(self):
+        return self.baslat()
+
+    def __exit__(self, *exc):
+        self.durdur()
+
+    def _siradaki_hata(self, govde):
+        with self._kilit:
+            self.istek_sayisi += 1
+            self.istekler.append(govde)
+            return self.hatalar.pop(0) if self.hatalar else None
+
+    def _isleyici_sinifi(self):
+        sunucu = self
+
+        class Isleyici(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _json(self, kod, veri):
+                govde = json.dumps(veri).encode('utf-8')
+                self.send_response(kod)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(govde)))
+                self.end_headers()
+                self.wfile.write(govde)
+
+            def do_POST(self):
+                uzunluk = int(self.headers.get('Content-Length', 0))
+                istek = json.loads(self.rfile.read(uzunluk) or b'{}')
+                if not self.path.endswith('/chat/completions'):
+                    self._json(404, {'error': {'message': 'not found'}})
+                    return
+
+                hata = sunucu._siradaki_hata(istek)
+                time.sleep(sunucu.ilk_gecikme)
+                if hata:
+                    self._json(hata, {'error': {'message': f'sahte hata {hata}', 'type': 'sahte'}})
+                    return
+
+                model = istek.get('model', 'sahte-model')
+                metin = sunucu.yanit(istek) if callable(sunucu.yanit) else sunucu.yanit
+                if istek.get('stream'):
+                    self._akis(model, metin)
+                else:
+                    time.sleep(sunucu.parca_gecikmesi * len(self._parcalar(metin)))
+                    self._json(200, {
+                        'id': 'sahte', 'object': 'chat.completion', 'created': int(time.time()), 'model': model,
+                        'choices': [{'index': 0, 'finish_reason': 'stop',
+                                     'message': {'role': 'assistant', 'content': metin}}],
+                        'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0}
+                    })
+
+            def _parcalar(self, metin):
+                kelimeler = metin.split(' ')
+                adim = sunucu.parca_boyutu
+                return [' '.join(kelimeler[i:i + adim]) + (' ' if i + adim < len(kelimeler) else '')
+                        for i in range(0, len(kelimeler), adim)]
+
+            def _akis(self, model, metin):
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+
+                def gonder(delta, bitis=None):
+                    parca = {'id': 'sahte', 'object': 'chat.completion.chunk', 'created': int(time.time()),
+                             'model': model, 'choices': [{'index': 0, 'delta': delta, 'finish_reason': bitis}]}
+                    self.wfile.write(f"data: {json.dumps(parca)}\n\n".encode('utf-8'))
+                    self.wfile.flush()
+
+                gonder({'role': 'assistant', 'content': ''})
+                for parca in self._parcalar(metin):
+                    time.sleep(sunucu.parca_gecikmesi)
+                    gonder({'content': parca})
+                gonder({}, 'stop')
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+                self.close_connection = True
+
+        return Isleyici
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sahte Groq sunucusu")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--ilk-gecikme', type=float, default=0.3)
+    parser.add_argument('--parca-gecikmesi', type=float, default=0.02)
+    args = parser.parse_args()
+
+    sunucu = SahteGroqSunucu(ilk_gecikme=args.ilk_gecikme, parca_gecikmesi=args.parca_gecikmesi, port=args.port)
+    print(f"Sahte Groq sunucusu: {sunucu.adres}  (GROQ_BASE_URL={sunucu.adres})")
+    try:
+        sunucu._sunucu.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,100 @@
+"""AI önerisinde ilk görünür metne kadar geçen süre: bekleyen ve akışlı çağrı
+
+Sahte Groq sunucusu gerçekçi bir ilk yanıt gecikmesi ve parça hızıyla
+çalıştırılır; ağ veya API anahtarı gerekmez. Ardından parça sırası, ilk
+metnin erken gelmesi, 429/503 sonrası yeniden deneme ve hata mesajı
+doğrulanır; biri tutmazsa betik 1 koduyla çıkar.
+
+Kullanım: python benchmarks/bench_ai_akis.py [ilk_gecikme_s] [parca_gecikmesi_s]
+"""
+import os
+import sys
+import time
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK)
+sys.path.insert(0, os.path.join(KOK, 'araclar'))
+
+from groq import Groq  # noqa: E402
+from sahte_groq import VARSAYILAN_YANIT, SahteGroqSunucu  # noqa: E402
+from tyt.ai_kocu import get_ai_suggestion  # noqa: E402
+
+ORNEK_ANALIZ = {
+    'Türkçe - Paragraf': {'ders': 'Türkçe', 'konu': 'Paragraf', 'oncelik_puani': 9.1},
+    'Matematik - Problemler': {'ders': 'Matematik', 'konu': 'Problemler', 'oncelik_puani': 7.4},
+    'Fizik - Optik': {'ders': 'Fizik', 'konu': 'Optik', 'oncelik_puani': 2.2},
+}
+
+
+def dogrula():
+    """Akış davranışı kontrolleri; tutmayanların açıklamalarını döndürür"""
+    hatalar = []
+
+    # Numaralı kelimeler parça parça gelir; birleşince aynı sırada olmalı
+    metin = ' '.join(f"k{i}" for i in range(200))
+    with SahteGroqSunucu(yanit=metin, parca_boyutu=3) as sunucu:
+        parcalar = list(get_ai_suggestion(ORNEK_ANALIZ, 4, 30, Groq(api_key='sahte', base_url=sunucu.adres),
+                                          akis=True))
+    if len(parcalar) < 2:
+        hatalar.append(f"yanıt parçalanmadı: {len(parcalar)} parça")
+    if ''.join(parcalar) != metin:
+        hatalar.append("parçalar birleşince yanıt metni bozuluyor")
+
+    # İstemcinin kendi yeniden denemeleri akışta da çalışır
+    with SahteGroqSunucu(yanit="tamam", hatalar=[429, 503]) as sunucu:
+        sonuc = ''.join(get_ai_suggestion(ORNEK_ANALIZ, 4, 30, Groq(api_key='sahte', base_url=sunucu.adres),
+                                          akis=True))
+    if sonuc != "tamam" or sunucu.istek_sayisi != 3:
+        hatalar.append(f"429/503 sonrası yeniden denenmedi: {sonuc!r}, sunucuya {sunucu.istek_sayisi} istek")
+
+    # Yeniden deneme kapalıyken hata istisna olarak değil, metin olarak gelir
+    with SahteGroqSunucu(yanit="tamam", hatalar=[503]) as sunucu:
+        client = Groq(api_key='sahte', base_url=sunucu.adres, max_retries=0)
+        try:
+            sonuc = ''.join(get_ai_suggestion(ORNEK_ANALIZ, 4, 30, client, akis=True))
+        except Exception as e:
+            sonuc = f"istisna: {e!r}"
+    if not sonuc.startswith("AI önerisi alınırken hata oluştu"):
+        hatalar.append(f"503 hatası mesaja çevrilmedi: {sonuc!r}")
+    return hatalar
+
+
+def main():
+    ilk_gecikme = float(sys.argv[1]) if len(sys.argv) > 1 else 0.3
+    parca_gecikmesi = float(sys.argv[2]) if len(sys.argv) > 2 else 0.03
+
+    with SahteGroqSunucu(ilk_gecikme=ilk_gecikme, parca_gecikmesi=parca_gecikmesi) as sunucu:
+        client = Groq(api_key='sahte', base_url=sunucu.adres)
+
+        t0 = time.perf_counter()
+        metin = get_ai_suggestion(ORNEK_ANALIZ, 4, 30, client)
+        bekleyen = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        ilk = None
+        parcalar = []
+        for parca in get_ai_suggestion(ORNEK_ANALIZ, 4, 30, client, akis=True):
+            ilk = ilk or time.perf_counter() - t0
+            parcalar.append(parca)
+        toplam = time.perf_counter() - t0
+
+    akis_metni = ''.join(parcalar)
+    print(f"Yanıt: {len(metin.split())} kelime, {len(parcalar)} parça")
+    print(f"Bekleyen çağrı, ilk metin : {bekleyen * 1000:8.0f} ms")
+    print(f"Akışlı çağrı, ilk metin   : {ilk * 1000:8.0f} ms")
+    print(f"Akışlı çağrı, tamamı      : {toplam * 1000:8.0f} ms")
+
+    hatalar = dogrula()
+    if akis_metni != metin or metin != VARSAYILAN_YANIT:
+        hatalar.append("akışlı ve bekleyen çağrı aynı metni döndürmedi")
+    if parca_gecikmesi > 0 and ilk >= bekleyen / 2:
+        hatalar.append(f"akışta ilk metin erken gelmedi: {ilk * 1000:.0f} ms, bekleyen {bekleyen * 1000:.0f} ms")
+    print("\nDoğrulama: " + ("tamam" if not hatalar else "BAŞARISIZ"))
+    for hata in hatalar:
+        print(f"  - {hata}")
+    if hatalar:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
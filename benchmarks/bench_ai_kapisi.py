@@ -0,0 +1,110 @@
+"""Sınıf yükünde AI isteklerinin hız sınırı, adil sıra ve birleştirme etkisi
+
+Aynı anda butona basan oturumlar iş parçacıklarıyla canlandırılır; öğrenci
+profillerinin bir kısmı aynıdır. Bir oturum, öğrencilerden hemen önce
+birçok farklı isteği birden gönderir. Sahte Groq sunucusuna giden istek
+sayısı, herhangi bir saniyedeki en fazla istek, tamamlanma süreleri ve
+kapının kuyruk istatistikleri üç durumda raporlanır: kapısız, tek kuyruklu
+kapı (oturum ayrımı yok) ve oturumlar arası adil kapı. Ağ veya API anahtarı
+gerekmez.
+
+Kullanım: python benchmarks/bench_ai_kapisi.py [oturum_sayisi] [farkli_profil] [hiz] [kapasite]
+"""
+import os
+import statistics
+import sys
+import threading
+import time
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK)
+sys.path.insert(0, os.path.join(KOK, 'araclar'))
+
+from groq import Groq  # noqa: E402
+from sahte_groq import VARSAYILAN_YANIT, SahteGroqSunucu  # noqa: E402
+from tyt.ai_kapisi import IstekKapisi  # noqa: E402
+from tyt.ai_kocu import get_ai_suggestion  # noqa: E402
+
+ORNEK_ANALIZ = {
+    'Türkçe - Paragraf': {'ders': 'Türkçe', 'konu': 'Paragraf', 'oncelik_puani': 9.1},
+    'Matematik - Problemler': {'ders': 'Matematik', 'konu': 'Problemler', 'oncelik_puani': 7.4},
+    'Fizik - Optik': {'ders': 'Fizik', 'konu': 'Optik', 'oncelik_puani': 2.2},
+}
+# Öğrencilerden önce istek yağdıran oturumun farklı istek sayısı ve öne geçme süresi
+ACGOZLU_ISTEK = 10
+ACGOZLU_ONCELIK = 0.05
+
+
+def sinif_yuku(client, kapi, oturum_sayisi, farkli_profil, adil=True):
+    """{oturum: [tamamlanma süreleri]}; gün sayısı profili ayırır
+
+    adil=False ise tüm istekler kapıya aynı oturum adıyla (tek kuyruk) gelir.
+    """
+    isler = [("acgozlu", 1000 + j, 0.0) for j in range(ACGOZLU_ISTEK)]
+    isler += [(f"ogrenci{i}", 30 + i % farkli_profil, ACGOZLU_ONCELIK) for i in range(oturum_sayisi)]
+    sureler = {oturum: [] for oturum, _, _ in isler}
+    baslangic = threading.Event()
+    t0 = time.perf_counter()
+
+    def is_calistir(oturum, gun, gecikme):
+        baslangic.wait()
+        time.sleep(gecikme)
+        metin = ''.join(get_ai_suggestion(ORNEK_ANALIZ, 4, gun, client, akis=True, kapi=kapi,
+                                          oturum=oturum if adil else None))
+        assert 'hata' not in metin, metin
+        sureler[oturum].append(time.perf_counter() - t0)
+
+    parcaciklar = [threading.Thread(target=is_calistir, args=is_) for is_ in isler]
+    for p in parcaciklar:
+        p.start()
+    t0 = time.perf_counter()
+    baslangic.set()
+    for p in parcaciklar:
+        p.join()
+    return sureler
+
+
+def en_yogun_saniye(zamanlar):
+    zamanlar = sorted(zamanlar)
+    return max((sum(1 for z in zamanlar[i:] if z - t < 1.0) for i, t in enumerate(zamanlar)), default=0)
+
+
+def main():
+    oturum_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    farkli_profil = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    hiz = float(sys.argv[3]) if len(sys.argv) > 3 else 4.0
+    kapasite = int(sys.argv[4]) if len(sys.argv) > 4 else 2
+
+    print(f"{oturum_sayisi} oturum ({farkli_profil} farklı profil) + {ACGOZLU_ISTEK} istekli bir oturum; "
+          f"kapı: saniyede {hiz:g} istek, kapasite {kapasite}")
+    print(f"{'':<12}{'Üst istek':>10}{'En yoğun sn':>13}{'Öğrenci p50 (s)':>17}"
+          f"{'Öğrenci en geç (s)':>20}{'Açgözlü son (s)':>17}")
+    kapilar = []
+    for ad, kapi, adil in (('kapısız', None, True),
+                           ('tek kuyruk', IstekKapisi(hiz=hiz, kapasite=kapasite), False),
+                           ('adil', IstekKapisi(hiz=hiz, kapasite=kapasite), True)):
+        zamanlar = []
+
+        def yanit(istek):
+            zamanlar.append(time.perf_counter())
+            return VARSAYILAN_YANIT
+
+        with SahteGroqSunucu(yanit=yanit, ilk_gecikme=0.3, parca_gecikmesi=0.005) as sunucu:
+            client = Groq(api_key='sahte', base_url=sunucu.adres, max_retries=0)
+            sureler = sinif_yuku(client, kapi, oturum_sayisi, farkli_profil, adil)
+
+        ogrenciler = [s for oturum, liste in sureler.items() if oturum != 'acgozlu' for s in liste]
+        print(f"{ad:<12}{len(zamanlar):>10}{en_yogun_saniye(zamanlar):>13}"
+              f"{statistics.median(ogrenciler):>17.2f}{max(ogrenciler):>20.2f}{max(sureler['acgozlu']):>17.2f}")
+        if kapi is not None:
+            kapilar.append((ad, kapi.istatistikler()))
+
+    print()
+    for ad, durum in kapilar:
+        print(f"{ad}: {durum['istek']} istek, {durum['birlesen']} birleşen, en fazla kuyruk "
+              f"{durum['en_fazla_kuyruk_derinligi']}, ortalama bekleme {durum['ortalama_bekleme_s']:.2f} s, "
+              f"en fazla {durum['en_fazla_bekleme_s']:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
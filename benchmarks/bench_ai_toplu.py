@@ -0,0 +1,140 @@
+"""Toplu asenkron AI isteklerinin eşzamanlılığa göre süresi
+
+Sahte Groq sunucusu her isteğe sabit gecikmeyle yanıt verir; ilk istekler
+429/503 döndürerek yeniden deneme yolu da çalıştırılır. Ardından sonuç
+sırası, zaman aşımı, yeniden deneme ve eşzamanlılık sınırı sahte sunucuya
+karşı doğrulanır; biri tutmazsa betik 1 koduyla çıkar.
+
+Kullanım: python benchmarks/bench_ai_toplu.py [istek_sayisi] [gecikme_s]
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK)
+sys.path.insert(0, os.path.join(KOK, 'araclar'))
+
+from bench_ai_akis import ORNEK_ANALIZ  # noqa: E402
+from sahte_groq import SahteGroqSunucu  # noqa: E402
+from tyt.ai_toplu import ai_onerileri_toplu, async_groq_istemcisi_olustur  # noqa: E402
+
+
+def toplam_saat_satiri(istek):
+    istem = istek['messages'][1]['content']
+    return istem.split("Toplam çalışma süresi: ", 1)[1].split(" (", 1)[0]
+
+
+async def toplu(adres, istekler, **secenekler):
+    async with async_groq_istemcisi_olustur(api_key='sahte', base_url=adres) as client:
+        return await ai_onerileri_toplu(istekler, client, **secenekler)
+
+
+def dogrula():
+    """Davranış kontrolleri; tutmayanların açıklamalarını döndürür"""
+    hatalar = []
+    istekler = [(ORNEK_ANALIZ, i + 1, 30) for i in range(20)]
+
+    # Sonraki istekler önce biter; sonuçlar yine de istek sırasıyla dönmeli
+    def ters_sirali(istek):
+        saat = int(toplam_saat_satiri(istek).split()[0]) // 30
+        time.sleep(0.02 * (len(istekler) - saat))
+        return toplam_saat_satiri(istek)
+
+    with SahteGroqSunucu(yanit=ters_sirali) as sunucu:
+        sonuclar = asyncio.run(toplu(sunucu.adres, istekler, eszamanlilik=len(istekler)))
+    if [s.oneri for s in sonuclar] != [f"{(i + 1) * 30} saat" for i in range(len(istekler))]:
+        hatalar.append("ters sırada biten yanıtlar istek sırasına dizilmedi")
+
+    # 429 ve 503 yeniden denenir, 400 denenmez
+    with SahteGroqSunucu(yanit="tamam", hatalar=[429, 503]) as sunucu:
+        sonuc, = asyncio.run(toplu(sunucu.adres, istekler[:1], geri_cekilme=0.01))
+    if sonuc != ("tamam", None, 3):
+        hatalar.append(f"429/503 sonrası yeniden denenmedi: {sonuc}")
+    with SahteGroqSunucu(yanit="tamam", hatalar=[400]) as sunucu:
+        sonuc, = asyncio.run(toplu(sunucu.adres, istekler[:1], geri_cekilme=0.01))
+    if sonuc.oneri is not None or sonuc.deneme != 1:
+        hatalar.append(f"400 yeniden denendi: {sonuc}")
+    with SahteGroqSunucu(yanit="tamam", hatalar=[503] * 5) as sunucu:
+        sonuc, = asyncio.run(toplu(sunucu.adres, istekler[:1], deneme_sayisi=3, geri_cekilme=0.01))
+    if sonuc.oneri is not None or sonuc.deneme != 3 or sunucu.istek_sayisi != 3:
+        hatalar.append(f"deneme sayısı aşıldı: {sonuc}, sunucuya {sunucu.istek_sayisi} istek")
+
+    # Yavaş sunucuda her deneme zaman aşımında kesilir
+    with SahteGroqSunucu(yanit="tamam", ilk_gecikme=1.0) as sunucu:
+        t0 = time.perf_counter()
+        sonuc, = asyncio.run(toplu(sunucu.adres, istekler[:1], zaman_asimi=0.1, deneme_sayisi=2,
+                                   geri_cekilme=0.01))
+        sure = time.perf_counter() - t0
+    if sonuc.oneri is not None or 'Timeout' not in (sonuc.hata or '') or sonuc.deneme != 2 or sure > 0.8:
+        hatalar.append(f"zaman aşımı uygulanmadı: {sonuc}, {sure:.2f} s")
+
+    # Aynı anda sunucuda en fazla eszamanlilik kadar istek olur
+    acik = en_fazla = 0
+    kilit = threading.Lock()
+
+    def sayan(istek):
+        nonlocal acik, en_fazla
+        with kilit:
+            acik += 1
+            en_fazla = max(en_fazla, acik)
+        time.sleep(0.05)
+        with kilit:
+            acik -= 1
+        return "tamam"
+
+    with SahteGroqSunucu(yanit=sayan) as sunucu:
+        asyncio.run(toplu(sunucu.adres, istekler, eszamanlilik=4))
+    if en_fazla != 4:
+        hatalar.append(f"eşzamanlılık 4 iken sunucuda en fazla {en_fazla} istek görüldü")
+
+    # İstemi kurulamayan (boş analizli) istek hata sonucu alır, diğerleri etkilenmez
+    with SahteGroqSunucu(yanit="tamam") as sunucu:
+        sonuclar = asyncio.run(toplu(sunucu.adres, [istekler[0], ({}, 4, 30), istekler[1]]))
+    if [s.oneri for s in sonuclar] != ["tamam", None, "tamam"] or sonuclar[1].deneme != 0 or not sonuclar[1].hata:
+        hatalar.append(f"boş analiz toplu isteği bozdu: {sonuclar}")
+
+    deneme_sifir = None
+    try:
+        asyncio.run(ai_onerileri_toplu(istekler[:1], object(), deneme_sayisi=0))
+    except ValueError as e:
+        deneme_sifir = e
+    if deneme_sifir is None:
+        hatalar.append("deneme_sayisi=0 reddedilmedi")
+    return hatalar
+
+
+def main():
+    istek_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    gecikme = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+
+    hatalar = []
+    print(f"{istek_sayisi} istek, istek başına {gecikme * 1000:.0f} ms gecikme, ilk 6 istek 429/503")
+    for eszamanlilik in (1, 8, 32, 100):
+        # Sunucu istemdeki toplam saat satırını geri döndürür; sıranın korunduğu bununla doğrulanır
+        with SahteGroqSunucu(yanit=toplam_saat_satiri, ilk_gecikme=gecikme, hatalar=[429, 503] * 3) as sunucu:
+            istekler = [(ORNEK_ANALIZ, i + 1, 30) for i in range(istek_sayisi)]
+            t0 = time.perf_counter()
+            sonuclar = asyncio.run(toplu(sunucu.adres, istekler, eszamanlilik=eszamanlilik, geri_cekilme=0.05))
+            sure = time.perf_counter() - t0
+            sirali = all(s.oneri == f"{(i + 1) * 30} saat" for i, s in enumerate(sonuclar))
+            basarili = sum(s.oneri is not None for s in sonuclar)
+            tekrar = sum(s.deneme for s in sonuclar) - len(sonuclar)
+        print(f"eşzamanlılık {eszamanlilik:4d}: {sure:6.2f} s  {istek_sayisi / sure:7.1f} istek/s  "
+              f"başarılı {basarili}/{istek_sayisi}  yeniden deneme {tekrar}  {'sıralı' if sirali else 'SIRA BOZUK'}")
+        if not sirali or basarili != istek_sayisi or tekrar != 6:
+            hatalar.append(f"eşzamanlılık {eszamanlilik}: sıralı={sirali}, başarılı {basarili}, "
+                           f"yeniden deneme {tekrar} (beklenen 6)")
+
+    hatalar += dogrula()
+    print("\nDoğrulama: " + ("tamam" if not hatalar else "BAŞARISIZ"))
+    for hata in hatalar:
+        print(f"  - {hata}")
+    if hatalar:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Artımlı yeniden analizin tam analize göre süresi
+
+Tek öğrencide k konu düzeltildiğinde analiz_et + ders_toplamlari ile tam
+yeniden hesaplama, ArtimliAnaliz.duzeltmeleri_uygula ile karşılaştırılır.
+Ardından küçük düzeltmelerin uygulandığı bir kohort (öğrenci başına bir
+ArtimliAnaliz) için toplam süre ölçülür.
+
+Kullanım: python benchmarks/bench_artimli.py [ogrenci_sayisi]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_program import sentetik_veriler  # noqa: E402
+from tyt.analiz import KONU_SIRASI, analiz_et  # noqa: E402
+from tyt.artimli import ArtimliAnaliz  # noqa: E402
+from tyt.ozet import ders_toplamlari  # noqa: E402
+
+
+def duzeltmeler(rng, k):
+    sonuc = []
+    for ders, konu in rng.sample(KONU_SIRASI, k):
+        soru = rng.randint(1, 6)
+        dogru = rng.randint(0, soru)
+        yanlis = rng.randint(0, soru - dogru)
+        sonuc.append((ders, konu, {'dogru': dogru, 'yanlis': yanlis, 'bos': soru - dogru - yanlis,
+                                   'gercek_soru': soru}))
+    return sonuc
+
+
+def main():
+    ogrenci_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(0)
+    tekrar = 2000
+
+    print(f"{'Düzeltilen konu':>16}{'Tam (µs)':>11}{'Artımlı (µs)':>14}{'Hızlanma':>10}")
+    for k in (1, 5, 20, len(KONU_SIRASI)):
+        veriler = sentetik_veriler()
+        artimli = ArtimliAnaliz(veriler)
+        partiler = [duzeltmeler(rng, k) for _ in range(tekrar)]
+
+        t0 = time.perf_counter()
+        for parti in partiler:
+            for ders, konu, sonuclar in parti:
+                veriler[ders][konu] = sonuclar
+            ders_toplamlari(analiz_et(veriler))
+        tam = (time.perf_counter() - t0) / tekrar * 1e6
+
+        t0 = time.perf_counter()
+        for parti in partiler:
+            artimli.duzeltmeleri_uygula(parti)
+        yamali = (time.perf_counter() - t0) / tekrar * 1e6
+
+        assert artimli.analiz == analiz_et(veriler)
+        print(f"{k:>16}{tam:>11.1f}{yamali:>14.1f}{tam / yamali:>9.1f}x")
+
+    # Kohort: her öğrencinin analizi hazır, her birine 2 konuluk düzeltme geliyor
+    analizler = [ArtimliAnaliz(sentetik_veriler(seed)) for seed in range(ogrenci_sayisi)]
+    partiler = [duzeltmeler(rng, 2) for _ in range(ogrenci_sayisi)]
+
+    t0 = time.perf_counter()
+    for artimli, parti in zip(analizler, partiler):
+        for ders, konu, sonuclar in parti:
+            artimli.veriler[ders][konu] = sonuclar
+        ders_toplamlari(analiz_et(artimli.veriler))
+    tam = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for artimli, parti in zip(analizler, partiler):
+        artimli.esitle()
+        artimli.uygula()
+    yamali = time.perf_counter() - t0
+
+    print(f"\n{ogrenci_sayisi} öğrencilik kohortta 2'şer konu düzeltmesi: "
+          f"tam {tam * 1000:.0f} ms, artımlı (esitle + uygula) {yamali * 1000:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Net kazancına göre saat dağılımının süresi
+
+Tek öğrencinin analizi için saat_dagit gecikmesi (tüm katalog) ve kohort
+matrisleri için saat_dagit_toplu süresi ölçülür. Sonuçlar, λ üzerinde ikili
+aramayla bulunan dağılımla karşılaştırılır.
+
+Kullanım: python benchmarks/bench_dagitim.py [ogrenci_sayisi] [toplam_saat]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_program import sentetik_veriler  # noqa: E402
+from bench_puanlama import sentetik_sinif  # noqa: E402
+from tyt.analiz import analiz_et  # noqa: E402
+from tyt.dagitim import _OGRENME_SABITLERI, net_potansiyeli, saat_dagit, saat_dagit_toplu  # noqa: E402
+
+
+def ikili_arama(potansiyel, toplam_saat, adim=100):
+    """Referans: her satırda toplam saati tutturan ln λ'yı ikili aramayla bul"""
+    sabit = np.broadcast_to(_OGRENME_SABITLERI, potansiyel.shape)
+    marjinal = potansiyel / sabit
+    log_marjinal = np.log(np.where(marjinal > 0, marjinal, 1))
+    alt = np.full(len(potansiyel), -50.0)
+    ust = np.full(len(potansiyel), 50.0)
+    for _ in range(adim):
+        orta = (alt + ust) / 2
+        saat = np.where(marjinal > 0, sabit * np.maximum(log_marjinal - orta[:, None], 0), 0)
+        fazla = saat.sum(axis=1) > toplam_saat
+        alt, ust = np.where(fazla, orta, alt), np.where(fazla, ust, orta)
+    return saat
+
+
+def main():
+    ogrenci_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    toplam_saat = float(sys.argv[2]) if len(sys.argv) > 2 else 120
+
+    analiz = analiz_et(sentetik_veriler(0))
+    sureler = []
+    for _ in range(2000):
+        t0 = time.perf_counter()
+        saat_dagit(analiz, toplam_saat)
+        sureler.append(time.perf_counter() - t0)
+    p50, p99 = np.percentile(sureler, [50, 99]) * 1000
+    print(f"saat_dagit, {len(analiz)} konu: p50 {p50:.3f} ms, p99 {p99:.3f} ms")
+
+    dogru, yanlis, bos = sentetik_sinif(ogrenci_sayisi)
+    t0 = time.perf_counter()
+    saatler, kazanclar = saat_dagit_toplu(dogru, yanlis, bos, toplam_saat)
+    sure = time.perf_counter() - t0
+    print(f"saat_dagit_toplu, {ogrenci_sayisi} öğrenci: {sure:.2f} s "
+          f"({ogrenci_sayisi / sure:,.0f} öğrenci/s), ortalama beklenen net {kazanclar.sum(axis=1).mean():.2f}")
+
+    alt_kume = slice(0, min(ogrenci_sayisi, 2000))
+    t0 = time.perf_counter()
+    referans = ikili_arama(net_potansiyeli(dogru[alt_kume], yanlis[alt_kume], bos[alt_kume]), toplam_saat)
+    sure_referans = (time.perf_counter() - t0) * ogrenci_sayisi / len(referans)
+    print(f"ikili arama (100 adım): {sure_referans:.2f} s (tahmini), "
+          f"en büyük fark {np.abs(referans - saatler[alt_kume]).max():.2e} saat")
+
+
+if __name__ == '__main__':
+    main()
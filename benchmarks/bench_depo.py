@@ -0,0 +1,80 @@
+"""Deneme deposunun yazma ve okuma hızı
+
+Önce deneme başına ayrı işlemle (deneme_kaydet) ve partili işlemlerle
+(denemeleri_toplu_kaydet) yazma hızı karşılaştırılır; ardından depo
+milyonlarca konu sonucu satırına doldurulup rastgele öğrencilerin son
+denemesini yükleme (son_veriler) ve bir konunun geçmişini okuma
+(konu_gecmisi) gecikmeleri ölçülür.
+
+Kullanım: python benchmarks/bench_depo.py [deneme_sayisi] [ogrenci_sayisi]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_program import sentetik_veriler  # noqa: E402
+from tyt.analiz import KONU_SIRASI  # noqa: E402
+from tyt.depo import DenemeDeposu  # noqa: E402
+
+
+def kayitlar(deneme_sayisi, ogrenci_sayisi, ornekler):
+    baslangic = date(2025, 9, 1)
+    for i in range(deneme_sayisi):
+        yield (f"Öğrenci {i % ogrenci_sayisi:06d}", baslangic + timedelta(days=i // ogrenci_sayisi),
+               ornekler[i % len(ornekler)])
+
+
+def gecikmeler_ms(fonksiyon, argumanlar):
+    sureler = []
+    for arguman in argumanlar:
+        t0 = time.perf_counter()
+        fonksiyon(*arguman)
+        sureler.append((time.perf_counter() - t0) * 1000)
+    sureler.sort()
+    return sureler[len(sureler) // 2], sureler[int(len(sureler) * 0.99)]
+
+
+def main():
+    deneme_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    ogrenci_sayisi = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    ornekler = [sentetik_veriler(seed) for seed in range(64)]
+    satir_basina = len(KONU_SIRASI)
+
+    with tempfile.TemporaryDirectory() as dizin:
+        tekil = DenemeDeposu(os.path.join(dizin, 'tekil.sqlite3'))
+        n = 500
+        t0 = time.perf_counter()
+        for ogrenci, tarih, veriler in kayitlar(n, 50, ornekler):
+            tekil.deneme_kaydet(ogrenci, veriler, tarih)
+        tekil_hiz = n * satir_basina / (time.perf_counter() - t0)
+        tekil.kapat()
+
+        depo = DenemeDeposu(os.path.join(dizin, 'depo.sqlite3'))
+        t0 = time.perf_counter()
+        depo.denemeleri_toplu_kaydet(kayitlar(deneme_sayisi, ogrenci_sayisi, ornekler))
+        sure = time.perf_counter() - t0
+        toplu_hiz = deneme_sayisi * satir_basina / sure
+
+        print(f"Deneme başına işlem : {tekil_hiz:>12,.0f} satır/s")
+        print(f"Partili işlem       : {toplu_hiz:>12,.0f} satır/s "
+              f"({deneme_sayisi * satir_basina:,} satır, {sure:.1f} s)")
+        print(f"Dosya boyutu        : {os.path.getsize(depo.yol) / 2**20:>12.1f} MB")
+
+        rng = random.Random(0)
+        ogrenciler = [(f"Öğrenci {rng.randrange(ogrenci_sayisi):06d}",) for _ in range(2000)]
+        p50, p99 = gecikmeler_ms(depo.son_veriler, ogrenciler)
+        print(f"son_veriler         : p50 {p50:.3f} ms, p99 {p99:.3f} ms")
+
+        konular = [(ogrenci, *rng.choice(KONU_SIRASI)) for ogrenci, in ogrenciler]
+        p50, p99 = gecikmeler_ms(depo.konu_gecmisi, konular)
+        print(f"konu_gecmisi        : p50 {p50:.3f} ms, p99 {p99:.3f} ms")
+        depo.kapat()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""Excel dışa aktarmanın satır sayısına göre süresi ve tepe belleği
+
+Eski yol (normal çalışma kitabı, hücre başına yeni Alignment/Font) ile akışlı
+yol (write-only çalışma kitabı, adlandırılmış stiller) karşılaştırılır. Her
+ölçüm ayrı bir süreçte yapılır; tepe bellek sürecin en yüksek RSS değeridir.
+Eski yol büyük boyutlarda çok bellek tükettiği için varsayılan olarak yalnızca
+--eski-sinir satıra kadar çalıştırılır.
+
+Kullanım: python benchmarks/bench_excel.py [--boyutlar 10000 100000 1000000] [--eski-sinir 100000]
+"""
+import argparse
+import itertools
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tyt.disa_aktarim import PROGRAM_BASLIKLARI, SUTUN_GENISLIKLERI, excel_export_akis  # noqa: E402
+
+
+def program_satirlari_uret(satir_sayisi):
+    """365 günlük, 12 saatlik bir programın satırlarını satir_sayisi kadar tekrarla"""
+    from bench_program import sentetik_veriler
+    from tyt.analiz import analiz_et
+    from tyt.program import program_olustur_zaman_dilimli
+
+    program = program_olustur_zaman_dilimli(analiz_et(sentetik_veriler()), datetime(2025, 1, 1), 365, 12)
+    satirlar = [tuple(satir[b] for b in PROGRAM_BASLIKLARI) for satir in program]
+    return itertools.islice(itertools.cycle(satirlar), satir_sayisi)
+
+
+def eski_yol(satirlar, hedef):
+    """Önceki excel_export_professional gövdesi (hücre hücre, normal çalışma kitabı)"""
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "TYT Çalışma Programı"
+    header_font = Font(bold=True, color="FFFFFF", size=12)
+    header_fill = PatternFill(start_color="2F4F4F", end_color="2F4F4F", fill_type="solid")
+    thin_border = Border(left=Side(style='thin'), right=Side(style='thin'),
+                         top=Side(style='thin'), bottom=Side(style='thin'))
+    high_priority_fill = PatternFill(start_color="FFE4E1", end_color="FFE4E1", fill_type="solid")
+    hard_topic_fill = PatternFill(start_color="FFF8DC", end_color="FFF8DC", fill_type="solid")
+
+    for col, header in enumerate(PROGRAM_BASLIKLARI, 1):
+        cell = ws.cell(row=1, column=col, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = Alignment(horizontal="center", vertical="center")
+        cell.border = thin_border
+
+    for row_idx, row in enumerate(satirlar, 2):
+        for col_idx, value in enumerate(row, 1):
+            cell = ws.cell(row=row_idx, column=col_idx, value=value)
+            cell.border = thin_border
+            cell.alignment = Alignment(horizontal="center", vertical="center")
+            if col_idx == 6 and isinstance(value, (int, float)) and value > 5:
+                cell.fill = high_priority_fill
+                cell.font = Font(bold=True, color="8B0000")
+            if col_idx == 7 and value == "Zor":
+                cell.fill = hard_topic_fill
+                cell.font = Font(bold=True, color="FF8C00")
+
+    for col, width in SUTUN_GENISLIKLERI.items():
+        ws.column_dimensions[col].width = width
+    wb.save(hedef)
+
+
+def tek_olcum(yontem, satir_sayisi):
+    """Bu süreçte tek bir ölçüm yap; 'süre_s tepe_mb boyut_mb' yazdır"""
+    satirlar = program_satirlari_uret(satir_sayisi)
+    with tempfile.TemporaryDirectory() as dizin:
+        hedef = os.path.join(dizin, 'program.xlsx')
+        t0 = time.perf_counter()
+        if yontem == 'eski':
+            eski_yol(satirlar, hedef)
+        else:
+            excel_export_akis(satirlar, hedef)
+        sure = time.perf_counter() - t0
+        boyut = os.path.getsize(hedef) / 2**20
+    tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux'ta KB
+    print(f"{sure:.3f} {tepe:.1f} {boyut:.1f}")
+
+
+def olc(yontem, satir_sayisi):
+    sonuc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--tek', yontem, str(satir_sayisi)],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    return [float(x) for x in sonuc.stdout.split()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--boyutlar', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--eski-sinir', type=int, default=100_000, help="eski yolun çalıştırılacağı en büyük boyut")
+    parser.add_argument('--tek', nargs=2, metavar=('YONTEM', 'SATIR'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.tek:
+        tek_olcum(args.tek[0], int(args.tek[1]))
+        return
+
+    print(f"{'Satır':>10}{'Yöntem':>8}{'Süre (s)':>10}{'Satır/s':>10}{'Tepe RSS (MB)':>15}{'Dosya (MB)':>12}")
+    for satir_sayisi in args.boyutlar:
+        for yontem in ('eski', 'akis'):
+            if yontem == 'eski' and satir_sayisi > args.eski_sinir:
+                print(f"{satir_sayisi:>10}{yontem:>8}{'atlandı':>10}")
+                continue
+            sure, tepe, boyut = olc(yontem, satir_sayisi)
+            print(f"{satir_sayisi:>10}{yontem:>8}{sure:>10.2f}{satir_sayisi / sure:>10.0f}{tepe:>15.1f}{boyut:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
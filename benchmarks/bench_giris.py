@@ -0,0 +1,103 @@
+"""Veri girişi oturumu başına yeniden çalıştırma sayısı ve sunucu CPU süresi
+
+Bir öğrencinin her konu için doğru ve yanlış sayısını girdiği oturum
+streamlit.testing AppTest ile oynatılır. Anlık modda her number_input
+değişikliği betiği baştan çalıştırır; toplu modda tablo düzenlemeleri
+tarayıcıda kalır ve yalnızca "Sonuçları Kaydet" bir kez çalıştırır. CPU süresi
+süreç CPU zamanıdır (time.process_time).
+
+Kullanım: python benchmarks/bench_giris.py [konu_sayisi]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from bench_program import sentetik_veriler  # noqa: E402
+from tyt.giris import giris_tablosu  # noqa: E402
+from tyt.konular import KONU_VERILERI  # noqa: E402
+
+UYGULAMA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tyt_planner.py')
+DERS_GRUPLARI = {
+    "Türkçe": ["Türkçe"],
+    "Matematik": ["Matematik", "Geometri"],
+    "Fen Bilimleri": ["Fizik", "Kimya", "Biyoloji"],
+    "Sosyal Bilimler": ["Tarih", "Coğrafya", "Felsefe", "Din Kültürü ve Ahlak Bilgisi"]
+}
+
+
+def girisler(konu_sayisi):
+    """Oturumda girilecek (ders, konu, dogru, yanlis) değerleri"""
+    veriler = sentetik_veriler()
+    sonuc = []
+    for ders in (d for dersler in DERS_GRUPLARI.values() for d in dersler):
+        for konu in KONU_VERILERI[ders]:
+            kayit = veriler[ders][konu]
+            sonuc.append((ders, konu, kayit['dogru'], kayit['yanlis']))
+    return sonuc[:konu_sayisi]
+
+
+def calistir(at, sayac):
+    t0 = time.process_time()
+    at.run()
+    sayac[0] += 1
+    sayac[1] += time.process_time() - t0
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+
+def anlik_oturum(konu_sayisi):
+    sayac = [0, 0.0]
+    at = AppTest.from_file(UYGULAMA, default_timeout=120)
+    calistir(at, sayac)
+    at.radio[0].set_value("⌨️ Anlık (konu konu)")
+    calistir(at, sayac)
+    ilk = sayac[:]
+    for ders, konu, dogru, yanlis in girisler(konu_sayisi):
+        for alan, deger in (('dogru', dogru), ('yanlis', yanlis)):
+            at.number_input(key=f"{ders}_{konu}_{alan}").set_value(deger)
+            calistir(at, sayac)
+    return sayac[0] - ilk[0], sayac[1] - ilk[1], at.session_state.veriler
+
+
+def toplu_oturum(konu_sayisi):
+    sayac = [0, 0.0]
+    at = AppTest.from_file(UYGULAMA, default_timeout=120)
+    calistir(at, sayac)
+    ilk = sayac[:]
+
+    # Tablo düzenlemeleri tarayıcıda birikir; gönderimde editörlerin durumu olarak gelir
+    degerler = {(ders, konu): (dogru, yanlis) for ders, konu, dogru, yanlis in girisler(konu_sayisi)}
+    for grup_adi, dersler in DERS_GRUPLARI.items():
+        duzenlenen = {}
+        for i, satir in enumerate(giris_tablosu({}, dersler)):
+            if (satir['Ders'], satir['Konu']) in degerler:
+                dogru, yanlis = degerler[satir['Ders'], satir['Konu']]
+                duzenlenen[i] = {'Doğru': dogru, 'Yanlış': yanlis}
+        at.session_state[f"toplu_giris_{grup_adi}_0"] = {
+            'edited_rows': duzenlenen, 'added_rows': [], 'deleted_rows': []
+        }
+    [b for b in at.button if 'Kaydet' in b.label][0].click()
+    calistir(at, sayac)
+    return sayac[0] - ilk[0], sayac[1] - ilk[1], at.session_state.veriler
+
+
+def main():
+    konu_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else sum(len(k) for k in KONU_VERILERI.values())
+
+    a_sayi, a_cpu, a_veriler = anlik_oturum(konu_sayisi)
+    t_sayi, t_cpu, t_veriler = toplu_oturum(konu_sayisi)
+    assert a_veriler == t_veriler, "iki mod farklı veri kaydetti"
+
+    print(f"{konu_sayisi} konu için doğru/yanlış girişi")
+    print(f"{'Mod':>8}{'Yeniden çalıştırma':>20}{'CPU (s)':>10}{'Çalıştırma başına (ms)':>24}")
+    print(f"{'anlık':>8}{a_sayi:>20}{a_cpu:>10.2f}{a_cpu / a_sayi * 1000:>24.1f}")
+    print(f"{'toplu':>8}{t_sayi:>20}{t_cpu:>10.2f}{t_cpu / t_sayi * 1000:>24.1f}")
+    print(f"Azalma: {a_sayi / t_sayi:.0f}x yeniden çalıştırma, {a_cpu / t_cpu:.0f}x CPU")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""Modül import sürelerini ve uygulamanın soğuk açılışını -X importtime ile ölç
+
+Her modül temiz bir yorumlayıcıda birkaç kez içe aktarılır ve en iyi
+kümülatif süre raporlanır. Uygulama betiği (tyt_planner.py) Streamlit'in
+çıplak modunda ilk sayfa çalıştırmasıyla birlikte ölçülür: içe aktarılan
+paketlerin toplamı, importtime olmadan duvar saati süresi ve yalnızca
+kullanıldıklarında yüklenmesi gereken paketler (openpyxl, groq,
+plotly.express) yüklenmiş mi. Böyle bir paket yüklenirse çıkış kodu 1'dir.
+--cikti verilirse sonuçlar JSON satırı olarak dosyaya eklenir, böylece
+sürümler arası karşılaştırma yapılabilir.
+
+Kullanım: python benchmarks/bench_import.py [--tekrar 5] [--cikti import.jsonl] [--uygulamasiz] [modul ...]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+KOK_DIZIN = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+VARSAYILAN_MODULLER = [
+    'tyt',
+    'tyt.konular',
+    'tyt.analiz',
+    'tyt.ozet',
+    'tyt.program',
+    'tyt.ai_kocu',
+    'tyt.disa_aktarim',
+    'tyt.kohort',
+    'tyt.grafikler',
+]
+UYGULAMA = 'tyt_planner.py'
+# Açılışta yüklenmemesi gereken paketler: dışa aktarım, AI düğmesi ve grafikler
+ERTELENEN_PAKETLER = ['openpyxl', 'groq', 'plotly.express']
+
+
+def _uygulama_ortami():
+    """Uygulamanın depo ve önbellek dosyalarını geçici dizine yönlendiren ortam"""
+    dizin = tempfile.mkdtemp(prefix='tyt_import_')
+    return {**os.environ, 'TYT_VERI_DIZINI': dizin, 'TYT_ONBELLEK_DIZINI': dizin}
+
+
+def _komut(modul):
+    if modul == UYGULAMA:
+        return [os.path.join(KOK_DIZIN, UYGULAMA)]
+    return ['-c', f'import {modul}' if modul else 'pass']
+
+
+def importtime_olc(modul):
+    """Tek bir temiz süreçte modülü içe aktar; (kümülatif_us, {paket: kümülatif_us}) döndür
+
+    Uygulama betiği için kümülatif süre, betiğin içe aktardığı üst düzey paketlerin toplamıdır.
+    """
+    sonuc = subprocess.run(
+        [sys.executable, '-X', 'importtime', *_komut(modul)],
+        capture_output=True, text=True, cwd=KOK_DIZIN, check=True, env=_uygulama_ortami(),
+    )
+    paketler = {}
+    ust_duzey = 0
+    for satir in sonuc.stderr.splitlines():
+        if not satir.startswith('import time:') or 'self [us]' in satir:
+            continue
+        _, kumulatif, ad = satir.split('|')
+        paketler[ad.strip()] = int(kumulatif)
+        if ad[1] != ' ':
+            ust_duzey += int(kumulatif)
+    return (ust_duzey if modul == UYGULAMA else paketler.get(modul, 0)), paketler
+
+
+def acilis_suresi(modul):
+    """importtime olmadan temiz süreçte içe aktarma (uygulamada ilk çalıştırma) süresi (s)"""
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, *_komut(modul)], capture_output=True, cwd=KOK_DIZIN, check=True,
+                   env=_uygulama_ortami())
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('moduller', nargs='*', default=VARSAYILAN_MODULLER)
+    parser.add_argument('--tekrar', type=int, default=5)
+    parser.add_argument('--cikti', help='Sonuçların ekleneceği JSON satırları dosyası')
+    parser.add_argument('--uygulamasiz', action='store_true', help='Uygulama betiğinin açılışını ölçme')
+    args = parser.parse_args()
+    if not args.uygulamasiz and UYGULAMA not in args.moduller:
+        args.moduller.append(UYGULAMA)
+
+    # Yorumlayıcı açılışında (site, .pth dosyaları) yüklenenleri ayıkla
+    _, acilis = importtime_olc(None)
+
+    kayitlar = []
+    print(f"{'Modül':<22}{'En iyi (ms)':>12}  En ağır bağımlılıklar")
+    for modul in args.moduller:
+        olcumler = [importtime_olc(modul) for _ in range(args.tekrar)]
+        en_iyi, paketler = min(olcumler, key=lambda x: x[0])
+        agir = sorted(
+            ((ad, us) for ad, us in paketler.items() if '.' not in ad and ad not in acilis and ad != modul.split('.')[0]),
+            key=lambda x: x[1], reverse=True,
+        )[:3]
+        print(f"{modul:<22}{en_iyi / 1000:>12.1f}  " + ', '.join(f"{ad} {us / 1000:.0f}ms" for ad, us in agir))
+        kayitlar.append({'modul': modul, 'kumulatif_ms': en_iyi / 1000, 'bagimliliklar': dict(agir)})
+
+    yuklenenler = []
+    if UYGULAMA in args.moduller:
+        kayit = kayitlar[args.moduller.index(UYGULAMA)]
+        _, paketler = importtime_olc(UYGULAMA)
+        yuklenenler = [ad for ad in ERTELENEN_PAKETLER if ad in paketler]
+        kayit['acilis_ms'] = min(acilis_suresi(UYGULAMA) for _ in range(args.tekrar)) * 1000
+        kayit['erken_yuklenen'] = yuklenenler
+        print(f"\n{UYGULAMA} soğuk açılış (içe aktarma + ilk çalıştırma): {kayit['acilis_ms']:.0f} ms")
+        print("Açılışta yüklenen ertelenmiş paketler: " + (', '.join(yuklenenler) or 'yok'))
+
+    if args.cikti:
+        with open(args.cikti, 'a', encoding='utf-8') as f:
+            for kayit in kayitlar:
+                kayit['zaman'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+                f.write(json.dumps(kayit, ensure_ascii=False) + '\n')
+
+    if yuklenenler:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""PDF karne aktarımının sayfa/saniye hızı
+
+fpdf2 ile sentetik karneler üretilir: dizinde öğrenci başına bir PDF ve her
+öğrencinin ayrı sayfalarda olduğu tek bir sınıf karnesi. Her öğrenci 60 konu
+satırıyla iki sayfa tutar. Öğrenciler sırayla üç tablo düzeninden birini
+kullanır: başlıklı "Soru D Y B Net", başlıklı "D Y B Net" ve başlıksız
+"D Y B Net". Tam sayı netler virgülsüz yazılır ve her beşinci konu tam
+puanlıdır; böylece "D 0 0 D" satırları da okunur. Çekirdek yazı tipleri Türkçe karakterleri
+içermediğinden konu adları ASCII'ye katlanarak yazılır. Soğuk (önbelleksiz)
+okuma tek süreçte ve işçi havuzuyla, sıcak okuma dolu önbellekle ölçülür; okunan
+veriler üretilenlerle karşılaştırılır.
+
+Kullanım: python benchmarks/bench_karne.py [pdf_sayisi] [isci_sayisi]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_program import sentetik_veriler  # noqa: E402
+from tyt.karne import _KATLAMA, karneleri_oku, klasordeki_pdfler  # noqa: E402
+from tyt.onbellek import DiskOnbellek  # noqa: E402
+
+
+DUZENLER = ('soru', 'net', 'basliksiz')
+
+
+def tam_puanli(veriler):
+    """Her beşinci konuyu tüm soruları doğru yapılmış hale getir"""
+    for i, s in enumerate(s for konular in veriler.values() for s in konular.values()):
+        if i % 5 == 0:
+            s.update(dogru=s['gercek_soru'], yanlis=0, bos=0)
+    return veriler
+
+
+def net_metni(net):
+    return str(int(net)) if net == int(net) else f"{net:.2f}".replace('.', ',')
+
+
+def sentetik_karne(yol, ogrenciler, ilk=0):
+    """[(ad, veriler)] için öğrenci başına yeni sayfada başlayan karne PDF'i yaz
+
+    i. öğrencinin tablo düzeni DUZENLER[(ilk + i) % 3]'tür.
+    """
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.set_auto_page_break(True, margin=15)
+    for i, (ad, veriler) in enumerate(ogrenciler):
+        duzen = DUZENLER[(ilk + i) % len(DUZENLER)]
+        pdf.add_page()
+        pdf.set_font('Helvetica', 'B', 14)
+        pdf.cell(0, 10, 'TYT DENEME SINAVI - KONU ANALIZ KARNESI', new_x='LMARGIN', new_y='NEXT')
+        pdf.set_font('Helvetica', size=11)
+        pdf.cell(0, 8, f"Ogrenci: {ad}", new_x='LMARGIN', new_y='NEXT')
+        for ders, konular in veriler.items():
+            pdf.set_font('Helvetica', 'B', 11)
+            pdf.cell(0, 8, ders.translate(_KATLAMA).upper(), new_x='LMARGIN', new_y='NEXT')
+            pdf.set_font('Helvetica', size=10)
+            sutunlar = ('Soru', 'D', 'Y', 'B') if duzen == 'soru' else ('D', 'Y', 'B')
+            if duzen != 'basliksiz':
+                pdf.cell(90, 6, "Konu")
+                for baslik in sutunlar:
+                    pdf.cell(15, 6, baslik, align='R')
+                pdf.cell(20, 6, "Net", align='R', new_x='LMARGIN', new_y='NEXT')
+            for sira, (konu, s) in enumerate(konular.items(), 1):
+                net = s['dogru'] - s['yanlis'] / 4
+                degerler = (s['dogru'], s['yanlis'], s['bos'])
+                if duzen == 'soru':
+                    degerler = (s['gercek_soru'], *degerler)
+                pdf.cell(90, 6, f"{sira}. {konu.translate(_KATLAMA)}")
+                for deger in degerler:
+                    pdf.cell(15, 6, str(deger), align='R')
+                pdf.cell(20, 6, net_metni(net), align='R', new_x='LMARGIN', new_y='NEXT')
+    pdf.output(yol)
+
+
+def olc(yollar, isci_sayisi, onbellek):
+    t0 = time.perf_counter()
+    karneler = list(karneleri_oku(yollar, isci_sayisi, onbellek))
+    sure = time.perf_counter() - t0
+    return karneler, sure, sum(k.sayfa_sayisi for k in karneler) / sure
+
+
+def main():
+    pdf_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    isci_sayisi = int(sys.argv[2]) if len(sys.argv) > 2 else max(2, os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory() as dizin:
+        ogrenciler = [(f"Ogrenci {i:04d}", tam_puanli(sentetik_veriler(i))) for i in range(pdf_sayisi)]
+        os.makedirs(os.path.join(dizin, 'karneler'))
+        for i, (ad, veriler) in enumerate(ogrenciler):
+            # Dizindeki PDF'ler de sınıf karnesiyle aynı düzeni kullanır
+            sentetik_karne(os.path.join(dizin, 'karneler', f"{ad}.pdf"), [(ad, veriler)], ilk=i)
+        sinif = os.path.join(dizin, 'sinif.pdf')
+        sentetik_karne(sinif, ogrenciler)
+        yollar = klasordeki_pdfler(os.path.join(dizin, 'karneler'))
+
+        print(f"{pdf_sayisi} PDF'lik dizin ve {pdf_sayisi} öğrencilik sınıf karnesi, {os.cpu_count()} çekirdek")
+        print(f"{'Girdi':<8}{'Okuma':<22}{'Süre (s)':>10}{'Sayfa/s':>10}")
+        for girdi, liste in (('dizin', yollar), ('sınıf', [sinif])):
+            onbellek = DiskOnbellek(os.path.join(dizin, f'{girdi}.sqlite3'), kapasite=10000, ttl=3600)
+            for okuma, isci, kullanilan in (('soğuk, tek süreç', 1, None),
+                                            (f'soğuk, {isci_sayisi} işçi', isci_sayisi, onbellek),
+                                            ('sıcak (önbellek)', 1, onbellek)):
+                karneler, sure, hiz = olc(liste, isci, kullanilan)
+                okunan = [o for k in karneler for o in k.ogrenciler]
+                assert okunan == ogrenciler, "okunan veriler üretilenlerle aynı değil"
+                print(f"{girdi:<8}{okuma:<22}{sure:>10.2f}{hiz:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
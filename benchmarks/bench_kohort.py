@@ -0,0 +1,71 @@
+"""Kohort analizinin süre ve bellek ölçümü
+
+Sentetik bir deneme dosyası üretir (varsayılan 100k öğrenci) ve kohort_analiz
+ile işler. Tepe bellek (tracemalloc) öğrenci sayısıyla değil parça boyutuyla
+büyümelidir.
+
+Kullanım: python benchmarks/bench_kohort.py [ogrenci_sayisi] [parca_boyutu]
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tyt.analiz import KONU_SIRASI  # noqa: E402
+from tyt.kohort import kohort_analiz  # noqa: E402
+from tyt.konular import KONU_VERILERI  # noqa: E402
+
+
+def sentetik_dosya(yol, ogrenci_sayisi, seed=0, parca=10000):
+    """Her satırı bir öğrenci olan deneme sonuç dosyası yaz"""
+    rng = np.random.default_rng(seed)
+    soru = np.array([KONU_VERILERI[d][k]['ortalama_soru'] for d, k in KONU_SIRASI])
+    with open(yol, 'w', newline='', encoding='utf-8') as f:
+        yazici = csv.writer(f)
+        baslik = ['Öğrenci']
+        for ders, konu in KONU_SIRASI:
+            baslik += [f"{ders} - {konu} {alan}" for alan in ('Soru', 'Doğru', 'Yanlış')]
+        yazici.writerow(baslik)
+        for bas in range(0, ogrenci_sayisi, parca):
+            n = min(parca, ogrenci_sayisi - bas)
+            s = np.broadcast_to(soru, (n, len(soru)))
+            d = rng.binomial(s, 0.55)
+            y = rng.binomial(s - d, 0.5)
+            blok = np.stack([s, d, y], axis=2).reshape(n, -1)
+            for i, satir in enumerate(blok.tolist()):
+                yazici.writerow([f"OGR{bas + i:06d}"] + satir)
+
+
+def main():
+    ogrenci_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    parca_boyutu = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+
+    with tempfile.TemporaryDirectory() as dizin:
+        girdi = os.path.join(dizin, 'deneme.csv')
+        cikti = os.path.join(dizin, 'sonuc.csv')
+        sentetik_dosya(girdi, ogrenci_sayisi)
+        boyut_mb = os.path.getsize(girdi) / 1e6
+
+        t0 = time.perf_counter()
+        islenen = kohort_analiz(girdi, cikti, parca_boyutu)
+        sure = time.perf_counter() - t0
+
+        # tracemalloc işlemi belirgin yavaşlattığı için bellek ayrı bir turda ölçülür
+        tracemalloc.start()
+        kohort_analiz(girdi, cikti, parca_boyutu)
+        _, tepe = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"Girdi           : {ogrenci_sayisi} öğrenci, {boyut_mb:.1f} MB")
+    print(f"Süre            : {sure:.2f} s ({islenen / sure:,.0f} öğrenci/s)")
+    print(f"Tepe bellek     : {tepe / 1e6:.1f} MB (parça boyutu {parca_boyutu})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Paralel kohort program oluşturmanın işçi sayısına göre ölçeklenmesi
+
+Her işçi sayısı için öğrenci/s verimi ölçülür ve sıkıştırılmış programların
+özeti karşılaştırılarak çıktının işçi sayısından bağımsız olduğu doğrulanır.
+
+Kullanım: python benchmarks/bench_kohort_program.py [ogrenci_sayisi] [gun_sayisi] [isci ...]
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_kohort import sentetik_dosya  # noqa: E402
+from tyt.kohort import kohort_programlari, parcalari_oku  # noqa: E402
+
+
+def calistir(girdi, gun_sayisi, isci_sayisi, gunluk_saat=4, parca_boyutu=64):
+    ozet = hashlib.sha256()
+    boyut = 0
+    t0 = time.perf_counter()
+    for parca, program in kohort_programlari(parcalari_oku(girdi, parca_boyutu), gun_sayisi,
+                                             gunluk_saat, isci_sayisi):
+        for dizi in program:
+            ozet.update(dizi.tobytes())
+            boyut += dizi.nbytes
+    return time.perf_counter() - t0, ozet.hexdigest(), boyut
+
+
+def main():
+    ogrenci_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    gun_sayisi = int(sys.argv[2]) if len(sys.argv) > 2 else 365
+    isciler = [int(x) for x in sys.argv[3:]] or sorted({1, 2, os.cpu_count() or 1})
+
+    with tempfile.TemporaryDirectory() as dizin:
+        girdi = os.path.join(dizin, 'deneme.csv')
+        sentetik_dosya(girdi, ogrenci_sayisi)
+
+        print(f"{ogrenci_sayisi} öğrenci x {gun_sayisi} gün, {os.cpu_count()} çekirdek")
+        referans, temel_sure = None, None
+        for isci in isciler:
+            sure, ozet, boyut = calistir(girdi, gun_sayisi, isci)
+            referans = referans or ozet
+            temel_sure = temel_sure or sure
+            print(f"{isci:3d} işçi: {sure:7.2f} s  {ogrenci_sayisi / sure:9,.0f} öğrenci/s  "
+                  f"hızlanma {temel_sure / sure:4.1f}x  sonuç {boyut / 1e6:.1f} MB  "
+                  f"{'aynı' if ozet == referans else 'FARKLI'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""İçerik özetli bellek önbelleğinin etkisi
+
+Analiz, özetler ve grafikler için önbelleksiz, önbellek boşken (soğuk) ve
+doluyken (sıcak) çağrı süresi; ardından analiz ve program oluşturulmuş bir
+oturumda sekme değiştirmeye karşılık gelen yeniden çalıştırmanın CPU süresi
+ölçülür.
+
+Kullanım: python benchmarks/bench_onbellek.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_program import sentetik_veriler  # noqa: E402
+from tyt import grafikler  # noqa: E402
+from tyt.analiz import analiz_et  # noqa: E402
+from tyt.onbellek import bellek_onbellekleri, bellekte_tut  # noqa: E402
+from tyt.ozet import hesapla_ders_basari_orani, hesapla_performans_ozeti  # noqa: E402
+
+UYGULAMA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tyt_planner.py')
+
+
+def temizle():
+    for onbellek in bellek_onbellekleri().values():
+        onbellek.temizle()
+
+
+def sure_ms(fonksiyon, *argumanlar, tekrar=20, soguk=False):
+    en_iyi = float('inf')
+    for _ in range(tekrar):
+        if soguk:
+            temizle()
+        t0 = time.perf_counter()
+        fonksiyon(*argumanlar)
+        en_iyi = min(en_iyi, time.perf_counter() - t0)
+    return en_iyi * 1000
+
+
+def fonksiyonlar():
+    veriler = sentetik_veriler()
+    analiz = analiz_et(veriler)
+    _, ders_bazli = hesapla_performans_ozeti(veriler)
+    ders_performans = [{'Ders': d, **{k: b[k] for k in ('Net', 'Max Net', 'Kalan Net', 'Başarı Oranı')}}
+                       for d, b in ders_bazli.items()]
+    return [
+        ('analiz_et', analiz_et, bellekte_tut(kopyala=True)(analiz_et), veriler),
+        ('hesapla_performans_ozeti', hesapla_performans_ozeti,
+         bellekte_tut(kopyala=True)(hesapla_performans_ozeti), veriler),
+        ('hesapla_ders_basari_orani', hesapla_ders_basari_orani,
+         bellekte_tut(kopyala=True)(hesapla_ders_basari_orani), analiz),
+        ('oncelik_grafigi', grafikler.oncelik_grafigi.__wrapped__, grafikler.oncelik_grafigi, analiz),
+        ('risk_haritasi', grafikler.risk_haritasi.__wrapped__, grafikler.risk_haritasi, analiz),
+        ('ders_net_grafigi', grafikler.ders_net_grafigi.__wrapped__, grafikler.ders_net_grafigi, ders_performans),
+    ]
+
+
+def uygulama_yeniden_calistirma(tekrar=5):
+    """Analiz ve program hazır oturumda bir yeniden çalıştırmanın CPU süresi (soğuk, sıcak)"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(UYGULAMA, default_timeout=120).run()
+    at.session_state.veriler = sentetik_veriler()
+    # Yalnızca seçili sekme çalışır; AppTest seçimi göndermediğinden her çalıştırmada verilir
+    at.session_state['aktif_sekme'] = "📈 Analiz"
+    at.run()
+    at.session_state['aktif_sekme'] = "📈 Analiz"
+    [b for b in at.button if 'Analiz Et' in b.label][0].click().run()
+    at.session_state['aktif_sekme'] = "📅 Program"
+    at.run()
+    at.session_state['aktif_sekme'] = "📅 Program"
+    [b for b in at.button if 'Program' in b.label][0].click().run()
+
+    sonuclar = []
+    for soguk in (True, False):
+        en_iyi = float('inf')
+        for _ in range(tekrar):
+            if soguk:
+                temizle()
+            at.session_state['aktif_sekme'] = "📅 Program"
+            t0 = time.process_time()
+            at.run()
+            en_iyi = min(en_iyi, time.process_time() - t0)
+        sonuclar.append(en_iyi * 1000)
+    return sonuclar
+
+
+def main():
+    print(f"{'Fonksiyon':<28}{'Önbelleksiz (ms)':>18}{'Soğuk (ms)':>12}{'Sıcak (ms)':>12}")
+    for ad, dogrudan, onbellekli, arguman in fonksiyonlar():
+        yalin = sure_ms(dogrudan, arguman, tekrar=5)
+        soguk = sure_ms(onbellekli, arguman, tekrar=5, soguk=True)
+        sicak = sure_ms(onbellekli, arguman)
+        print(f"{ad:<28}{yalin:>18.2f}{soguk:>12.2f}{sicak:>12.2f}")
+
+    soguk, sicak = uygulama_yeniden_calistirma()
+    print(f"\nYeniden çalıştırma CPU (analiz + program hazır): soğuk {soguk:.0f} ms, sıcak {sicak:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Program oluşturucunun ufuk ve günlük saate göre süresi
+
+Kullanım: python benchmarks/bench_program.py
+"""
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tyt.analiz import analiz_et  # noqa: E402
+from tyt.konular import KONU_VERILERI  # noqa: E402
+from tyt.program import program_atamalari, program_olustur_zaman_dilimli  # noqa: E402
+
+
+def sentetik_veriler(seed=0):
+    """Tek öğrenci için rastgele veriler sözlüğü üret"""
+    rng = np.random.default_rng(seed)
+    veriler = {}
+    for ders, konular in KONU_VERILERI.items():
+        veriler[ders] = {}
+        for konu, bilgi in konular.items():
+            soru = bilgi['ortalama_soru']
+            dogru = int(rng.binomial(soru, 0.55))
+            yanlis = int(rng.binomial(soru - dogru, 0.5))
+            veriler[ders][konu] = {'dogru': dogru, 'yanlis': yanlis, 'bos': soru - dogru - yanlis, 'gercek_soru': soru}
+    return veriler
+
+
+def main():
+    analiz = analiz_et(sentetik_veriler())
+    print(f"{'Gün':>5}{'Saat':>6}{'Dilim':>8}{'Atama (ms)':>12}{'Program (ms)':>14}")
+    for gun_sayisi in (30, 180, 365):
+        for gunluk_saat in (4, 8, 12):
+            t0 = time.perf_counter()
+            atamalar = program_atamalari(analiz, gun_sayisi, gunluk_saat)
+            t1 = time.perf_counter()
+            program_olustur_zaman_dilimli(analiz, datetime.now(), gun_sayisi, gunluk_saat)
+            t2 = time.perf_counter()
+            print(f"{gun_sayisi:>5}{gunluk_saat:>6}{len(atamalar):>8}{(t1 - t0) * 1000:>12.2f}{(t2 - t1) * 1000:>14.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Monte Carlo net projeksiyonunun süresi
+
+Tek öğrenci için net_projeksiyonu (bugünkü ve planlı iki senaryo) ve bir sınıf
+için senaryo_netleri süresi ölçülür. Konu başına soru ve cevap üreten doğrudan
+simülasyonla (Poisson soru sayısı, iki binom çekilişi) ortalama ve standart
+sapma karşılaştırılır.
+
+Kullanım: python benchmarks/bench_projeksiyon.py [ogrenci_sayisi] [cekilis_sayisi]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_program import sentetik_veriler  # noqa: E402
+from bench_puanlama import sentetik_sinif  # noqa: E402
+from tyt.analiz import analiz_et  # noqa: E402
+from tyt.dagitim import saat_dagit, saat_dagit_toplu  # noqa: E402
+from tyt.katalog import ORTALAMA_SORU  # noqa: E402
+from tyt.projeksiyon import ONSEL, net_projeksiyonu, senaryo_netleri  # noqa: E402
+
+
+def dogrudan(dogru, yanlis, bos, cekilis_sayisi, tohum=1):
+    """Referans: her çekilişte konu başına soru sayısı ve cevaplar üretilir"""
+    rng = np.random.default_rng(tohum)
+    boyut = (cekilis_sayisi, len(dogru))
+    gozlenen = (dogru + yanlis + bos) > 0
+    genel = np.array([dogru.sum(), yanlis.sum(), bos.sum()]) / (dogru + yanlis + bos).sum()
+    alfa = np.stack([np.where(gozlenen, s + ONSEL * g, 1.0) for s, g in zip((dogru, yanlis, bos), genel)], axis=-1)
+    p = np.stack([rng.dirichlet(a, cekilis_sayisi) for a in alfa], axis=1)
+    soru = rng.poisson(ORTALAMA_SORU, boyut) * gozlenen
+    cevap_dogru = rng.binomial(soru, p[..., 0])
+    kosullu = np.clip(np.nan_to_num(p[..., 1] / (1 - p[..., 0])), 0, 1)
+    cevap_yanlis = rng.binomial(soru - cevap_dogru, kosullu)
+    return (cevap_dogru - cevap_yanlis / 4).sum(axis=1)
+
+
+def main():
+    ogrenci_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    cekilis_sayisi = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+    analiz = analiz_et(sentetik_veriler(0))
+    dagilim = saat_dagit(analiz, 120)
+    sureler = []
+    for tohum in range(5):
+        t0 = time.perf_counter()
+        net_projeksiyonu.__wrapped__(analiz, dagilim, cekilis_sayisi, tohum=tohum)
+        sureler.append(time.perf_counter() - t0)
+    print(f"net_projeksiyonu, {len(analiz)} konu x {cekilis_sayisi} çekiliş x 2 senaryo: "
+          f"en iyi {min(sureler) * 1000:.0f} ms")
+
+    dogru, yanlis, bos = (d.astype(float) for d in sentetik_sinif(ogrenci_sayisi))
+    saatler, _ = saat_dagit_toplu(dogru, yanlis, bos, 120)
+    t0 = time.perf_counter()
+    senaryo_netleri(dogru, yanlis, bos, [None, saatler], cekilis_sayisi, tohum=0)
+    sure = time.perf_counter() - t0
+    print(f"senaryo_netleri, {ogrenci_sayisi} öğrenci x 2 senaryo: {sure:.2f} s "
+          f"({sure / ogrenci_sayisi * 1000:.0f} ms/öğrenci)")
+
+    t0 = time.perf_counter()
+    referans = dogrudan(dogru[0], yanlis[0], bos[0], cekilis_sayisi)
+    sure_referans = time.perf_counter() - t0
+    netler = senaryo_netleri(dogru[0], yanlis[0], bos[0], [None], cekilis_sayisi, tohum=0)[0][0]
+    print(f"doğrudan simülasyon: {sure_referans * 1000:.0f} ms/öğrenci/senaryo; "
+          f"ortalama {referans.mean():.2f} / {netler.mean():.2f}, std {referans.std():.2f} / {netler.std():.2f}")
+
+
+if __name__ == '__main__':
+    main()
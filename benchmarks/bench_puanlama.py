@@ -0,0 +1,66 @@
+"""Toplu puanlama ile konu konu döngünün karşılaştırması
+
+Kullanım: python benchmarks/bench_puanlama.py [ogrenci_sayisi]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tyt.analiz as tp  # noqa: E402
+from tyt.konular import KONU_VERILERI  # noqa: E402
+
+
+def sentetik_sinif(ogrenci_sayisi, seed=0):
+    """KONU_VERILERI üzerinden rastgele öğrenci x konu matrisleri üret"""
+    rng = np.random.default_rng(seed)
+    soru = np.array([KONU_VERILERI[d][k]['ortalama_soru'] for d, k in tp.KONU_SIRASI])
+    soru = np.broadcast_to(soru, (ogrenci_sayisi, len(soru)))
+    dogru = rng.binomial(soru, 0.55)
+    yanlis = rng.binomial(soru - dogru, 0.5)
+    bos = soru - dogru - yanlis
+    return dogru, yanlis, bos
+
+
+def konu_konu_dongu(dogru, yanlis, bos):
+    """Eski yöntem: her öğrenci ve konu için hesapla_oncelik_puani çağrısı"""
+    sonuc = np.empty(dogru.shape)
+    for s in range(dogru.shape[0]):
+        for i, (ders, konu) in enumerate(tp.KONU_SIRASI):
+            bilgi = KONU_VERILERI[ders][konu]
+            sonuc[s, i] = tp.hesapla_oncelik_puani(
+                dogru[s, i], yanlis[s, i], bos[s, i], bilgi['zorluk'], bilgi['ortalama_soru']
+            )
+    return sonuc
+
+
+def olc(fonksiyon, *args, tekrar=3):
+    en_iyi = float('inf')
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        sonuc = fonksiyon(*args)
+        en_iyi = min(en_iyi, time.perf_counter() - t0)
+    return en_iyi, sonuc
+
+
+def main():
+    ogrenci_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    dogru, yanlis, bos = sentetik_sinif(ogrenci_sayisi)
+
+    sure_dongu, eski = olc(konu_konu_dongu, dogru, yanlis, bos, tekrar=1)
+    sure_toplu, yeni = olc(tp.hesapla_oncelik_puani_toplu, yanlis, bos)
+
+    assert np.array_equal(eski, yeni), "Toplu puanlama eski sonuçlarla uyuşmuyor"
+
+    hucre = dogru.size
+    print(f"{ogrenci_sayisi} öğrenci x {len(tp.KONU_SIRASI)} konu = {hucre} puan")
+    print(f"Konu konu döngü : {sure_dongu * 1000:10.2f} ms")
+    print(f"Toplu (NumPy)   : {sure_toplu * 1000:10.2f} ms")
+    print(f"Hızlanma        : {sure_dongu / sure_toplu:10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Etkin sekmeye göre yeniden çalıştırma başına sunucu CPU süresi
+
+Tam veri girilmiş, analizi ve 365 günlük programı hazır bir oturum
+streamlit.testing AppTest ile kurulur. Her sekme etkinken iki olay ölçülür:
+kenar çubuğundaki günlük saat değişikliği ve (Veri Giriş sekmesinde) anlık
+modda bir doğru sayısının değişmesi. CPU süresi süreç CPU zamanıdır
+(time.process_time); her ölçüm tekrarların medyanıdır.
+
+Kullanım: python benchmarks/bench_sekmeler.py [tekrar]
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from bench_program import sentetik_veriler  # noqa: E402
+
+UYGULAMA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tyt_planner.py')
+SEKMELER = ["📊 Veri Giriş", "📈 Analiz", "📅 Program", "📚 Kaynaklar", "📝 Öğrenci Özeti", "📉 Gelişim"]
+ANLIK_MOD = "⌨️ Anlık (konu konu)"
+
+
+def calistir(at, sekme):
+    # AppTest sekme seçimini widget durumu olarak göndermez; her çalıştırmada yeniden verilir.
+    # Sekmeler tembel değilse anahtar kullanılmaz, tüm sekmeler her zaman çalışır.
+    at.session_state['aktif_sekme'] = sekme
+    t0 = time.process_time()
+    at.run()
+    sure = time.process_time() - t0
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return sure
+
+
+def oturum_kur(gun_sayisi=365):
+    at = AppTest.from_file(UYGULAMA, default_timeout=300).run()
+    at.session_state.veriler = sentetik_veriler()
+    [n for n in at.number_input if n.label.startswith("Kaç Gün")][0].set_value(gun_sayisi)
+    calistir(at, SEKMELER[1])
+    [b for b in at.button if 'Analiz Et' in b.label][0].click()
+    calistir(at, SEKMELER[1])
+    calistir(at, SEKMELER[2])
+    [b for b in at.button if 'Program' in b.label][0].click()
+    calistir(at, SEKMELER[2])
+    return at
+
+
+def saat_degisikligi(at, sekme, tekrar):
+    sureler = []
+    for i in range(tekrar):
+        at.slider[0].set_value(4 + i % 2)
+        sureler.append(calistir(at, sekme))
+    return statistics.median(sureler) * 1000
+
+
+def sayi_girisi(at, tekrar):
+    [r for r in at.radio if r.label == "Giriş Modu"][0].set_value(ANLIK_MOD)
+    calistir(at, SEKMELER[0])
+    anahtar = [n.key for n in at.number_input if n.key and n.key.endswith('_dogru')][0]
+    sureler = []
+    for i in range(tekrar):
+        at.number_input(key=anahtar).set_value(i % 2)
+        sureler.append(calistir(at, SEKMELER[0]))
+    return statistics.median(sureler) * 1000
+
+
+def main():
+    tekrar = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    at = oturum_kur()
+    print(f"{'Etkin sekme':<22}{'Saat değişikliği (ms)':>24}")
+    for sekme in SEKMELER:
+        saat_degisikligi(at, sekme, 1)  # sekme geçişi ve ısınma
+        print(f"{sekme:<22}{saat_degisikligi(at, sekme, tekrar):>24.1f}")
+    calistir(at, SEKMELER[0])
+    print(f"\nVeri Giriş, anlık modda doğru sayısı değişikliği: {sayi_girisi(at, tekrar):.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
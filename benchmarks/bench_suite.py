@@ -0,0 +1,235 @@
+"""Planlayıcının sıcak yollarının kohort ölçeğinde ölçüm takımı
+
+Her durum 1, 1.000 ve 100.000 öğrencilik sentetik kohortlarda, programa bağlı
+olanlar ayrıca 30 ve 365 günlük ufuklarda ölçülür. Öğrenci verileri
+KONU_VERILERI üzerinden öğrenci sırasıyla tohumlanarak üretilir; girdiler ölçüm
+dışında hazırlanır. Öğrenci başına çağrılan fonksiyonlar durum başına zaman
+bütçesi dolana kadar ölçülür; tüm kohort ölçülemezse kohort süresi öğrenci
+başına ortalamadan tahmin edilir ('tahmini': true). Toplu (vektörel) yollar
+tüm kohort için tek çağrıyla ölçülür. Ağ ya da Groq API kullanılmaz.
+
+Sonuçlar ortam bilgileriyle birlikte JSON dosyasına yazılır. --karsilastir
+önceki bir sonuç dosyasıyla öğrenci başına medyan süreleri karşılaştırır ve --esik
+oranından fazla yavaşlayan durum varsa 1 çıkış koduyla biter.
+
+Kullanım: python benchmarks/bench_suite.py [--cikti sonuc.json] [--karsilastir eski.json]
+          [--ogrenciler 1 1000 100000] [--gunler 30 365] [--butce 2] [--durumlar analiz_et ...]
+"""
+import argparse
+import functools
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+KOK_DIZIN = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK_DIZIN)
+
+from bench_program import sentetik_veriler  # noqa: E402
+from bench_puanlama import sentetik_sinif  # noqa: E402
+from tyt.analiz import analiz_et, hesapla_oncelik_puani, hesapla_oncelik_puani_toplu  # noqa: E402
+from tyt.katalog import KONU_ORTALAMA_SORULARI, KONU_SIRASI, KONU_ZORLUKLARI  # noqa: E402
+from tyt.ozet import hesapla_ders_basari_orani, hesapla_performans_ozeti  # noqa: E402
+from tyt.program import program_olustur_zaman_dilimli  # noqa: E402
+
+BASLANGIC = datetime(2025, 1, 6)
+GUNLUK_SAAT = 4
+# Küçük kohortlarda öğrenciler bu sayıda ölçüm olana kadar tekrar ölçülür
+EN_AZ_OLCUM = 20
+
+
+@functools.lru_cache(maxsize=4096)
+def _veriler(i):
+    return sentetik_veriler(i)
+
+
+@functools.lru_cache(maxsize=4096)
+def _analiz(i):
+    return analiz_et(_veriler(i))
+
+
+def _program(i, gun):
+    return program_olustur_zaman_dilimli(_analiz(i), BASLANGIC, gun, GUNLUK_SAAT)
+
+
+def _program_olustur(girdi):
+    analiz, gun = girdi
+    return program_olustur_zaman_dilimli(analiz, BASLANGIC, gun, GUNLUK_SAAT)
+
+
+def _oncelik_puanlari(veriler):
+    """Uygulamadaki gibi konu konu hesapla_oncelik_puani çağrıları"""
+    for k, (ders, konu) in enumerate(KONU_SIRASI):
+        s = veriler[ders][konu]
+        hesapla_oncelik_puani(s['dogru'], s['yanlis'], s['bos'], KONU_ZORLUKLARI[k], KONU_ORTALAMA_SORULARI[k])
+
+
+def _excel(program):
+    import pandas as pd
+
+    from tyt.disa_aktarim import excel_export_professional
+
+    return excel_export_professional(pd.DataFrame(program))
+
+
+def _takvim(program):
+    """Program sekmesinin takvim hazırlığı: haftalara gruplama ve ilk sayfanın HTML'i"""
+    from tyt.takvim import hafta_html, sayfa_haftalari, takvim_haftalari
+
+    return [hafta_html(hafta) for hafta in sayfa_haftalari(takvim_haftalari(program), 1)]
+
+
+# Öğrenci başına durumlar: ad -> (hazırla(i, gun) -> girdi, ölçülen(girdi), ufka bağlı mı)
+OGRENCI_DURUMLARI = {
+    'analiz_et': (lambda i, gun: _veriler(i), analiz_et, False),
+    'hesapla_oncelik_puani': (lambda i, gun: _veriler(i), _oncelik_puanlari, False),
+    'hesapla_performans_ozeti': (lambda i, gun: _veriler(i), hesapla_performans_ozeti, False),
+    'hesapla_ders_basari_orani': (lambda i, gun: _analiz(i), hesapla_ders_basari_orani, False),
+    'program_olustur_zaman_dilimli': (lambda i, gun: (_analiz(i), gun), _program_olustur, True),
+    'excel_export_professional': (_program, _excel, True),
+    'takvim_hazirligi': (_program, _takvim, True),
+}
+# Toplu durumlar: ad -> (hazırla(ogrenci_sayisi) -> argümanlar, ölçülen(*argümanlar))
+TOPLU_DURUMLAR = {
+    'hesapla_oncelik_puani_toplu': (lambda n: sentetik_sinif(n)[1:], hesapla_oncelik_puani_toplu),
+}
+
+
+def ogrenci_durumu_olc(ad, ogrenci_sayisi, gun, butce):
+    hazirla, fonksiyon, _ = OGRENCI_DURUMLARI[ad]
+    fonksiyon(hazirla(0, gun))  # ısınma (tembel içe aktarmalar, önbellekler)
+    sureler = []
+    harcanan = 0.0
+    gc.collect()
+    gc.disable()
+    try:
+        for i in range(max(ogrenci_sayisi, EN_AZ_OLCUM)):
+            girdi = hazirla(i % ogrenci_sayisi, gun)
+            t0 = time.perf_counter()
+            fonksiyon(girdi)
+            sure = time.perf_counter() - t0
+            sureler.append(sure)
+            harcanan += sure
+            if harcanan >= butce and len(sureler) >= EN_AZ_OLCUM:
+                break
+    finally:
+        gc.enable()
+
+    sureler = np.array(sureler)
+    return {
+        'olculen': min(len(sureler), ogrenci_sayisi),
+        'toplam_s': sureler.mean() * ogrenci_sayisi,
+        'ogrenci_basi_ms': sureler.mean() * 1000,
+        'p50_ms': np.percentile(sureler, 50) * 1000,
+        'p95_ms': np.percentile(sureler, 95) * 1000,
+        'tahmini': len(sureler) < ogrenci_sayisi,
+    }
+
+
+def toplu_durumu_olc(ad, ogrenci_sayisi, tekrar=3):
+    hazirla, fonksiyon = TOPLU_DURUMLAR[ad]
+    argumanlar = hazirla(ogrenci_sayisi)
+    en_iyi = float('inf')
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        fonksiyon(*argumanlar)
+        en_iyi = min(en_iyi, time.perf_counter() - t0)
+    return {
+        'olculen': ogrenci_sayisi,
+        'toplam_s': en_iyi,
+        'ogrenci_basi_ms': en_iyi / ogrenci_sayisi * 1000,
+        'p50_ms': en_iyi / ogrenci_sayisi * 1000,
+        'tahmini': False,
+    }
+
+
+def ortam_bilgisi():
+    import pandas as pd
+
+    try:
+        surum = subprocess.run(['git', 'describe', '--always', '--dirty'], capture_output=True, text=True,
+                               cwd=KOK_DIZIN, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        surum = None
+    return {
+        'surum': surum,
+        'zaman': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'islemci_sayisi': os.cpu_count(),
+    }
+
+
+def _anahtar(kayit):
+    return kayit['durum'], kayit['ogrenci'], kayit['gun']
+
+
+def karsilastir(eski, yeni, esik):
+    """Öğrenci başına medyan süre oranlarını yazdır; eşiği aşan yavaşlama sayısını döndür"""
+    eskiler = {_anahtar(k): k for k in eski['sonuclar']}
+    print(f"\n{eski['ortam']['surum']} -> {yeni['ortam']['surum']}")
+    print(f"{'Durum':<32}{'Öğrenci':>9}{'Gün':>6}{'Eski p50 (ms)':>15}{'Yeni p50 (ms)':>15}{'Oran':>8}")
+    yavaslayan = 0
+    for kayit in yeni['sonuclar']:
+        onceki = eskiler.get(_anahtar(kayit))
+        if onceki is None:
+            continue
+        oran = kayit['p50_ms'] / onceki['p50_ms']
+        isaret = ''
+        if oran > 1 + esik:
+            isaret = '  YAVAŞLAMA'
+            yavaslayan += 1
+        print(f"{kayit['durum']:<32}{kayit['ogrenci']:>9}{kayit['gun'] or '-':>6}"
+              f"{onceki['p50_ms']:>15.3f}{kayit['p50_ms']:>15.3f}{oran:>8.2f}{isaret}")
+    return yavaslayan
+
+
+def main():
+    durum_adlari = [*OGRENCI_DURUMLARI, *TOPLU_DURUMLAR]
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cikti', default='bench_suite.json', help='Sonuçların yazılacağı JSON dosyası')
+    parser.add_argument('--karsilastir', metavar='JSON', help='Karşılaştırılacak önceki sonuç dosyası')
+    parser.add_argument('--esik', type=float, default=0.10, help='Yavaşlama sayılacak oran artışı')
+    parser.add_argument('--ogrenciler', type=int, nargs='+', default=[1, 1000, 100000])
+    parser.add_argument('--gunler', type=int, nargs='+', default=[30, 365])
+    parser.add_argument('--butce', type=float, default=2.0, help='Öğrenci başına durumlarda ölçüm bütçesi (s)')
+    parser.add_argument('--durumlar', nargs='+', choices=durum_adlari, default=durum_adlari)
+    args = parser.parse_args()
+
+    sonuclar = []
+    print(f"{'Durum':<32}{'Öğrenci':>9}{'Gün':>6}{'Ölçülen':>9}{'Öğr. başı (ms)':>16}{'Kohort (s)':>12}")
+    for ad in args.durumlar:
+        for ogrenci_sayisi in args.ogrenciler:
+            if ad in TOPLU_DURUMLAR:
+                olcumler = [(None, toplu_durumu_olc(ad, ogrenci_sayisi))]
+            else:
+                gunler = args.gunler if OGRENCI_DURUMLARI[ad][2] else [None]
+                olcumler = [(gun, ogrenci_durumu_olc(ad, ogrenci_sayisi, gun, args.butce)) for gun in gunler]
+            for gun, olcum in olcumler:
+                kayit = {'durum': ad, 'ogrenci': ogrenci_sayisi, 'gun': gun, **olcum}
+                sonuclar.append(kayit)
+                print(f"{ad:<32}{ogrenci_sayisi:>9}{gun or '-':>6}{kayit['olculen']:>9}"
+                      f"{kayit['ogrenci_basi_ms']:>16.3f}{kayit['toplam_s']:>11.2f}{'*' if kayit['tahmini'] else ' '}")
+
+    sonuc = {'ortam': ortam_bilgisi(), 'butce_s': args.butce, 'sonuclar': sonuclar}
+    with open(args.cikti, 'w', encoding='utf-8') as f:
+        json.dump(sonuc, f, ensure_ascii=False, indent=1)
+    print(f"\n* tahmini (öğrenci başına ortalamadan). Sonuçlar: {args.cikti}")
+
+    if args.karsilastir:
+        with open(args.karsilastir, encoding='utf-8') as f:
+            eski = json.load(f)
+        if karsilastir(eski, sonuc, args.esik):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""Program sekmesi takviminin sunucu süresi ve tarayıcıya giden yük
+
+Eski görünüm (hafta ve gün başına maske süzgeci, satır başına st.markdown) ile
+tek geçişte gruplanan, hafta başına tek HTML bloğu gönderen sayfalı görünüm
+karşılaştırılır. st.markdown çağrıları sayılıp metinleri toplanarak ölçülür;
+yük, gönderilen markdown metinlerinin UTF-8 boyutudur.
+
+Kullanım: python benchmarks/bench_takvim.py [gunluk_saat]
+"""
+import os
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_program import sentetik_veriler  # noqa: E402
+from tyt.analiz import analiz_et  # noqa: E402
+from tyt.program import program_olustur_zaman_dilimli  # noqa: E402
+from tyt.takvim import hafta_html, sayfa_haftalari, takvim_haftalari  # noqa: E402
+
+
+def eski_takvim(program_df, gonder):
+    """Önceki tab3 takvim döngüsü; st.markdown yerine gonder çağrılır"""
+    takvim_df = program_df.copy()
+    takvim_df['Tarih'] = pd.to_datetime(takvim_df['Tarih'], format='%d.%m.%Y')
+    takvim_df['Hafta'] = takvim_df['Tarih'].dt.isocalendar().week
+    takvim_df['Gün Adı'] = takvim_df['Tarih'].dt.day_name()
+
+    for hafta in sorted(takvim_df['Hafta'].unique()):
+        gonder(f"### 🗓️ Hafta {hafta}")
+        hafta_df = takvim_df[takvim_df['Hafta'] == hafta]
+        for tarih in sorted(hafta_df['Tarih'].unique()):
+            tarih_df = hafta_df[hafta_df['Tarih'] == tarih]
+            gonder(f"#### 📅 {tarih.strftime('%d.%m.%Y')} ({tarih_df.iloc[0]['Gün Adı']})")
+            for _, row in tarih_df.iterrows():
+                renk = "#FF6B6B" if row['Zorluk'] == "Zor" else "#4ECDC4" if row['Zorluk'] == "Orta" else "#FFD166"
+                gonder(
+                    f"""
+                                    <div style="
+                                        background-color: {renk};
+                                        border-radius: 10px;
+                                        padding: 15px;
+                                        margin-bottom: 15px;
+                                        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+                                    ">
+                                        <div style="display: flex; justify-content: space-between;">
+                                            <div><b>{row['Zaman']}</b></div>
+                                            <div>Öncelik: {row['Öncelik Puanı']:.1f}</div>
+                                        </div>
+                                        <h3 style="margin: 10px 0;">{row['Ders']}</h3>
+                                        <p style="margin: 0;"><b>{row['Konu']}</b></p>
+                                        <p style="margin: 0; font-size: 0.9em;">Zorluk: {row['Zorluk']}</p>
+                                    </div>
+                                    """
+                )
+
+
+def yeni_takvim(haftalar, gonder, sayfa=1):
+    """Sayfalı görünüm: yalnızca seçili sayfanın haftaları gönderilir"""
+    for hafta in sayfa_haftalari(haftalar, sayfa):
+        gonder(hafta_html(hafta))
+
+
+def olc(fonksiyon, *argumanlar, tekrar=5):
+    """En iyi süre (ms), öğe sayısı ve yük (KB)"""
+    en_iyi = float('inf')
+    for _ in range(tekrar):
+        gonderilen = []
+        t0 = time.perf_counter()
+        fonksiyon(*argumanlar, gonderilen.append)
+        en_iyi = min(en_iyi, time.perf_counter() - t0)
+    return en_iyi * 1000, len(gonderilen), sum(len(m.encode('utf-8')) for m in gonderilen) / 1024
+
+
+def main():
+    gunluk_saat = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    analiz = analiz_et(sentetik_veriler())
+
+    print(f"{'Gün':>5}{'Görünüm':>22}{'Süre (ms)':>12}{'Öğe':>7}{'Yük (KB)':>11}")
+    for gun_sayisi in (30, 180, 365):
+        program = program_olustur_zaman_dilimli(analiz, datetime(2025, 1, 1), gun_sayisi, gunluk_saat)
+        program_df = pd.DataFrame(program)
+
+        sure, oge, yuk = olc(eski_takvim, program_df, tekrar=1 if gun_sayisi > 30 else 3)
+        print(f"{gun_sayisi:>5}{'eski (tümü)':>22}{sure:>12.1f}{oge:>7}{yuk:>11.1f}")
+
+        t0 = time.perf_counter()
+        haftalar = takvim_haftalari(program)
+        gruplama = (time.perf_counter() - t0) * 1000
+        print(f"{gun_sayisi:>5}{'yeni gruplama (1 kez)':>22}{gruplama:>12.1f}")
+
+        sure, oge, yuk = olc(yeni_takvim, haftalar)
+        print(f"{gun_sayisi:>5}{'yeni (sayfa başına)':>22}{sure:>12.1f}{oge:>7}{yuk:>11.1f}")
+
+        sure, oge, yuk = olc(lambda h, g: [g(hafta_html(x)) for x in h], haftalar)
+        print(f"{gun_sayisi:>5}{'yeni (tüm haftalar)':>22}{sure:>12.1f}{oge:>7}{yuk:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
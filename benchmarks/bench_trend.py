@@ -0,0 +1,85 @@
+"""Kohort geçmişinde trend analizinin süresi
+
+ogrenci_sayisi x deneme_sayisi x 60 konu satırlık sentetik bir geçmiş için
+konu_trendleri, ders_trendleri ve ders_net_serisi süreleri ölçülür. Karşılaştırma
+için aynı özetler küçük bir alt kümede grup başına Python işleviyle
+(groupby.apply) hesaplanıp tüm kohorta orantılanır.
+
+Kullanım: python benchmarks/bench_trend.py [ogrenci_sayisi] [deneme_sayisi]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tyt.analiz import KONU_SIRASI  # noqa: E402
+from tyt.trend import ders_net_serisi, ders_trendleri, konu_trendleri  # noqa: E402
+
+
+def sentetik_gecmis(ogrenci_sayisi, deneme_sayisi, seed=0):
+    """Öğrenci, tarih ve konu sırasında uzun biçimli geçmiş tablosu"""
+    rng = np.random.default_rng(seed)
+    konu_sayisi = len(KONU_SIRASI)
+    satir = ogrenci_sayisi * deneme_sayisi * konu_sayisi
+    deneme = np.repeat(np.arange(ogrenci_sayisi * deneme_sayisi, dtype=np.int32), konu_sayisi)
+    soru = rng.integers(1, 7, satir, dtype=np.int8)
+    dogru = rng.binomial(soru, 0.55).astype(np.int8)
+    return pd.DataFrame({
+        'ogrenci': deneme // deneme_sayisi,
+        'deneme': deneme,
+        'tarih': (np.datetime64('2025-09-01') + (deneme % deneme_sayisi) * 7).astype('datetime64[ns]'),
+        'konu_indeksi': np.tile(np.arange(konu_sayisi, dtype=np.int16), ogrenci_sayisi * deneme_sayisi),
+        'dogru': dogru,
+        'yanlis': rng.binomial(soru - dogru, 0.5).astype(np.int8),
+    })
+
+
+def grup_basina(gecmis, pencere):
+    """Her (öğrenci, konu) serisi için Python işleviyle aynı özet"""
+    def ozet(seri):
+        net = (seri['dogru'] - seri['yanlis'] / 4).to_numpy()
+        son = net[-pencere:]
+        return pd.Series({
+            'son_net': net[-1],
+            'kayan_net': son.mean(),
+            'egim': np.polyfit(np.arange(len(son)), son, 1)[0] if len(son) > 1 else np.nan,
+            'oynaklik': son.std(ddof=1) if len(son) > 1 else np.nan,
+        })
+
+    return gecmis.groupby(['ogrenci', 'konu_indeksi']).apply(ozet, include_groups=False)
+
+
+def sure(fonksiyon, *argumanlar):
+    t0 = time.perf_counter()
+    sonuc = fonksiyon(*argumanlar)
+    return time.perf_counter() - t0, sonuc
+
+
+def main():
+    ogrenci_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    deneme_sayisi = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    pencere = 5
+
+    gecmis = sentetik_gecmis(ogrenci_sayisi, deneme_sayisi)
+    print(f"{ogrenci_sayisi} öğrenci x {deneme_sayisi} deneme: {len(gecmis):,} konu sonucu satırı")
+
+    sure_konu, konu = sure(konu_trendleri, gecmis, pencere)
+    sure_ders, _ = sure(ders_trendleri, gecmis, pencere)
+    sure_seri, _ = sure(ders_net_serisi, gecmis, pencere)
+    print(f"konu_trendleri  : {sure_konu:6.2f} s ({len(konu):,} seri)")
+    print(f"ders_trendleri  : {sure_ders:6.2f} s")
+    print(f"ders_net_serisi : {sure_seri:6.2f} s")
+
+    alt_kume = max(1, ogrenci_sayisi // 100)
+    sure_alt, referans = sure(grup_basina, gecmis[gecmis['ogrenci'] < alt_kume], pencere)
+    ayni = np.allclose(referans['egim'].to_numpy(), konu['egim'].to_numpy()[:len(referans)], equal_nan=True)
+    print(f"groupby.apply   : {sure_alt * ogrenci_sayisi / alt_kume:6.1f} s "
+          f"(tahmini; {alt_kume} öğrencide {sure_alt:.2f} s, sonuçlar aynı: {ayni})")
+
+
+if __name__ == '__main__':
+    main()
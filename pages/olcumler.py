@@ -0,0 +1,108 @@
+"""Yönetici sayfası: sekme ve çekirdek fonksiyon ölçümleri
+
+Ölçümler süreç geneli olduğundan tüm oturumların toplamını gösterir. Sayfa
+yalnızca TYT_OLCUM_YONETICI parolası (ortam değişkeni veya secrets.toml)
+tanımlıysa ve oturumda girildiyse açılır.
+"""
+import hmac
+import os
+
+import pandas as pd
+import streamlit as st
+
+from tyt.olcum import ACIK, KAYIT, PENCERE
+
+st.set_page_config(page_title="Ölçümler - TYT Hazırlık", layout="wide")
+st.title("📏 Ölçümler")
+
+
+def yonetici_parolasi():
+    parola = os.environ.get("TYT_OLCUM_YONETICI")
+    if parola:
+        return parola
+    try:
+        return st.secrets.get("TYT_OLCUM_YONETICI")
+    except Exception:
+        return None
+
+
+parola = yonetici_parolasi()
+if not parola:
+    st.info("Ölçüm sayfası kapalı. Açmak için TYT_OLCUM_YONETICI ortam değişkenini veya "
+            "secrets.toml anahtarını tanımlayın.")
+    st.stop()
+
+if not st.session_state.get("olcum_yonetici"):
+    girilen = st.text_input("Yönetici parolası", type="password")
+    if not girilen:
+        st.stop()
+    if not hmac.compare_digest(girilen.encode(), parola.encode()):
+        st.error("Parola hatalı.")
+        st.stop()
+    st.session_state.olcum_yonetici = True
+    st.rerun()
+
+if not ACIK:
+    st.info("Ölçüm kapalı. Açmak için uygulamayı TYT_OLCUM=1 ortam değişkeniyle başlatın; "
+            "TYT_OLCUM_PORT verilirse metrikler ayrıca 127.0.0.1 (veya TYT_OLCUM_ADRES) üzerinde "
+            "/metrics ve /metrics.jsonl yollarından sunulur.")
+    st.stop()
+
+gostergeler = KAYIT.gostergeler()
+if gostergeler:
+    st.subheader("Anlık Göstergeler")
+    st.dataframe(
+        pd.DataFrame(list(gostergeler.items()), columns=['Gösterge', 'Değer']).round(3),
+        use_container_width=True,
+        hide_index=True
+    )
+
+ozet = pd.DataFrame(KAYIT.ozet())
+if ozet.empty:
+    st.info("Henüz ölçüm yok. Ana sayfayı kullandıkça sekme ve fonksiyon süreleri burada birikir.")
+    st.stop()
+
+baslangic = pd.Timestamp(KAYIT.baslangic, unit='s').strftime('%d.%m.%Y %H:%M')
+st.caption(f"{baslangic} tarihinden beri. Yüzdelikler her adın son {PENCERE} ölçümünden hesaplanır; "
+           "bellek değişimi süreç geneli RSS farkıdır.")
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    st.metric("Ölçülen Ad", len(ozet))
+with col2:
+    st.metric("Toplam Çağrı", int(ozet['sayi'].sum()))
+with col3:
+    st.metric("Hatalı Çağrı", int(ozet['hata'].sum()))
+
+st.dataframe(
+    ozet.rename(columns={
+        'ad': 'Ad', 'sayi': 'Sayı', 'hata': 'Hata', 'toplam_s': 'Toplam (s)', 'ortalama_ms': 'Ortalama (ms)',
+        'p50_ms': 'p50 (ms)', 'p90_ms': 'p90 (ms)', 'p99_ms': 'p99 (ms)', 'en_fazla_ms': 'En Fazla (ms)',
+        'bellek_ortalama_kb': 'Ort. Bellek (KB)', 'bellek_en_fazla_kb': 'En Fazla Bellek (KB)',
+    }).round(2),
+    use_container_width=True,
+    hide_index=True
+)
+
+st.subheader("Yüzdelik Süreler")
+st.bar_chart(ozet.set_index('ad')[['p50_ms', 'p99_ms']], horizontal=True)
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    st.download_button(
+        "📥 Prometheus Metni",
+        data=KAYIT.prometheus_metni(),
+        file_name="tyt_metrics.txt",
+        mime="text/plain"
+    )
+with col2:
+    st.download_button(
+        "📥 JSON Satırları",
+        data=KAYIT.json_satirlari(),
+        file_name="tyt_metrics.jsonl",
+        mime="application/jsonl"
+    )
+with col3:
+    if st.button("🗑️ Ölçümleri Sıfırla"):
+        KAYIT.sifirla()
+        st.rerun()
@@ -0,0 +1,75 @@
+"""TYT hazırlık planlayıcısının arayüzden bağımsız çekirdeği
+
+Alt modüller ilk erişimde yüklenir; örneğin yalnızca analiz_et kullanan bir
+toplu iş openpyxl, groq veya pandas yüklemez.
+"""
+import importlib
+
+_DISA_ACIKLAR = {
+    'KONU_VERILERI': 'konular',
+    'ZAMAN_DILIMLERI': 'konular',
+    'ZORLUK_KATSAYILARI': 'konular',
+    'KITAP_ONERILERI': 'kaynaklar',
+    'YOUTUBE_KANALLARI': 'kaynaklar',
+    'youtube_video_ara': 'kaynaklar',
+    'DERSLER': 'katalog',
+    'KONU_SIRASI': 'katalog',
+    'KONU_INDEKSI': 'katalog',
+    'KONU_ADLARI': 'katalog',
+    'KONU_AD_INDEKSI': 'katalog',
+    'hesapla_oncelik_puani': 'analiz',
+    'hesapla_oncelik_puani_toplu': 'analiz',
+    'veriler_matrise': 'analiz',
+    'analiz_et': 'analiz',
+    'hesapla_performans_ozeti': 'ozet',
+    'hesapla_ders_basari_orani': 'ozet',
+    'ders_toplamlari': 'ozet',
+    'ArtimliAnaliz': 'artimli',
+    'program_olustur_zaman_dilimli': 'program',
+    'saat_dagit': 'dagitim',
+    'saat_dagit_toplu': 'dagitim',
+    'net_simulasyonu': 'projeksiyon',
+    'net_projeksiyonu': 'projeksiyon',
+    'excel_export_professional': 'disa_aktarim',
+    'sinif_excel_akis': 'disa_aktarim',
+    'toplu_excel_zip': 'disa_aktarim',
+    'groq_istemcisi_olustur': 'ai_kocu',
+    'get_ai_suggestion': 'ai_kocu',
+    'ai_mesajlari_olustur': 'ai_kocu',
+    'ai_parmak_izi': 'ai_kocu',
+    'IstekKapisi': 'ai_kapisi',
+    'DiskOnbellek': 'onbellek',
+    'olc': 'olcum',
+    'olculen': 'olcum',
+    'DenemeDeposu': 'depo',
+    'karneleri_oku': 'karne',
+    'karne_csv_yaz': 'karne',
+    'konu_trendleri': 'trend',
+    'ders_trendleri': 'trend',
+    'ders_net_serisi': 'trend',
+    'ai_onerileri_toplu': 'ai_toplu',
+    'async_groq_istemcisi_olustur': 'ai_toplu',
+    'kohort_ai_raporu': 'ai_toplu',
+    'parcalari_oku': 'kohort',
+    'parca_verilere': 'kohort',
+    'kohort_analiz': 'kohort',
+    'kohort_programlari': 'kohort',
+    'program_satirlari': 'kohort',
+    'kohort_ogrenci_programlari': 'kohort',
+    'kohort_program_yaz': 'kohort',
+}
+
+__all__ = list(_DISA_ACIKLAR)
+
+
+def __getattr__(ad):
+    modul_adi = _DISA_ACIKLAR.get(ad)
+    if modul_adi is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {ad!r}")
+    deger = getattr(importlib.import_module(f'.{modul_adi}', __name__), ad)
+    globals()[ad] = deger
+    return deger
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
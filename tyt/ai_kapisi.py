@@ -0,0 +1,191 @@
+"""Groq çağrıları için süreç geneli hız sınırı ve istek birleştirme
+
+IstekKapisi tüm oturumlarca paylaşılır. Üst çağrılar bir token kovasından
+hak alır: saniyede hiz kadar hak birikir, en fazla kapasite kadar
+saklanır. Hak bekleyen istekler oturum başına kuyruklarda tutulur ve haklar
+oturumlar arasında sırayla dağıtılır; çok istek gönderen bir oturum diğer
+oturumları bekletmez.
+
+Aynı parmak izli eşzamanlı istekler tek üst çağrıyı paylaşır. İlk istek,
+çağrıyı arka planda bir iş parçacığında başlatır. Sonra gelenler kuyruğa
+girmez; aynı parçaları üretildikçe alır. İsteyenlerden biri okumayı
+bıraksa da çağrı tamamlanır.
+
+Kuyruk derinliği, bekleme süreleri ve birleştirme sayıları istatistikler()
+ile alınır. Ölçüm açıksa bekleme süreleri olcum kaydına
+'ai_kapisi.bekleme' adıyla yazılır.
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+
+from .olcum import ACIK as OLCUM_ACIK, KAYIT
+
+# Dakikada 30 istek, en fazla 5 isteklik ani yük
+VARSAYILAN_HIZ = 0.5
+VARSAYILAN_KAPASITE = 5
+VARSAYILAN_ZAMAN_ASIMI = 120.0
+
+
+class _Bekleyen:
+    __slots__ = ('izinli',)
+
+    def __init__(self):
+        self.izinli = False
+
+
+class _Ucus:
+    """Süren bir üst çağrının şimdiye kadarki parçaları"""
+    __slots__ = ('parcalar', 'bitti', 'hata', 'kosul')
+
+    def __init__(self, kilit):
+        self.parcalar = []
+        self.bitti = False
+        self.hata = None
+        self.kosul = threading.Condition(kilit)
+
+
+class IstekKapisi:
+    """Oturumlar arası adil token kovası ve aynı isteklerin birleştirilmesi (iş parçacığı güvenli)"""
+
+    def __init__(self, hiz=VARSAYILAN_HIZ, kapasite=VARSAYILAN_KAPASITE, zaman_asimi=VARSAYILAN_ZAMAN_ASIMI):
+        self.hiz = hiz
+        self.kapasite = kapasite
+        self.zaman_asimi = zaman_asimi
+        self._kilit = threading.Lock()
+        self._kosul = threading.Condition(self._kilit)
+        self._haklar = float(kapasite)
+        self._son_dolum = time.monotonic()
+        # oturum -> bekleyenler; sıra, hakların dağıtılacağı oturum sırasıdır
+        self._kuyruklar = OrderedDict()
+        self._ucustakiler = {}
+        self._derinlik = 0
+        self.en_fazla_derinlik = 0
+        self.istek = 0
+        self.birlesen = 0
+        self.zaman_asimi_sayisi = 0
+        self.hak_verilen = 0
+        self.toplam_bekleme = 0.0
+        self.en_fazla_bekleme = 0.0
+
+    def _doldur(self, simdi):
+        self._haklar = min(self.kapasite, self._haklar + (simdi - self._son_dolum) * self.hiz)
+        self._son_dolum = simdi
+
+    def _dagit(self):
+        """Hak kaldıkça sıradaki oturumun en eski bekleyenine hak ver"""
+        verildi = False
+        while self._haklar >= 1 and self._kuyruklar:
+            oturum, kuyruk = next(iter(self._kuyruklar.items()))
+            kuyruk.popleft().izinli = True
+            if kuyruk:
+                self._kuyruklar.move_to_end(oturum)
+            else:
+                del self._kuyruklar[oturum]
+            self._haklar -= 1
+            self._derinlik -= 1
+            verildi = True
+        if verildi:
+            self._kosul.notify_all()
+
+    def hak_al(self, oturum=None, zaman_asimi=None):
+        """Sıra gelip hak alınana kadar bekle; bekleme süresini (s) döndür
+
+        zaman_asimi (varsayılan: kapının zaman aşımı) içinde hak alınamazsa
+        TimeoutError yükseltir.
+        """
+        zaman_asimi = self.zaman_asimi if zaman_asimi is None else zaman_asimi
+        baslangic = time.monotonic()
+        bekleyen = _Bekleyen()
+        with self._kosul:
+            self._kuyruklar.setdefault(oturum, deque()).append(bekleyen)
+            self._derinlik += 1
+            self.en_fazla_derinlik = max(self.en_fazla_derinlik, self._derinlik)
+            while True:
+                simdi = time.monotonic()
+                self._doldur(simdi)
+                self._dagit()
+                if bekleyen.izinli:
+                    break
+                kalan = baslangic + zaman_asimi - simdi
+                if kalan <= 0:
+                    kuyruk = self._kuyruklar[oturum]
+                    kuyruk.remove(bekleyen)
+                    if not kuyruk:
+                        del self._kuyruklar[oturum]
+                    self._derinlik -= 1
+                    self.zaman_asimi_sayisi += 1
+                    raise TimeoutError(f"AI istek kuyruğunda {zaman_asimi:g} saniye içinde sıra gelmedi")
+                # Bir sonraki hak birikene ya da başka bir bekleyen dağıtım yapana kadar uyu
+                self._kosul.wait(min(kalan, max((1 - self._haklar) / self.hiz, 0.001)))
+            bekleme = time.monotonic() - baslangic
+            self.hak_verilen += 1
+            self.toplam_bekleme += bekleme
+            self.en_fazla_bekleme = max(self.en_fazla_bekleme, bekleme)
+        if OLCUM_ACIK:
+            KAYIT.kaydet('ai_kapisi.bekleme', bekleme)
+        return bekleme
+
+    def akis(self, anahtar, istek, oturum=None):
+        """istek() yinelenebilirinin parçalarını hız sınırı altında üret
+
+        Aynı anahtarla süren bir çağrı varsa ona katılınır; yoksa hak alınıp
+        istek() arka planda çağrılır. Çağrının hatası her isteyende yeniden
+        yükseltilir.
+        """
+        with self._kilit:
+            self.istek += 1
+            ucus = self._ucustakiler.get(anahtar)
+            if ucus is None:
+                ucus = self._ucustakiler[anahtar] = _Ucus(self._kilit)
+                threading.Thread(target=self._ust_cagri, args=(anahtar, ucus, istek, oturum),
+                                 name='tyt-ai-kapisi', daemon=True).start()
+            else:
+                self.birlesen += 1
+        return self._izle(ucus)
+
+    def _ust_cagri(self, anahtar, ucus, istek, oturum):
+        try:
+            self.hak_al(oturum)
+            for parca in istek():
+                with ucus.kosul:
+                    ucus.parcalar.append(parca)
+                    ucus.kosul.notify_all()
+        except Exception as e:
+            ucus.hata = e
+        finally:
+            with ucus.kosul:
+                ucus.bitti = True
+                del self._ucustakiler[anahtar]
+                ucus.kosul.notify_all()
+
+    @staticmethod
+    def _izle(ucus):
+        okunan = 0
+        while True:
+            with ucus.kosul:
+                ucus.kosul.wait_for(lambda: ucus.bitti or len(ucus.parcalar) > okunan)
+                yeni, bitti = ucus.parcalar[okunan:], ucus.bitti
+            okunan += len(yeni)
+            yield from yeni
+            if bitti:
+                if ucus.hata is not None:
+                    raise ucus.hata
+                return
+
+    def istatistikler(self):
+        """Kuyruk derinliği, bekleme süreleri ve birleştirme sayaçları"""
+        with self._kilit:
+            self._doldur(time.monotonic())
+            return {
+                'kuyruk_derinligi': self._derinlik,
+                'bekleyen_oturum': len(self._kuyruklar),
+                'en_fazla_kuyruk_derinligi': self.en_fazla_derinlik,
+                'ucustaki_istek': len(self._ucustakiler),
+                'istek': self.istek,
+                'birlesen': self.birlesen,
+                'zaman_asimi': self.zaman_asimi_sayisi,
+                'ortalama_bekleme_s': self.toplam_bekleme / self.hak_verilen if self.hak_verilen else 0.0,
+                'en_fazla_bekleme_s': self.en_fazla_bekleme,
+                'kalan_hak': self._haklar,
+            }
@@ -0,0 +1,201 @@
+"""Groq tabanlı AI koç önerileri"""
+import os
+
+from .olcum import olculen
+from .onbellek import parmak_izi
+from .ozet import ders_toplamlari
+
+
+def groq_istemcisi_olustur(api_key=None):
+    """Groq istemcisi oluştur (groq paketi yalnızca burada yüklenir)"""
+    from groq import Groq
+
+    return Groq(api_key=api_key or os.environ.get("GROQ_API_KEY"))
+
+
+# Model çağrısı parametreleri (toplu ve akışlı istemciler de bunları kullanır)
+AI_MODELI = "llama3-70b-8192"
+AI_MAX_TOKENS = 4000
+AI_SICAKLIK = 0.7
+SISTEM_MESAJI = "Sen TYT'de uzman, analitik düşünen ve öğrenci psikolojisini iyi bilen bir eğitim koçusun. Veriye dayalı, kişiselleştirilmiş ve motive edici stratejiler sunuyorsun. Önerilerin en az 800 kelime olmalı ve tüm detayları kapsamalı."
+AI_HIZMET_YOK_MESAJI = "AI hizmeti şu anda kullanılamıyor. Lütfen manuel olarak öncelikli konulara odaklanın."
+
+
+def ai_mesajlari_olustur(konu_analizi, gunluk_saat, gun_sayisi, toplamlar=None):
+    """Analizden sohbet tamamlama mesajlarını oluştur
+
+    toplamlar (ozet.ders_toplamlari çıktısı) verilirse ders bazlı toplamlar
+    analizden yeniden hesaplanmaz.
+    """
+    sorted_topics = sorted(konu_analizi.items(), key=lambda x: x[1]['oncelik_puani'], reverse=True)
+    kotu_konular = sorted_topics[:8]
+    orta_konular = sorted_topics[8:16] if len(sorted_topics) > 8 else []
+    iyi_konular = sorted_topics[-5:]
+
+    # Ders bazında analiz
+    if toplamlar is None:
+        toplamlar = ders_toplamlari(konu_analizi)
+    ders_analizi = {}
+    for ders, toplam in toplamlar.items():
+        ders_analizi[ders] = {
+            'ortalama': toplam['toplam_puan'] / toplam['konu_sayisi'],
+            'zayiflik_orani': toplam['zayif_konular'] / toplam['konu_sayisi']
+        }
+
+    en_zayif_ders = max(ders_analizi.items(), key=lambda x: x[1]['ortalama'])
+
+    # Hedef belirleme
+    toplam_saat = gunluk_saat * gun_sayisi
+    kritik_konu_sayisi = len([k for k, v in konu_analizi.items() if v['oncelik_puani'] > 5])
+
+    prompt = f"""
+    Sen TYT'de uzman bir eğitim koçusun. Türkçe cevaplamalısın sadece. Öğrencinin detaylı performans analizini yapıp, kişiselleştirilmiş {gun_sayisi} günlük strateji hazırlayacaksın.
+
+    📊 ÖĞRENCİ PROFİLİ:
+    • Toplam çalışma süresi: {toplam_saat} saat ({gun_sayisi} gün x {gunluk_saat} saat)
+    • Kritik durumdaki konu sayısı: {kritik_konu_sayisi}
+    • En zayıf alan: {en_zayif_ders[0]} (Risk skoru: {en_zayif_ders[1]['ortalama']:.1f})
+
+    🔴 ACİL MÜDAHALE GEREKTİREN KONULAR:
+    {chr(10).join([f"• {info['konu']} ({info['ders']}) - Risk: {info['oncelik_puani']:.1f}/10" for _, info in kotu_konular])}
+
+    🟡 GELİŞTİRİLMESİ GEREKEN KONULAR:
+    {chr(10).join([f"• {info['konu']} ({info['ders']}) - Risk: {info['oncelik_puani']:.1f}/10" for _, info in orta_konular])}
+
+    🟢 GÜÇLÜ ALANLAR (Koruma altında):
+    {chr(10).join([f"• {info['konu']} ({info['ders']}) - Risk: {info['oncelik_puani']:.1f}/10" for _, info in iyi_konular])}
+
+    📈 DERS BAZLI ZAYIFLIK ANALİZİ:
+    {chr(10).join([f"• {ders}: %{data['zayiflik_orani']*100:.0f} zayıf konu oranı" for ders, data in ders_analizi.items()])}
+
+    GÖREV: Aşağıdaki kriterlere göre {gun_sayisi} günlük DETAYLI strateji hazırla (en az 800 kelime):
+    1. Kritik konular için haftalık çalışma planı (konu bazlı)
+    2. Her kritik konu için özel çalışma teknikleri
+    3. Zaman yönetimi stratejileri
+    4. Kaynak önerileri (kitap, video, uygulama)
+    5. Motivasyon teknikleri ve başarı hikayeleri
+    6. Deneme sınavı takvimi
+    7. Ölçme-değerlendirme yöntemleri
+    8. Uyku ve beslenme düzeni önerileri
+    9. Stres yönetimi teknikleri
+    10. Son hafta için özel taktikler
+
+    Çıktıyı başlıklar halinde düzenle ve her bölüm için en az 3-5 madde içeren detaylı açıklamalar yap.
+    """
+
+    return [
+        {"role": "system", "content": SISTEM_MESAJI},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def ai_parmak_izi(konu_analizi, gunluk_saat, gun_sayisi, kova=1.0):
+    """AI isteği için normalleştirilmiş parmak izi
+
+    Risk puanları kova genişliğine yuvarlanır; böylece puanları birbirine çok
+    yakın öğrenciler aynı önbellek girdisini paylaşır.
+    """
+    puanlar = sorted(
+        (konu, int(bilgi['oncelik_puani'] // kova)) for konu, bilgi in konu_analizi.items()
+    )
+    return parmak_izi(AI_MODELI, puanlar, gunluk_saat, gun_sayisi)
+
+
+def _tam_yanit(client, mesajlar):
+    chat_completion = client.chat.completions.create(
+        messages=mesajlar,
+        model=AI_MODELI,
+        max_tokens=AI_MAX_TOKENS,
+        temperature=AI_SICAKLIK
+    )
+    return [chat_completion.choices[0].message.content]
+
+
+def _yanit_parcalari(client, mesajlar):
+    akis = client.chat.completions.create(
+        messages=mesajlar,
+        model=AI_MODELI,
+        max_tokens=AI_MAX_TOKENS,
+        temperature=AI_SICAKLIK,
+        stream=True
+    )
+    for parca in akis:
+        metin = parca.choices[0].delta.content if parca.choices else None
+        if metin:
+            yield metin
+
+
+def _yanit_kaynagi(istek, client, mesajlar, anahtar, kapi, oturum):
+    """Doğrudan ya da kapı (IstekKapisi) üzerinden yanıt parçaları"""
+    if kapi is None:
+        return istek(client, mesajlar)
+    return kapi.akis(anahtar, lambda: istek(client, mesajlar), oturum)
+
+
+# Geliştirilmiş AI Öneri Sistemi
+@olculen()
+def get_ai_suggestion(konu_analizi, gunluk_saat, gun_sayisi, client=None, onbellek=None, akis=False,
+                      toplamlar=None, kapi=None, oturum=None):
+    """Geliştirilmiş ve daha detaylı AI önerisi
+
+    onbellek (DiskOnbellek) verilirse aynı veya çok yakın profiller için
+    API çağrılmadan önceki yanıt döndürülür. akis=True ise metin yerine,
+    yanıt geldikçe metin parçaları üreten bir üreteç döndürülür. toplamlar,
+    ai_mesajlari_olustur'a iletilir. kapi (ai_kapisi.IstekKapisi) verilirse
+    API çağrısı oturum adına hız sınırından geçer ve aynı profildeki
+    eşzamanlı isteklerle birleştirilir.
+    """
+    if akis:
+        return _ai_onerisi_akisi(konu_analizi, gunluk_saat, gun_sayisi, client, onbellek, toplamlar, kapi, oturum)
+
+    if not client:
+        return AI_HIZMET_YOK_MESAJI
+
+    anahtar = None
+    if onbellek is not None or kapi is not None:
+        anahtar = ai_parmak_izi(konu_analizi, gunluk_saat, gun_sayisi)
+    if onbellek is not None:
+        onceki = onbellek.al(anahtar)
+        if onceki is not None:
+            return onceki
+
+    try:
+        mesajlar = ai_mesajlari_olustur(konu_analizi, gunluk_saat, gun_sayisi, toplamlar)
+        oneri = ''.join(_yanit_kaynagi(_tam_yanit, client, mesajlar, anahtar, kapi, oturum))
+    except Exception as e:
+        return f"AI önerisi alınırken hata oluştu: {str(e)}"
+
+    if onbellek is not None:
+        onbellek.koy(anahtar, oneri)
+    return oneri
+
+
+@olculen()
+def _ai_onerisi_akisi(konu_analizi, gunluk_saat, gun_sayisi, client, onbellek, toplamlar, kapi=None, oturum=None):
+    """get_ai_suggestion(akis=True) üreteci; tamamlanan yanıt önbelleğe yazılır"""
+    if not client:
+        yield AI_HIZMET_YOK_MESAJI
+        return
+
+    anahtar = None
+    if onbellek is not None or kapi is not None:
+        anahtar = ai_parmak_izi(konu_analizi, gunluk_saat, gun_sayisi)
+    if onbellek is not None:
+        onceki = onbellek.al(anahtar)
+        if onceki is not None:
+            yield onceki
+            return
+
+    parcalar = []
+    try:
+        mesajlar = ai_mesajlari_olustur(konu_analizi, gunluk_saat, gun_sayisi, toplamlar)
+        for metin in _yanit_kaynagi(_yanit_parcalari, client, mesajlar, anahtar, kapi, oturum):
+            parcalar.append(metin)
+            yield metin
+    except Exception as e:
+        ayrac = "\n\n" if parcalar else ""
+        yield f"{ayrac}AI önerisi alınırken hata oluştu: {str(e)}"
+        return
+
+    if onbellek is not None and parcalar:
+        onbellek.koy(anahtar, ''.join(parcalar))
@@ -0,0 +1,156 @@
+"""Asenkron toplu AI önerisi
+
+Gece çalışan kohort raporları için çok sayıda AI önerisini eşzamanlılık
+sınırı altında paralel ister. Her istek için zaman aşımı uygulanır; 429 ve
+5xx yanıtları ile bağlantı hataları üstel geri çekilmeyle yeniden denenir.
+Sonuçlar isteklerin veriliş sırasıyla döner.
+"""
+import asyncio
+import csv
+import os
+import random
+from collections import namedtuple
+
+from .ai_kocu import (
+    AI_MAX_TOKENS, AI_MODELI, AI_SICAKLIK, ai_mesajlari_olustur, ai_parmak_izi
+)
+
+# oneri: yanıt metni (başarısızsa None), hata: son hata metni, deneme: yapılan istek sayısı
+AiSonucu = namedtuple('AiSonucu', 'oneri hata deneme')
+
+
+def async_groq_istemcisi_olustur(api_key=None, base_url=None):
+    """Yeniden denemeleri kapalı AsyncGroq istemcisi (denemeleri bu modül yönetir)"""
+    from groq import AsyncGroq
+
+    return AsyncGroq(api_key=api_key or os.environ.get("GROQ_API_KEY"), base_url=base_url, max_retries=0)
+
+
+def _yeniden_denenebilir(hata):
+    """429, 5xx, zaman aşımı ve bağlantı hataları yeniden denenir"""
+    if isinstance(hata, asyncio.TimeoutError):
+        return True
+    import groq
+
+    if isinstance(hata, (groq.APITimeoutError, groq.APIConnectionError)):
+        return True
+    if isinstance(hata, groq.APIStatusError):
+        return hata.status_code == 429 or hata.status_code >= 500
+    return False
+
+
+def _bekleme_suresi(hata, deneme, geri_cekilme, ust_sinir):
+    """Üstel geri çekilme + rastgele sapma; 429'da Retry-After başlığına uy"""
+    yanit = getattr(hata, 'response', None)
+    if yanit is not None:
+        try:
+            return min(float(yanit.headers.get('retry-after')), ust_sinir)
+        except (TypeError, ValueError):
+            pass
+    return min(geri_cekilme * (2 ** deneme), ust_sinir) + random.uniform(0, geri_cekilme)
+
+
+async def _tek_istek(client, mesajlar, semafor, zaman_asimi, deneme_sayisi, geri_cekilme, ust_sinir):
+    son_hata = None
+    for deneme in range(deneme_sayisi):
+        async with semafor:
+            try:
+                yanit = await asyncio.wait_for(
+                    client.chat.completions.create(
+                        messages=mesajlar,
+                        model=AI_MODELI,
+                        max_tokens=AI_MAX_TOKENS,
+                        temperature=AI_SICAKLIK
+                    ),
+                    zaman_asimi
+                )
+                return AiSonucu(yanit.choices[0].message.content, None, deneme + 1)
+            except Exception as e:
+                son_hata = e
+                if not _yeniden_denenebilir(e):
+                    break
+        # Beklerken semaforu bırak ki diğer istekler ilerleyebilsin
+        if deneme + 1 < deneme_sayisi:
+            await asyncio.sleep(_bekleme_suresi(son_hata, deneme, geri_cekilme, ust_sinir))
+
+    hata_metni = type(son_hata).__name__ + (f": {son_hata}" if str(son_hata) else "")
+    return AiSonucu(None, hata_metni, deneme + 1)
+
+
+async def ai_onerileri_toplu(istekler, client=None, eszamanlilik=8, zaman_asimi=60.0,
+                             deneme_sayisi=4, geri_cekilme=0.5, ust_sinir=30.0, onbellek=None):
+    """(konu_analizi, gunluk_saat, gun_sayisi) istekleri için AI önerilerini paralel al
+
+    En fazla eszamanlilik kadar istek aynı anda açıktır. Sonuç, isteklerle aynı
+    sırada AiSonucu listesidir. onbellek (DiskOnbellek) verilirse önbellekteki
+    yanıtlar API'ye gidilmeden döner ve yeni yanıtlar önbelleğe yazılır.
+    """
+    if deneme_sayisi < 1:
+        raise ValueError(f"deneme_sayisi en az 1 olmalı: {deneme_sayisi}")
+    kendi_istemcisi = client is None
+    if kendi_istemcisi:
+        client = async_groq_istemcisi_olustur()
+    semafor = asyncio.Semaphore(eszamanlilik)
+
+    async def isle(konu_analizi, gunluk_saat, gun_sayisi):
+        anahtar = None
+        if onbellek is not None:
+            anahtar = ai_parmak_izi(konu_analizi, gunluk_saat, gun_sayisi)
+            onceki = onbellek.al(anahtar)
+            if onceki is not None:
+                return AiSonucu(onceki, None, 0)
+
+        try:
+            mesajlar = ai_mesajlari_olustur(konu_analizi, gunluk_saat, gun_sayisi)
+        except Exception as e:
+            # Örneğin boş analiz: istek gönderilmez, diğer sonuçlar etkilenmez
+            return AiSonucu(None, f"{type(e).__name__}: {e}", 0)
+        sonuc = await _tek_istek(
+            client, mesajlar, semafor, zaman_asimi, deneme_sayisi, geri_cekilme, ust_sinir
+        )
+        if anahtar is not None and sonuc.oneri is not None:
+            onbellek.koy(anahtar, sonuc.oneri)
+        return sonuc
+
+    try:
+        return await asyncio.gather(*(isle(*istek) for istek in istekler))
+    finally:
+        if kendi_istemcisi:
+            await client.close()
+
+
+def kohort_ai_raporu(girdi, cikti, gunluk_saat, gun_sayisi, client=None, parca_boyutu=500, atlananlar=None,
+                     **secenekler):
+    """Kohort dosyasındaki her öğrenci için AI önerisi alıp CSV'ye yaz
+
+    Dosya parça parça okunur; her parçanın istekleri ai_onerileri_toplu ile
+    paralel gönderilir ve sonuçlar parça bitince yazılır. Başarısız öğrenci
+    sayısını döndürür.
+    """
+    from .analiz import analiz_et
+    from .kohort import parca_verilere, parcalari_oku
+
+    async def yaz(istemci):
+        basarisiz = 0
+        with open(cikti, 'w', newline='', encoding='utf-8') as f:
+            yazici = csv.writer(f)
+            yazici.writerow(['Öğrenci', 'Öneri', 'Hata', 'Deneme'])
+            for parca in parcalari_oku(girdi, parca_boyutu, atlananlar):
+                ogrenciler, istekler = [], []
+                for ogrenci, veriler in parca_verilere(parca):
+                    ogrenciler.append(ogrenci)
+                    istekler.append((analiz_et(veriler), gunluk_saat, gun_sayisi))
+                sonuclar = await ai_onerileri_toplu(istekler, istemci, **secenekler)
+                for ogrenci, sonuc in zip(ogrenciler, sonuclar):
+                    yazici.writerow([ogrenci, sonuc.oneri or '', sonuc.hata or '', sonuc.deneme])
+                    basarisiz += sonuc.oneri is None
+        return basarisiz
+
+    async def calistir():
+        if client is not None:
+            return await yaz(client)
+        # Burada açılan istemcinin bağlantıları iş bitince kapatılır
+        async with async_groq_istemcisi_olustur() as istemci:
+            return await yaz(istemci)
+
+    return asyncio.run(calistir())
@@ -0,0 +1,98 @@
+"""Öncelik puanlama ve konu analizi"""
+import numpy as np
+
+from .katalog import (
+    KONU_ADLARI, KONU_INDEKSI, KONU_KATEGORILERI, KONU_SIRASI, KONU_ZORLUKLARI, ONEM_AGIRLIGI, ZORLUK_KATSAYISI
+)
+from .konular import ZORLUK_KATSAYILARI
+from .olcum import olculen
+
+
+def hesapla_oncelik_puani(dogru, yanlis, bos, zorluk, ortalama_soru):
+    """Geliştirilmiş öncelik puanı hesapla"""
+    zorluk_katsayisi = ZORLUK_KATSAYILARI[zorluk]
+    
+    # Yeni formül: Yanlış ve boşları birlikte değerlendir
+    puan = ((yanlis + bos) * 1.2) + (zorluk_katsayisi * 3)
+    
+    # Konu önem ağırlığı (logaritmik ölçek)
+    onem_agirligi = np.log1p(ortalama_soru) * 3
+    
+    # Final puan
+    oncelik_puani = puan * onem_agirligi
+    
+    return oncelik_puani
+
+# Toplu puanlamada matris sütunları katalogdaki konu sırasını (KONU_SIRASI) izler
+_ZORLUK_PUANLARI = ZORLUK_KATSAYISI * 3
+_ONEM_AGIRLIKLARI = ONEM_AGIRLIGI
+
+def hesapla_oncelik_puani_toplu(yanlis, bos, indeksler=None):
+    """Öğrenci x konu matrisleri için tüm öncelik puanlarını tek NumPy geçişinde hesapla
+    
+    Sütunlar KONU_SIRASI düzenindedir; indeksler verilirse yalnızca o KONU_SIRASI
+    indekslerindeki konuların sütunlarıdır. Puan doğru sayısına bağlı olmadığından
+    yalnızca yanlış ve boş alınır. Sonuç, hesapla_oncelik_puani ile birebir aynıdır.
+    """
+    yanlis = np.asarray(yanlis, dtype=float)
+    bos = np.asarray(bos, dtype=float)
+    zorluk_puanlari, onem_agirliklari = _ZORLUK_PUANLARI, _ONEM_AGIRLIKLARI
+    if indeksler is not None:
+        zorluk_puanlari, onem_agirliklari = zorluk_puanlari[indeksler], onem_agirliklari[indeksler]
+    
+    puan = ((yanlis + bos) * 1.2) + zorluk_puanlari
+    return puan * onem_agirliklari
+
+def veriler_matrise(veriler):
+    """veriler sözlüğünü KONU_SIRASI düzeninde doğru/yanlış/boş dizilerine çevir"""
+    dogru = np.zeros(len(KONU_SIRASI))
+    yanlis = np.zeros(len(KONU_SIRASI))
+    bos = np.zeros(len(KONU_SIRASI))
+    
+    for ders, konular in veriler.items():
+        for konu, sonuclar in konular.items():
+            i = KONU_INDEKSI[(ders, konu)]
+            dogru[i] = sonuclar['dogru']
+            yanlis[i] = sonuclar['yanlis']
+            bos[i] = sonuclar['bos']
+    
+    return dogru, yanlis, bos
+
+def analiz_girdisi(konu_id, sonuclar, oncelik_puani):
+    """Katalog kimliği verilen konunun analiz sözlüğündeki kaydı; konu analize girmiyorsa (hiç soru yok) None"""
+    if sonuclar['dogru'] + sonuclar['yanlis'] + sonuclar['bos'] <= 0:
+        return None
+    ders, konu = KONU_SIRASI[konu_id]
+    
+    return {
+        'ders': ders,
+        'konu': konu,
+        'oncelik_puani': oncelik_puani,
+        'dogru': sonuclar['dogru'],
+        'yanlis': sonuclar['yanlis'],
+        'bos': sonuclar['bos'],
+        'zorluk': KONU_ZORLUKLARI[konu_id],
+        'kategori': KONU_KATEGORILERI[konu_id],
+        'gercek_soru': sonuclar['gercek_soru']
+    }
+
+@olculen()
+def analiz_et(veriler):
+    """Tüm verileri analiz et"""
+    kimlikler, kayitlar = [], []
+    for ders, konular in veriler.items():
+        for konu, sonuclar in konular.items():
+            kimlikler.append(KONU_INDEKSI[(ders, konu)])
+            kayitlar.append(sonuclar)
+    puanlar = hesapla_oncelik_puani_toplu(
+        np.array([s['yanlis'] for s in kayitlar], dtype=float),
+        np.array([s['bos'] for s in kayitlar], dtype=float),
+        indeksler=np.array(kimlikler, dtype=np.intp)
+    )
+    
+    analiz = {}
+    for konu_id, sonuclar, puan in zip(kimlikler, kayitlar, puanlar):
+        girdi = analiz_girdisi(konu_id, sonuclar, puan)
+        if girdi is not None:
+            analiz[KONU_ADLARI[konu_id]] = girdi
+    return analiz
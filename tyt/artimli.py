@@ -0,0 +1,132 @@
+"""Artımlı (yalnızca değişen konuları yeniden puanlayan) analiz
+
+ArtimliAnaliz bir veriler sözlüğünün analizini ve ders bazlı toplamlarını
+tutar. Değişen konular kirli olarak işaretlenir; uygula() yalnızca bunları
+toplu puanlayıcıdan geçirir, analiz sözlüğünü yerinde günceller ve yalnızca
+etkilenen derslerin toplamlarını yeniden hesaplar. Sonuçlar analiz_et ve
+ozet.ders_toplamlari ile birebir aynıdır.
+"""
+import numpy as np
+
+from .analiz import analiz_et, analiz_girdisi, hesapla_oncelik_puani_toplu
+from .katalog import KONU_ADLARI, KONU_INDEKSI
+from .olcum import olculen
+from .ozet import ders_toplamlari, hesapla_ders_basari_orani
+
+
+def _kayit_anahtari(sonuclar):
+    return (sonuclar['dogru'], sonuclar['yanlis'], sonuclar['bos'], sonuclar['gercek_soru'])
+
+
+class ArtimliAnaliz:
+    """veriler üzerinde kirli konu takibiyle analiz ve ders toplamları"""
+
+    def __init__(self, veriler):
+        self.veriler = veriler
+        self.analiz = analiz_et(veriler)
+        self.toplamlar = ders_toplamlari(self.analiz)
+        # Son analizdeki değerler; esitle() değişiklikleri buna göre bulur
+        self._son_kayitlar = {
+            (ders, konu): _kayit_anahtari(sonuclar)
+            for ders, konular in veriler.items() for konu, sonuclar in konular.items()
+        }
+        self._kirli = set()
+        self.surum = 0
+
+    def guncelle(self, ders, konu, sonuclar):
+        """Bir konunun sonuçlarını veriler'e yaz ve değiştiyse kirli işaretle"""
+        self.veriler.setdefault(ders, {})[konu] = sonuclar
+        if self._son_kayitlar.get((ders, konu)) != _kayit_anahtari(sonuclar):
+            self._kirli.add((ders, konu))
+
+    def duzeltmeleri_uygula(self, duzeltmeler):
+        """(ders, konu, sonuclar) düzeltmelerini yazıp tek geçişte yeniden puanla"""
+        for ders, konu, sonuclar in duzeltmeler:
+            self.guncelle(ders, konu, sonuclar)
+        return self.uygula()
+
+    def esitle(self):
+        """veriler dışarıdan değiştirildiyse değişen konuları kirli işaretle
+
+        Her konunun değerlerini son analizdekilerle karşılaştırır; puanlama yapmaz.
+        """
+        for ders, konular in self.veriler.items():
+            for konu, sonuclar in konular.items():
+                if self._son_kayitlar.get((ders, konu)) != _kayit_anahtari(sonuclar):
+                    self._kirli.add((ders, konu))
+        return len(self._kirli)
+
+    @olculen()
+    def uygula(self):
+        """Kirli konuları yeniden puanla; analizde değişen konu adlarını döndür"""
+        if not self._kirli:
+            return []
+        kirli = sorted(self._kirli, key=KONU_INDEKSI.__getitem__)
+        self._kirli.clear()
+
+        kimlikler = [KONU_INDEKSI[dk] for dk in kirli]
+        kayitlar = [self.veriler[ders][konu] for ders, konu in kirli]
+        puanlar = hesapla_oncelik_puani_toplu(
+            np.array([s['yanlis'] for s in kayitlar], dtype=float),
+            np.array([s['bos'] for s in kayitlar], dtype=float),
+            indeksler=np.array(kimlikler)
+        )
+
+        degisenler, yeni_konu_var = [], False
+        for ders_konu, konu_id, sonuclar, puan in zip(kirli, kimlikler, kayitlar, puanlar):
+            self._son_kayitlar[ders_konu] = _kayit_anahtari(sonuclar)
+            ad = KONU_ADLARI[konu_id]
+            girdi = analiz_girdisi(konu_id, sonuclar, puan)
+            if girdi is None:
+                if self.analiz.pop(ad, None) is not None:
+                    degisenler.append(ad)
+                continue
+            yeni_konu_var |= ad not in self.analiz
+            self.analiz[ad] = girdi
+            degisenler.append(ad)
+
+        if yeni_konu_var:
+            # analiz_et ile aynı sıra: veriler sırası
+            sirali = [f"{ders} - {konu}" for ders, konular in self.veriler.items() for konu in konular]
+            yeni = {ad: self.analiz[ad] for ad in sirali if ad in self.analiz}
+            self.analiz.clear()
+            self.analiz.update(yeni)
+
+        if degisenler:
+            self._toplamlari_yamala({ders for ders, _ in kirli})
+            self.surum += 1
+        return degisenler
+
+    def _toplamlari_yamala(self, dersler):
+        """Yalnızca verilen derslerin toplamlarını analizden yeniden hesapla"""
+        yeni_ders_var = False
+        for ders in dersler:
+            # ders_toplamlari ile aynı toplama sırası (analiz sırası = veriler sırası)
+            toplam = None
+            for konu in self.veriler.get(ders, ()):
+                bilgi = self.analiz.get(f"{ders} - {konu}")
+                if bilgi is None:
+                    continue
+                if toplam is None:
+                    toplam = {'toplam_puan': 0, 'konu_sayisi': 0, 'zayif_konular': 0}
+                toplam['toplam_puan'] += bilgi['oncelik_puani']
+                toplam['konu_sayisi'] += 1
+                if bilgi['oncelik_puani'] > 5:
+                    toplam['zayif_konular'] += 1
+
+            if toplam is None:
+                self.toplamlar.pop(ders, None)
+            else:
+                yeni_ders_var |= ders not in self.toplamlar
+                self.toplamlar[ders] = toplam
+
+        if yeni_ders_var:
+            # Ders sırası analizdeki ilk görünme sırasıdır
+            sira = dict.fromkeys(bilgi['ders'] for bilgi in self.analiz.values())
+            yeni = {ders: self.toplamlar[ders] for ders in sira}
+            self.toplamlar.clear()
+            self.toplamlar.update(yeni)
+
+    def ders_basari_orani(self):
+        """hesapla_ders_basari_orani(self.analiz) ile aynı sonuç, toplamlardan"""
+        return hesapla_ders_basari_orani(self.analiz, self.toplamlar)
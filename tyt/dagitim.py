@@ -0,0 +1,107 @@
+"""Beklenen net kazancını en yükselten çalışma saati dağılımı
+
+Her konuya h saat ayrıldığında beklenen net kazancı azalan verimle artar:
+
+    kazanc(h) = potansiyel * (1 - exp(-h / sabit))
+
+potansiyel, konu sınavda ortalama_soru kadar sorulduğunda denemedeki hata
+oranlarıyla kaybedilen nettir (yanlıştan doğruya 1.25, boştan doğruya 1 net).
+sabit, açığın yaklaşık üçte ikisini kapatmak için gereken saattir; konunun zorluk
+katsayısı ve genişliğiyle (ortalama soru sayısının karekökü) büyür.
+
+Toplam saat sabitken toplam kazanç içbükeydir; en iyi dağılımda saat alan her
+konunun marjinal kazancı aynı λ değerine eşittir (su doldurma). Konular sıfır
+saatteki marjinal kazançlarına (potansiyel / sabit) göre sıralanır ve λ, saat
+alan konu kümesinin her olası büyüklüğü için kümülatif toplamlardan kapalı
+biçimde bulunur; ikili arama ya da yineleme yoktur. Tüm işlemler (öğrenci x
+konu) matrisleri üzerinde satır satır vektöreldir.
+"""
+import numpy as np
+
+from .katalog import KONU_AD_INDEKSI, ORTALAMA_SORU, ZORLUK_KATSAYISI
+from .olcum import olculen
+
+# Orta zorlukta tek soruluk bir konunun öğrenme sabiti (saat)
+OGRENME_SAATI = 3.0
+
+_OGRENME_SABITLERI = OGRENME_SAATI * ZORLUK_KATSAYISI * np.sqrt(ORTALAMA_SORU)
+
+
+def net_potansiyeli(dogru, yanlis, bos, indeksler=None):
+    """Konu tamamen öğrenildiğinde sınavda beklenen net kazancı
+
+    Sütunlar KONU_SIRASI düzenindedir; indeksler verilirse yalnızca o
+    indekslerdeki konuların sütunlarıdır. Hiç sorusu olmayan konularda 0'dır.
+    """
+    dogru, yanlis, bos = (np.asarray(d, dtype=float) for d in (dogru, yanlis, bos))
+    ortalama_soru = ORTALAMA_SORU if indeksler is None else ORTALAMA_SORU[indeksler]
+    toplam = dogru + yanlis + bos
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(toplam > 0, ortalama_soru * (1.25 * yanlis + bos) / toplam, 0.0)
+
+
+def _su_doldur(potansiyel, sabit, toplam_saat):
+    """Satır başına toplam_saat'i toplam kazancı en yükseltecek biçimde dağıt"""
+    potansiyel = np.atleast_2d(potansiyel)
+    sabit = np.broadcast_to(sabit, potansiyel.shape)
+    toplam_saat = np.broadcast_to(np.asarray(toplam_saat, dtype=float), potansiyel.shape[:1])[:, None]
+
+    marjinal = potansiyel / sabit
+    with np.errstate(divide='ignore'):
+        log_marjinal = np.where(marjinal > 0, np.log(marjinal), -np.inf)
+
+    # Marjinal kazanca göre azalan sırada ilk k konu saat alırsa
+    # ln λ_k = (Σ sabit * ln marjinal - toplam_saat) / Σ sabit
+    sira = np.argsort(-log_marjinal, axis=1, kind='stable')
+    sirali_log = np.take_along_axis(log_marjinal, sira, axis=1)
+    sirali_sabit = np.take_along_axis(sabit, sira, axis=1)
+    pozitif = np.isfinite(sirali_log)
+    log_lambda = (
+        np.cumsum(np.where(pozitif, sirali_sabit * sirali_log, 0.0), axis=1) - toplam_saat
+    ) / np.cumsum(sirali_sabit, axis=1)
+
+    # Saat alan küme, k. konunun marjinal kazancının λ_k'yı aştığı en büyük k'dır
+    gecerli = pozitif & (sirali_log > log_lambda)
+    k = gecerli.shape[1] - 1 - np.argmax(gecerli[:, ::-1], axis=1)
+    log_lambda = np.where(gecerli.any(axis=1), log_lambda[np.arange(len(k)), k], np.inf)
+
+    saat = sabit * np.maximum(log_marjinal - log_lambda[:, None], 0.0)
+    kazanc = potansiyel * -np.expm1(-saat / sabit)
+    return saat, kazanc
+
+
+def saat_dagit_toplu(dogru, yanlis, bos, toplam_saat, indeksler=None):
+    """Öğrenci x konu matrisleri için en iyi saat dağılımı ve beklenen net kazançları
+
+    Sütunlar hesapla_oncelik_puani_toplu'daki gibidir; toplam_saat tek bir sayı
+    ya da öğrenci başına bir dizidir. (saatler, kazanclar) matrislerini döndürür;
+    her satırın saatleri toplam_saat'e eşittir (potansiyeli olan konu yoksa 0).
+    """
+    potansiyel = net_potansiyeli(dogru, yanlis, bos, indeksler)
+    sabit = _OGRENME_SABITLERI if indeksler is None else _OGRENME_SABITLERI[indeksler]
+    saat, kazanc = _su_doldur(potansiyel, sabit, toplam_saat)
+    if potansiyel.ndim == 1:
+        return saat[0], kazanc[0]
+    return saat, kazanc
+
+
+@olculen()
+def saat_dagit(analiz, toplam_saat):
+    """analiz_et sonucundaki konulara toplam_saat'i dağıt
+
+    {konu_adi: {'saat', 'beklenen_net', 'potansiyel_net'}} döndürür; sıra
+    analiz sırasıdır.
+    """
+    if not analiz:
+        return {}
+    adlar = list(analiz)
+    indeksler = np.array([KONU_AD_INDEKSI[ad] for ad in adlar], dtype=np.intp)
+    dogru, yanlis, bos = (
+        np.array([analiz[ad][alan] for ad in adlar], dtype=float) for alan in ('dogru', 'yanlis', 'bos')
+    )
+    saatler, kazanclar = saat_dagit_toplu(dogru, yanlis, bos, toplam_saat, indeksler)
+    potansiyeller = net_potansiyeli(dogru, yanlis, bos, indeksler)
+    return {
+        ad: {'saat': saat, 'beklenen_net': kazanc, 'potansiyel_net': potansiyel}
+        for ad, saat, kazanc, potansiyel in zip(adlar, saatler.tolist(), kazanclar.tolist(), potansiyeller.tolist())
+    }
@@ -0,0 +1,247 @@
+"""Öğrenci deneme geçmişinin kalıcı deposu
+
+Öğrenciler, denemeler ve deneme başına konu sonuçları yerel bir SQLite
+dosyasında tutulur. Konular ayrı bir tabloda (ders, konu) benzersiz
+indeksiyle saklanır ve sonuç satırları konuya tam sayı kimliğiyle bağlanır;
+sonuç tablosu (deneme, konu) birincil anahtarlı WITHOUT ROWID tablodur. Böylece
+milyonlarca sonuç satırında da bir denemenin sonuçları tek indeks aralığından,
+öğrencinin son denemesi (öğrenci, tarih) indeksinden okunur.
+"""
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+
+from .katalog import KONU_INDEKSI, KONU_SIRASI
+
+_SEMA = """
+CREATE TABLE IF NOT EXISTS ogrenciler (
+    id INTEGER PRIMARY KEY,
+    ad TEXT NOT NULL UNIQUE,
+    olusturma REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS denemeler (
+    id INTEGER PRIMARY KEY,
+    ogrenci_id INTEGER NOT NULL REFERENCES ogrenciler (id) ON DELETE CASCADE,
+    tarih TEXT NOT NULL,
+    ad TEXT,
+    olusturma REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS denemeler_ogrenci_tarih ON denemeler (ogrenci_id, tarih, id);
+CREATE TABLE IF NOT EXISTS konular (
+    id INTEGER PRIMARY KEY,
+    ders TEXT NOT NULL,
+    konu TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS konular_ders_konu ON konular (ders, konu);
+CREATE TABLE IF NOT EXISTS konu_sonuclari (
+    deneme_id INTEGER NOT NULL REFERENCES denemeler (id) ON DELETE CASCADE,
+    konu_id INTEGER NOT NULL REFERENCES konular (id),
+    dogru INTEGER NOT NULL,
+    yanlis INTEGER NOT NULL,
+    bos INTEGER NOT NULL,
+    soru INTEGER NOT NULL,
+    PRIMARY KEY (deneme_id, konu_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS konu_sonuclari_konu ON konu_sonuclari (konu_id, deneme_id);
+CREATE TEMP TABLE IF NOT EXISTS secili_ogrenciler (ad TEXT PRIMARY KEY) WITHOUT ROWID;
+"""
+
+# Öğrencinin en son (tarih, sonra kayıt sırası) denemesinin sonuçları
+_SON_VERILER_SORGUSU = """
+SELECT k.ders, k.konu, s.dogru, s.yanlis, s.bos, s.soru
+FROM konu_sonuclari s JOIN konular k ON k.id = s.konu_id
+WHERE s.deneme_id = (
+    SELECT d.id FROM denemeler d JOIN ogrenciler o ON o.id = d.ogrenci_id
+    WHERE o.ad = ? ORDER BY d.tarih DESC, d.id DESC LIMIT 1
+)
+ORDER BY s.konu_id
+"""
+
+
+def varsayilan_veri_dizini():
+    """TYT_VERI_DIZINI ya da ~/.local/share/tyt"""
+    return os.environ.get('TYT_VERI_DIZINI') or os.path.join(os.path.expanduser('~'), '.local', 'share', 'tyt')
+
+
+def _tarih_metni(tarih):
+    if tarih is None:
+        tarih = date.today()
+    if isinstance(tarih, datetime):
+        tarih = tarih.date()
+    return tarih.isoformat() if isinstance(tarih, date) else str(tarih)
+
+
+class DenemeDeposu:
+    """Öğrenci, deneme ve konu sonuçları için SQLite deposu"""
+
+    def __init__(self, yol=None):
+        if yol is None:
+            os.makedirs(varsayilan_veri_dizini(), exist_ok=True)
+            yol = os.path.join(varsayilan_veri_dizini(), 'denemeler.sqlite3')
+        self.yol = yol
+        self._kilit = threading.Lock()
+        self._baglanti = sqlite3.connect(yol, check_same_thread=False, isolation_level=None)
+        self._baglanti.execute("PRAGMA journal_mode=WAL")
+        self._baglanti.execute("PRAGMA synchronous=NORMAL")
+        self._baglanti.execute("PRAGMA foreign_keys=ON")
+        self._baglanti.executescript(_SEMA)
+
+        self._ogrenci_kimlikleri = {}
+
+        # Konu kataloğu tabloya bir kez yazılır; kimlikler bellekte tutulur
+        with self._islem():
+            self._baglanti.executemany(
+                "INSERT OR IGNORE INTO konular (ders, konu) VALUES (?, ?)", KONU_SIRASI
+            )
+        self._konu_kimlikleri = {
+            (ders, konu): kimlik
+            for kimlik, ders, konu in self._baglanti.execute("SELECT id, ders, konu FROM konular")
+        }
+
+    @contextmanager
+    def _islem(self):
+        """BEGIN ... COMMIT; hata olursa ROLLBACK"""
+        self._baglanti.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._baglanti.execute("ROLLBACK")
+            # Geri alınan işlemde eklenmiş öğrencilerin kimlikleri geçersizdir
+            self._ogrenci_kimlikleri.clear()
+            raise
+        self._baglanti.execute("COMMIT")
+
+    def _ogrenci_kimligi(self, ad):
+        kimlik = self._ogrenci_kimlikleri.get(ad)
+        if kimlik is None:
+            self._baglanti.execute(
+                "INSERT OR IGNORE INTO ogrenciler (ad, olusturma) VALUES (?, ?)", (ad, time.time())
+            )
+            kimlik = self._baglanti.execute("SELECT id FROM ogrenciler WHERE ad = ?", (ad,)).fetchone()[0]
+            self._ogrenci_kimlikleri[ad] = kimlik
+        return kimlik
+
+    def _deneme_ekle(self, ogrenci, veriler, tarih, ad):
+        imlec = self._baglanti.execute(
+            "INSERT INTO denemeler (ogrenci_id, tarih, ad, olusturma) VALUES (?, ?, ?, ?)",
+            (self._ogrenci_kimligi(ogrenci), _tarih_metni(tarih), ad, time.time())
+        )
+        deneme_id = imlec.lastrowid
+        self._baglanti.executemany(
+            "INSERT INTO konu_sonuclari (deneme_id, konu_id, dogru, yanlis, bos, soru) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (deneme_id, self._konu_kimlikleri[(ders, konu)],
+                 s['dogru'], s['yanlis'], s['bos'], s['gercek_soru'])
+                for ders, konular in veriler.items() for konu, s in konular.items()
+            ]
+        )
+        return deneme_id
+
+    def deneme_kaydet(self, ogrenci, veriler, tarih=None, ad=None):
+        """Bir denemenin tüm konu sonuçlarını tek işlemde kaydet; deneme kimliğini döndür"""
+        with self._kilit, self._islem():
+            return self._deneme_ekle(ogrenci, veriler, tarih, ad)
+
+    def denemeleri_toplu_kaydet(self, kayitlar, parti_boyutu=500):
+        """(öğrenci, tarih, veriler) kayıtlarını parti_boyutu denemelik işlemlerle kaydet
+
+        Kaydedilen deneme sayısını döndürür.
+        """
+        sayi = 0
+        parti = []
+        for kayit in kayitlar:
+            parti.append(kayit)
+            if len(parti) >= parti_boyutu:
+                sayi += self._parti_kaydet(parti)
+                parti = []
+        if parti:
+            sayi += self._parti_kaydet(parti)
+        return sayi
+
+    def _parti_kaydet(self, parti):
+        with self._kilit, self._islem():
+            for ogrenci, tarih, veriler in parti:
+                self._deneme_ekle(ogrenci, veriler, tarih, None)
+        return len(parti)
+
+    def son_veriler(self, ogrenci):
+        """Öğrencinin son denemesini uygulamadaki veriler yapısında döndür; yoksa None"""
+        with self._kilit:
+            satirlar = self._baglanti.execute(_SON_VERILER_SORGUSU, (ogrenci,)).fetchall()
+        if not satirlar:
+            return None
+
+        veriler = {}
+        for ders, konu, dogru, yanlis, bos, soru in satirlar:
+            veriler.setdefault(ders, {})[konu] = {'dogru': dogru, 'yanlis': yanlis, 'bos': bos, 'gercek_soru': soru}
+        return veriler
+
+    def ogrenciler(self):
+        """Kayıtlı öğrenci adları (alfabetik)"""
+        with self._kilit:
+            return [ad for ad, in self._baglanti.execute("SELECT ad FROM ogrenciler ORDER BY ad")]
+
+    def denemeler(self, ogrenci):
+        """Öğrencinin denemeleri: [(deneme_id, tarih, ad)] tarih sırasıyla"""
+        with self._kilit:
+            return self._baglanti.execute(
+                "SELECT d.id, d.tarih, d.ad FROM denemeler d JOIN ogrenciler o ON o.id = d.ogrenci_id "
+                "WHERE o.ad = ? ORDER BY d.tarih, d.id", (ogrenci,)
+            ).fetchall()
+
+    def konu_gecmisi(self, ogrenci, ders, konu):
+        """Bir konunun öğrencideki geçmişi: [(tarih, dogru, yanlis, bos, soru)] tarih sırasıyla"""
+        with self._kilit:
+            return self._baglanti.execute(
+                "SELECT d.tarih, s.dogru, s.yanlis, s.bos, s.soru "
+                "FROM denemeler d JOIN ogrenciler o ON o.id = d.ogrenci_id "
+                "JOIN konu_sonuclari s ON s.deneme_id = d.id AND s.konu_id = ? "
+                "WHERE o.ad = ? ORDER BY d.tarih, d.id",
+                (self._konu_kimlikleri[(ders, konu)], ogrenci)
+            ).fetchall()
+
+    def gecmis_tablosu(self, ogrenciler=None):
+        """Öğrencilerin (None ise herkesin) tüm konu sonuçları, uzun biçimli DataFrame
+
+        Sütunlar: ogrenci, deneme, tarih, konu_indeksi (KONU_SIRASI indeksi), dogru,
+        yanlis, bos, soru. Satırlar öğrenci, tarih, deneme ve konu sırasındadır.
+        Öğrenci listesi, SQLite'ın parametre sınırına takılmamak için geçici
+        tabloya yazılıp sorguya oradan katılır.
+        """
+        import pandas as pd
+
+        kosul = ""
+        if ogrenciler is not None:
+            kosul = "WHERE o.ad IN (SELECT ad FROM secili_ogrenciler)"
+        with self._kilit, self._islem():
+            if ogrenciler is not None:
+                self._baglanti.execute("DELETE FROM secili_ogrenciler")
+                self._baglanti.executemany(
+                    "INSERT OR IGNORE INTO secili_ogrenciler (ad) VALUES (?)", ((ad,) for ad in ogrenciler)
+                )
+            satirlar = self._baglanti.execute(
+                "SELECT o.ad, d.id, d.tarih, s.konu_id, s.dogru, s.yanlis, s.bos, s.soru "
+                "FROM ogrenciler o JOIN denemeler d ON d.ogrenci_id = o.id "
+                f"JOIN konu_sonuclari s ON s.deneme_id = d.id {kosul} "
+                "ORDER BY o.id, d.tarih, d.id, s.konu_id"
+            ).fetchall()
+
+        gecmis = pd.DataFrame(satirlar, columns=['ogrenci', 'deneme', 'tarih', 'konu_indeksi',
+                                                 'dogru', 'yanlis', 'bos', 'soru'])
+        gecmis['tarih'] = pd.to_datetime(gecmis['tarih'])
+        # Depodaki konu kimliklerini KONU_SIRASI indekslerine çevir; katalogda olmayanlar atılır
+        indeksler = {kimlik: KONU_INDEKSI.get(ders_konu, -1) for ders_konu, kimlik in self._konu_kimlikleri.items()}
+        gecmis['konu_indeksi'] = gecmis['konu_indeksi'].map(indeksler).fillna(-1).astype('int64')
+        return gecmis[gecmis['konu_indeksi'] >= 0].reset_index(drop=True)
+
+    def deneme_sil(self, deneme_id):
+        """Denemeyi konu sonuçlarıyla birlikte sil"""
+        with self._kilit, self._islem():
+            self._baglanti.execute("DELETE FROM denemeler WHERE id = ?", (deneme_id,))
+
+    def kapat(self):
+        with self._kilit:
+            self._baglanti.close()
@@ -0,0 +1,216 @@
+"""Excel dışa aktarma
+
+Çalışma kitabı write-only modda, satır satır yazılır: hücre biçimleri her
+hücre için yeniden oluşturulmak yerine çalışma kitabına bir kez eklenen
+adlandırılmış stillerden (NamedStyle) gelir ve her sütun için önceden
+hazırlanmış hücre nesneleri yeniden kullanılır. Böylece bellek kullanımı
+satır sayısından bağımsız kalır.
+
+Toplu dışa aktarma, (öğrenci, satırlar) çiftleri üreten herhangi bir
+yinelenebiliri (örneğin kohort.kohort_ogrenci_programlari gibi paralel bir
+üretici) tüketir ve her öğrenciyi üretildiği anda ya tek çalışma kitabında
+ayrı bir sayfaya ya da zip arşivinde ayrı bir dosyaya yazar.
+"""
+import io
+import re
+import zipfile
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
+
+from .olcum import olculen
+
+PROGRAM_BASLIKLARI = [
+    'Gün', 'Tarih', 'Zaman', 'Ders', 'Konu', 'Öncelik Puanı',
+    'Zorluk', 'Kategori', 'Doğru', 'Yanlış', 'Boş'
+]
+
+# Sütun genişlikleri
+SUTUN_GENISLIKLERI = {
+    'A': 8,   # Gün
+    'B': 12,  # Tarih
+    'C': 15,  # Zaman
+    'D': 12,  # Ders
+    'E': 35,  # Konu
+    'F': 15,  # Öncelik Puanı
+    'G': 12,  # Zorluk
+    'H': 12,  # Kategori
+    'I': 8,   # Doğru
+    'J': 8,   # Yanlış
+    'K': 8    # Boş
+}
+
+ONCELIK_SUTUNU = 5  # Öncelik Puanı (0 tabanlı)
+ZORLUK_SUTUNU = 6   # Zorluk (0 tabanlı)
+
+
+def _stiller():
+    """Programın adlandırılmış stillerini oluştur"""
+    # Kenarlık
+    thin_border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    orta = Alignment(horizontal="center", vertical="center")
+
+    return {
+        # Başlık stilleri
+        'baslik': NamedStyle(
+            name="tyt_baslik",
+            font=Font(bold=True, color="FFFFFF", size=12),
+            fill=PatternFill(start_color="2F4F4F", end_color="2F4F4F", fill_type="solid"),
+            alignment=orta,
+            border=thin_border
+        ),
+        'hucre': NamedStyle(name="tyt_hucre", font=DEFAULT_FONT, alignment=orta, border=thin_border),
+        # Koşullu biçimlendirme
+        'yuksek_oncelik': NamedStyle(
+            name="tyt_yuksek_oncelik",
+            font=Font(bold=True, color="8B0000"),
+            fill=PatternFill(start_color="FFE4E1", end_color="FFE4E1", fill_type="solid"),
+            alignment=orta,
+            border=thin_border
+        ),
+        'zor_konu': NamedStyle(
+            name="tyt_zor_konu",
+            font=Font(bold=True, color="FF8C00"),
+            fill=PatternFill(start_color="FFF8DC", end_color="FFF8DC", fill_type="solid"),
+            alignment=orta,
+            border=thin_border
+        ),
+    }
+
+
+def program_sayfasi_yaz(wb, baslik, satirlar, basliklar=PROGRAM_BASLIKLARI):
+    """Write-only çalışma kitabına biçimli bir program sayfası ekle
+
+    satirlar, basliklar sırasıyla değer dizileri üreten herhangi bir
+    yinelenebilirdir (tüm veri bellekte tutulmaz). Yazılan satır sayısını döndürür.
+    """
+    stiller = getattr(wb, '_tyt_stilleri', None)
+    if stiller is None:
+        stiller = _stiller()
+        for stil in stiller.values():
+            wb.add_named_style(stil)
+        wb._tyt_stilleri = stiller
+
+    ws = wb.create_sheet(baslik)
+    for col, width in SUTUN_GENISLIKLERI.items():
+        ws.column_dimensions[col].width = width
+
+    def hucre(stil, value=None):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = stiller[stil].name
+        return cell
+
+    # Başlıkları ekle
+    ws.append([hucre('baslik', b) for b in basliklar])
+
+    # Her sütun için hücreler bir kez oluşturulur; write-only sayfa satırı
+    # append anında diske yazdığı için aynı nesneler sonraki satırlarda kullanılabilir.
+    normal = [hucre('hucre') for _ in basliklar]
+    yuksek_oncelik = hucre('yuksek_oncelik')
+    zor_konu = hucre('zor_konu')
+    oncelik_var = len(basliklar) > ONCELIK_SUTUNU
+    zorluk_var = len(basliklar) > ZORLUK_SUTUNU
+
+    sayi = 0
+    for row in satirlar:
+        cells = normal
+        for cell, value in zip(normal, row):
+            cell.value = value
+
+        # Koşullu biçimlendirme
+        if oncelik_var:
+            value = row[ONCELIK_SUTUNU]
+            if isinstance(value, (int, float)) and value > 5:
+                cells = list(cells)
+                yuksek_oncelik.value = value
+                cells[ONCELIK_SUTUNU] = yuksek_oncelik
+        if zorluk_var and row[ZORLUK_SUTUNU] == "Zor":
+            if cells is normal:
+                cells = list(cells)
+            zor_konu.value = row[ZORLUK_SUTUNU]
+            cells[ZORLUK_SUTUNU] = zor_konu
+
+        ws.append(cells)
+        sayi += 1
+
+    return sayi
+
+
+def excel_export_akis(satirlar, hedef, basliklar=PROGRAM_BASLIKLARI, sayfa_adi="TYT Çalışma Programı"):
+    """Satırları doğrudan bir dosyaya (yol veya ikili dosya nesnesi) akıtarak Excel oluştur"""
+    wb = Workbook(write_only=True)
+    sayi = program_sayfasi_yaz(wb, sayfa_adi, satirlar, basliklar)
+    wb.save(hedef)
+    return sayi
+
+
+@olculen()
+def excel_export_professional(program_df):
+    """Profesyonel Excel çıktısı"""
+    output = io.BytesIO()
+    satirlar = program_df.itertuples(index=False, name=None)
+    excel_export_akis(satirlar, output, list(program_df.columns))
+    output.seek(0)
+
+    return output.getvalue()
+
+
+_GECERSIZ_SAYFA_KARAKTERLERI = re.compile(r'[\[\]:*?/\\]')
+_GECERSIZ_DOSYA_KARAKTERLERI = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+
+def _benzersiz_ad(ad, kullanilan, uzunluk=None):
+    """Adı gerekirse kısaltıp ' (2)', ' (3)' ... ekleyerek benzersiz yap"""
+    aday = ad[:uzunluk] if uzunluk else ad
+    sira = 2
+    while aday.casefold() in kullanilan:
+        ek = f" ({sira})"
+        aday = (ad[:uzunluk - len(ek)] if uzunluk else ad) + ek
+        sira += 1
+    kullanilan.add(aday.casefold())
+    return aday
+
+
+def sinif_excel_akis(ogrenci_programlari, hedef, basliklar=PROGRAM_BASLIKLARI):
+    """Her öğrencinin programını tek çalışma kitabında ayrı sayfaya yaz
+
+    ogrenci_programlari (öğrenci_adı, satirlar) çiftleri üreten bir
+    yinelenebilirdir. Yazılan öğrenci sayısını döndürür.
+    """
+    wb = Workbook(write_only=True)
+    kullanilan = set()
+    sayi = 0
+    for ogrenci, satirlar in ogrenci_programlari:
+        ad = _GECERSIZ_SAYFA_KARAKTERLERI.sub('_', str(ogrenci)).strip("' ") or f"Öğrenci {sayi + 1}"
+        program_sayfasi_yaz(wb, _benzersiz_ad(ad, kullanilan, 31), satirlar, basliklar)
+        sayi += 1
+    if not sayi:
+        wb.create_sheet("TYT Çalışma Programı")
+    wb.save(hedef)
+    return sayi
+
+
+def toplu_excel_zip(ogrenci_programlari, hedef, basliklar=PROGRAM_BASLIKLARI):
+    """Her öğrencinin programını ayrı bir .xlsx olarak zip arşivine akıt
+
+    Çalışma kitapları arşive doğrudan yazılır; aynı anda yalnızca bir öğrencinin
+    kitabı işlemdedir. hedef bir yol veya ikili dosya nesnesidir. Yazılan
+    öğrenci sayısını döndürür.
+    """
+    kullanilan = set()
+    sayi = 0
+    # xlsx zaten sıkıştırılmış olduğu için arşive sıkıştırmadan eklenir
+    with zipfile.ZipFile(hedef, 'w', zipfile.ZIP_STORED, allowZip64=True) as arsiv:
+        for ogrenci, satirlar in ogrenci_programlari:
+            ad = _GECERSIZ_DOSYA_KARAKTERLERI.sub('_', str(ogrenci)).strip('. ') or f"ogrenci_{sayi + 1}"
+            with arsiv.open(_benzersiz_ad(ad, kullanilan) + '.xlsx', 'w', force_zip64=True) as dosya:
+                excel_export_akis(satirlar, dosya, basliklar)
+            sayi += 1
+    return sayi
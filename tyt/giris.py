@@ -0,0 +1,82 @@
+"""Deneme sonucu girişinin tablo biçimi ve doğrulaması
+
+Toplu giriş modunda her ders grubunun konuları tek bir tabloda düzenlenir ve
+form gönderildiğinde tümü birden st.session_state.veriler'e yazılır. Tek tek
+girişteki kurallar aynen uygulanır: soru sayısı 0-50 arasıdır, doğru soru
+sayısını, yanlış da kalan soruyu aşamaz; boş otomatik hesaplanır.
+"""
+import numpy as np
+
+from .katalog import DERS_KONULARI, KONU_INDEKSI, KONU_ORTALAMA_SORULARI, KONU_SIRASI, KONU_ZORLUKLARI
+
+MAKS_SORU = 50
+
+GIRIS_SUTUNLARI = ['Ders', 'Konu', 'Zorluk', 'Soru', 'Doğru', 'Yanlış', 'Boş']
+DUZENLENEBILIR_SUTUNLAR = ('Soru', 'Doğru', 'Yanlış')
+
+
+def varsayilan_kayit(ders, konu):
+    """Girilmemiş konu: ortalama soru sayısı kadar soru, hepsi boş"""
+    soru = KONU_ORTALAMA_SORULARI[KONU_INDEKSI[(ders, konu)]]
+    return {'dogru': 0, 'yanlis': 0, 'bos': soru, 'gercek_soru': soru}
+
+
+def _tam_sayi(deger):
+    """Tablodan gelen değeri (None, float, metin olabilir) tam sayıya çevir"""
+    try:
+        return int(float(deger))
+    except (TypeError, ValueError):
+        return 0
+
+
+def kayit_dogrula(gercek_soru, dogru, yanlis):
+    """Değerleri giriş sınırlarına çek; (kayit, duzeltildi) döndür"""
+    ham = (_tam_sayi(gercek_soru), _tam_sayi(dogru), _tam_sayi(yanlis))
+    gercek_soru = min(max(ham[0], 0), MAKS_SORU)
+    dogru = min(max(ham[1], 0), gercek_soru)
+    yanlis = min(max(ham[2], 0), gercek_soru - dogru)
+    kayit = {'dogru': dogru, 'yanlis': yanlis, 'bos': gercek_soru - dogru - yanlis, 'gercek_soru': gercek_soru}
+    return kayit, (gercek_soru, dogru, yanlis) != ham
+
+
+def kayitlari_dogrula(gercek_soru, dogru, yanlis):
+    """kayit_dogrula'nın dizi hali: (dogru, yanlis, bos, gercek_soru) dizileri döndür"""
+    gercek_soru = np.clip(gercek_soru, 0, MAKS_SORU)
+    dogru = np.clip(dogru, 0, gercek_soru)
+    yanlis = np.clip(yanlis, 0, gercek_soru - dogru)
+    return dogru, yanlis, gercek_soru - dogru - yanlis, gercek_soru
+
+
+def giris_tablosu(veriler, dersler):
+    """Derslerin konuları için tablo satırları (GIRIS_SUTUNLARI sözlükleri)"""
+    satirlar = []
+    for ders in dersler:
+        ders_verileri = veriler.get(ders, {})
+        for konu_id in DERS_KONULARI[ders]:
+            konu = KONU_SIRASI[konu_id][1]
+            kayit = ders_verileri.get(konu) or varsayilan_kayit(ders, konu)
+            satirlar.append({
+                'Ders': ders, 'Konu': konu, 'Zorluk': KONU_ZORLUKLARI[konu_id],
+                'Soru': kayit['gercek_soru'], 'Doğru': kayit['dogru'],
+                'Yanlış': kayit['yanlis'], 'Boş': kayit['bos']
+            })
+    return satirlar
+
+
+def duzenlemeleri_uygula(veriler, dersler, duzenlenen_satirlar):
+    """Tablo düzenlemelerini (satır indeksi -> {sütun: değer}) verilere yaz
+
+    Satır indeksleri giris_tablosu(veriler, dersler) sırasına göredir. Sınırları
+    aşan değerler düzeltilerek yazılır; düzeltilen konuların "Ders - Konu"
+    adlarını döndürür.
+    """
+    satirlar = giris_tablosu(veriler, dersler)
+    duzeltilenler = []
+    for indeks, degisiklik in duzenlenen_satirlar.items():
+        satir = satirlar[int(indeks)]
+        satir.update((sutun, deger) for sutun, deger in degisiklik.items() if sutun in DUZENLENEBILIR_SUTUNLAR)
+        kayit, duzeltildi = kayit_dogrula(satir['Soru'], satir['Doğru'], satir['Yanlış'])
+        veriler.setdefault(satir['Ders'], {})[satir['Konu']] = kayit
+        if duzeltildi:
+            duzeltilenler.append(f"{satir['Ders']} - {satir['Konu']}")
+    return duzeltilenler
@@ -0,0 +1,164 @@
+"""Arayüz grafikleri
+
+Her grafik yalnızca JSON'a çevrilebilir girdilerden kurulur ve girdilerin
+içerik özetiyle önbelleğe alınır; aynı veriyle yeniden çalıştırmalarda ve
+diğer oturumlarda aynı Figure nesnesi döner. Döndürülen figürler salt okunur
+kullanılmalıdır.
+"""
+from .olcum import olculen
+from .onbellek import bellekte_tut
+
+
+@olculen()
+@bellekte_tut(kapasite=64)
+def oncelik_grafigi(analiz):
+    """Analizdeki ilk 20 konunun öncelik puanı çubuk grafiği"""
+    import pandas as pd
+    import plotly.express as px
+
+    df_analiz = pd.DataFrame([
+        {
+            'Konu': konu,
+            'Öncelik Puanı': bilgi['oncelik_puani'],
+            'Ders': bilgi['ders'],
+            'Zorluk': bilgi['zorluk']
+        }
+        for konu, bilgi in analiz.items()
+    ])
+
+    fig = px.bar(df_analiz.head(20),
+                 x='Öncelik Puanı',
+                 y='Konu',
+                 color='Ders',
+                 title='En Öncelikli 20 Konu')
+    fig.update_layout(height=600)
+    return fig
+
+
+@olculen()
+@bellekte_tut(kapasite=64)
+def risk_haritasi(analiz):
+    """Ders x konu öncelik puanı ısı haritası"""
+    import pandas as pd
+    import plotly.express as px
+
+    # Heatmap için veri hazırlama
+    df_heatmap = pd.DataFrame([
+        {'Ders': bilgi['ders'], 'Konu': bilgi['konu'], 'Öncelik Puanı': bilgi['oncelik_puani']}
+        for bilgi in analiz.values()
+    ])
+
+    # Pivot tablo oluşturma
+    pivot_df = df_heatmap.pivot_table(
+        index='Ders',
+        columns='Konu',
+        values='Öncelik Puanı',
+        aggfunc='first'
+    ).fillna(0)
+
+    fig = px.imshow(
+        pivot_df,
+        labels=dict(x="Konu", y="Ders", color="Risk Puanı"),
+        color_continuous_scale='RdYlGn_r',  # Kırmızı-Yeşil renk skalası (ters)
+        title='Ders ve Konulara Göre Risk Dağılımı'
+    )
+    fig.update_layout(
+        height=700,
+        xaxis_title="Konular",
+        yaxis_title="Dersler",
+        coloraxis_colorbar=dict(title="Risk Puanı")
+    )
+    return fig
+
+
+@olculen()
+@bellekte_tut(kapasite=64)
+def haftalik_ilerleme_grafigi(haftalar, konu_sayilari):
+    """Hafta etiketleri ve haftalık konu sayılarından çubuk grafik"""
+    import pandas as pd
+    import plotly.express as px
+
+    haftalik_ilerleme = pd.DataFrame({'Hafta': haftalar, 'Konu Sayısı': konu_sayilari})
+    fig = px.bar(haftalik_ilerleme,
+                 x='Hafta',
+                 y='Konu Sayısı',
+                 title='Haftalık Konu İlerlemesi',
+                 text='Konu Sayısı',
+                 color='Konu Sayısı',
+                 color_continuous_scale='Blues')
+    fig.update_traces(textposition='outside')
+    return fig
+
+
+@olculen()
+@bellekte_tut(kapasite=64)
+def ders_dagilimi_grafikleri(ders_sayilari):
+    """{ders: konu_sayisi} için (pasta grafik, çubuk grafik)"""
+    import pandas as pd
+    import plotly.express as px
+
+    ders_ilerleme = pd.DataFrame({'Ders': list(ders_sayilari), 'Konu Sayısı': list(ders_sayilari.values())})
+    pasta = px.pie(ders_ilerleme,
+                   names='Ders',
+                   values='Konu Sayısı',
+                   title='Derslere Göre Konu Dağılımı',
+                   hole=0.3)
+    cubuk = px.bar(ders_ilerleme.sort_values('Konu Sayısı', ascending=False),
+                   x='Ders',
+                   y='Konu Sayısı',
+                   color='Ders',
+                   title='Derslere Göre Konu Sayısı')
+    return pasta, cubuk
+
+
+@olculen()
+@bellekte_tut(kapasite=64)
+def ders_net_grafigi(ders_performans):
+    """Ders bazlı performans satırlarından net / kalan net grafiği"""
+    import pandas as pd
+    import plotly.express as px
+
+    return px.bar(pd.DataFrame(ders_performans), x='Ders', y=['Net', 'Kalan Net'],
+                  title='Derslere Göre Net Durumu',
+                  labels={'value': 'Net', 'variable': 'Durum'},
+                  barmode='group')
+
+
+@olculen()
+@bellekte_tut(kapasite=64)
+def ders_trend_grafigi(seri_kayitlari):
+    """{'Tarih', 'Ders', 'Net', 'Kayan Net'} kayıtlarından ders bazlı kayan net çizgileri"""
+    import pandas as pd
+    import plotly.express as px
+
+    fig = px.line(pd.DataFrame(seri_kayitlari), x='Tarih', y='Kayan Net', color='Ders',
+                  markers=True, hover_data=['Net'], title='Derslere Göre Kayan Net')
+    fig.update_layout(height=500)
+    return fig
+
+
+@olculen()
+@bellekte_tut(kapasite=64)
+def konu_egim_grafigi(egim_kayitlari):
+    """{'Konu', 'Eğim'} kayıtlarından en hızlı değişen konuların eğim grafiği"""
+    import pandas as pd
+    import plotly.express as px
+
+    fig = px.bar(pd.DataFrame(egim_kayitlari), x='Eğim', y='Konu', orientation='h',
+                 color='Eğim', color_continuous_scale='RdYlGn', color_continuous_midpoint=0,
+                 title='En Hızlı Gelişen ve Gerileyen Konular (deneme başına net)')
+    fig.update_layout(height=600)
+    return fig
+
+
+@olculen()
+@bellekte_tut(kapasite=64)
+def net_projeksiyon_grafigi(dagilim_kayitlari):
+    """{'Net', 'Olasılık', 'Durum'} histogram kayıtlarından mevcut / planlı net dağılımı"""
+    import pandas as pd
+    import plotly.express as px
+
+    fig = px.bar(pd.DataFrame(dagilim_kayitlari), x='Net', y='Olasılık', color='Durum',
+                 barmode='overlay', opacity=0.6, title='Sınav Günü Net Dağılımı (Monte Carlo)')
+    fig.update_layout(bargap=0, height=450)
+    return fig
@@ -0,0 +1,296 @@
+"""Yayınevi karnelerinden (PDF) konu bazlı deneme sonuçlarının aktarılması
+
+Karne sayfalarının metni pdfplumber ile çıkarılır. Sonunda en az üç tam sayı
+bulunan satırlar konu satırı sayılır:
+
+    [sıra no] <Konu> ya da <Ders> <Konu>  [Soru]  Doğru  Yanlış  Boş  [Net]
+
+Konu adları Türkçe karakterler ASCII'ye katlanarak eşleştirilir; böylece
+gömülü yazı tipi eksik olan PDF'lerdeki "Sayi Basamaklari" gibi metinler de
+tanınır. Net yalnızca tam sayı yazıldığında sayılara katılır. Soru sütunu olup
+olmadığına tablo başlığına ("Soru D Y B Net" ya da "Doğru Yanlış Boş Net")
+bakılarak karar verilir. Başlık yoksa beş ya da daha fazla sayılı satırlarda
+ilk sayı soru sayısıdır. Dört sayılı satırlarda karar sayfa geneline göre
+verilir. "Soru D Y B" ile "D Y B Net" okumalarından yalnızca birine uyan
+satırlar oy verir. Hiçbir satır karar vermiyorsa Soru sütunu yok sayılır.
+Böylece tam puanlı "D 0 0 Net" satırı boş sayılmaz. "Öğrenci: Ad Soyad"
+satırı yeni bir öğrenciyi başlatır;
+böylece her sayfası ayrı öğrenci olan sınıf karneleri de okunur.
+
+Sayfalar parçalar halinde işçi süreçlerde çözülür; çözülmüş belgeler dosya
+içeriğinin SHA-256 özetiyle DiskOnbellek'te saklanır.
+"""
+import csv
+import hashlib
+import os
+import re
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .katalog import KONU_SIRASI
+from .giris import kayit_dogrula
+from .olcum import olculen
+from .onbellek import DiskOnbellek, varsayilan_onbellek_dizini
+
+# Ayrıştırma kuralları değişirse artırılır; eski önbellek girdileri kullanılmaz
+SURUM = 2
+
+_KATLAMA = str.maketrans('çğıöşüâîûÇĞİÖŞÜÂÎÛ', 'cgiosuaiuCGIOSUAIU')
+_SAYILAR = re.compile(r'^(?P<ad>.*?[^\W\d_].*?)((?:\s+-?\d+(?:[.,]\d+)?)+)\s*$')
+_SIRA_NO = re.compile(r'^\s*\d+\s*[.)-]?\s+')
+_OGRENCI = re.compile(r'^\s*(?:ogrenci(?:\s+adi)?(?:\s+soyadi)?|adi?\s+soyadi?)\s*:\s*(?P<ad>\S.*?)\s*$')
+
+Karne = namedtuple('Karne', 'yol ogrenciler sayfa_sayisi onbellekten')
+
+
+def katla(metin):
+    """Türkçe karakterleri ASCII'ye katla, küçült; harf ve rakam dışını tek boşluk yap"""
+    return ' '.join(re.sub(r'[^0-9a-z]+', ' ', metin.translate(_KATLAMA).lower()).split())
+
+
+_KONU_ANAHTARLARI = {}
+for _i, (_ders, _konu) in enumerate(KONU_SIRASI):
+    _KONU_ANAHTARLARI[katla(_konu)] = _i
+    _KONU_ANAHTARLARI[katla(f"{_ders} {_konu}")] = _i
+
+
+def konu_indeksi(ad):
+    """Karnedeki konu adının KONU_SIRASI indeksi; tanınmazsa None"""
+    return _KONU_ANAHTARLARI.get(katla(_SIRA_NO.sub('', ad)))
+
+
+def _baslik_soru_sutunu(satir):
+    """Tablo başlığıysa Soru sütunu olup olmadığı (True/False); başlık değilse None"""
+    kelimeler = set(katla(satir).split())
+    if not (kelimeler & {'d', 'dogru'} and kelimeler & {'y', 'yanlis'}):
+        return None
+    return bool(kelimeler & {'soru', 'ss'})
+
+
+def _dort_sayi_oyu(sayilar):
+    """Dört sayılı satır için True (Soru D Y B), False (D Y B Net) ya da belirsizse None"""
+    a, b, c, d = sayilar
+    soru_uyar = a == b + c + d
+    net_uyar = 4 * d == 4 * a - b
+    return soru_uyar if soru_uyar != net_uyar else None
+
+
+def sayfa_coz(metin):
+    """Sayfa metnini [(öğrenci adı ya da None, [(konu_indeksi, dogru, yanlis, bos)])] bölümlerine ayır
+
+    Adı None olan ilk bölümün kayıtları önceki sayfadaki öğrenciye aittir.
+    """
+    olaylar = []
+    oylar = []
+    for satir in metin.splitlines():
+        eslesme = _OGRENCI.match(satir.translate(_KATLAMA).lower())
+        if eslesme:
+            olaylar.append(('ogrenci', satir[eslesme.start('ad'):eslesme.end('ad')]))
+            continue
+
+        eslesme = _SAYILAR.match(satir)
+        if not eslesme:
+            soru_sutunu = _baslik_soru_sutunu(satir)
+            if soru_sutunu is not None:
+                olaylar.append(('baslik', soru_sutunu))
+            continue
+        konu = konu_indeksi(eslesme.group('ad'))
+        sayilar = [int(s) for s in eslesme.group(2).split() if s.isdigit()]
+        if konu is None or len(sayilar) < 3:
+            continue
+        olaylar.append(('konu', konu, sayilar))
+        if len(sayilar) == 4:
+            oylar.append(_dort_sayi_oyu(sayilar))
+
+    # Başlıksız satırlar için sayfa geneli karar; eşitlikte Soru sütunu yok sayılır
+    tahmin = oylar.count(True) > oylar.count(False)
+    soru_sutunu = None
+    bolumler = [(None, [])]
+    for olay in olaylar:
+        if olay[0] == 'ogrenci':
+            bolumler.append((olay[1], []))
+        elif olay[0] == 'baslik':
+            soru_sutunu = olay[1]
+        else:
+            _, konu, sayilar = olay
+            if len(sayilar) >= 5 or (len(sayilar) == 4 and (tahmin if soru_sutunu is None else soru_sutunu)):
+                sayilar = sayilar[1:]
+            bolumler[-1][1].append((konu, sayilar[0], sayilar[1], sayilar[2]))
+
+    if len(bolumler) > 1 and not bolumler[0][1]:
+        bolumler.pop(0)
+    return bolumler
+
+
+def ogrencileri_birlestir(bolumler, varsayilan_ad):
+    """Sayfa sırasındaki bölümleri [(öğrenci, veriler)] listesine çevir
+
+    Adı olmayan öğrenci varsayilan_ad alır. Bir öğrencide aynı konu birden çok
+    kez geçerse ilki kullanılır; değerler giriş sınırlarına çekilir.
+    """
+    ogrenciler = []
+    for ad, kayitlar in bolumler:
+        if ad is not None or not ogrenciler:
+            ogrenciler.append((ad or varsayilan_ad, {}))
+        konular = ogrenciler[-1][1]
+        for konu, dogru, yanlis, bos in kayitlar:
+            konular.setdefault(konu, (dogru, yanlis, bos))
+
+    sonuc = []
+    for ad, konular in ogrenciler:
+        if not konular:
+            continue
+        veriler = {}
+        for konu in sorted(konular):
+            dogru, yanlis, bos = konular[konu]
+            ders, konu_adi = KONU_SIRASI[konu]
+            veriler.setdefault(ders, {})[konu_adi], _ = kayit_dogrula(dogru + yanlis + bos, dogru, yanlis)
+        sonuc.append((ad, veriler))
+    return sonuc
+
+
+def _sayfalari_coz(yol, ilk=0, son=None):
+    """İşçi süreçte: [ilk, son) sayfalarını (son None ise tümünü) çözüp sayfa başına bölümleri döndür"""
+    import pdfplumber
+
+    sayfalar = None if son is None else range(ilk + 1, son + 1)
+    with pdfplumber.open(yol, pages=sayfalar) as pdf:
+        return [sayfa_coz(sayfa.extract_text() or '') for sayfa in pdf.pages]
+
+
+def _sayfa_sayisi(yol):
+    import pdfplumber
+
+    with pdfplumber.open(yol) as pdf:
+        return len(pdf.pages)
+
+
+def dosya_ozeti(yol):
+    """Dosya içeriğinin SHA-256 özeti"""
+    ozet = hashlib.sha256()
+    with open(yol, 'rb') as f:
+        for blok in iter(lambda: f.read(1 << 20), b''):
+            ozet.update(blok)
+    return ozet.hexdigest()
+
+
+def varsayilan_karne_onbellegi():
+    """Karne önbelleği: önbellek dizininde ayrı bir dosya, bir yıl geçerli"""
+    os.makedirs(varsayilan_onbellek_dizini(), exist_ok=True)
+    return DiskOnbellek(os.path.join(varsayilan_onbellek_dizini(), 'karne.sqlite3'),
+                        kapasite=20000, ttl=365 * 24 * 3600)
+
+
+def klasordeki_pdfler(dizin):
+    """Dizindeki (alt dizinler dahil) PDF dosyaları, yol sırasıyla"""
+    return sorted(
+        os.path.join(kok, ad)
+        for kok, _, adlar in os.walk(dizin) for ad in adlar if ad.lower().endswith('.pdf')
+    )
+
+
+def _onbellekten(yol, onbellek):
+    """(önbellek anahtarı, önbellekteki Karne ya da None)"""
+    anahtar = f"karne:{SURUM}:{dosya_ozeti(yol)}"
+    kayitli = onbellek.al(anahtar) if onbellek is not None else None
+    if kayitli is None:
+        return anahtar, None
+    return anahtar, Karne(yol, [tuple(o) for o in kayitli['ogrenciler']], kayitli['sayfa_sayisi'], True)
+
+
+def _karne_olustur(yol, anahtar, sayfalar, onbellek):
+    """Sayfa sırasındaki bölüm listelerinden Karne kur ve önbelleğe yaz"""
+    ad = os.path.splitext(os.path.basename(yol))[0]
+    ogrenciler = ogrencileri_birlestir([bolum for sayfa in sayfalar for bolum in sayfa], ad)
+    if onbellek is not None:
+        onbellek.koy(anahtar, {'sayfa_sayisi': len(sayfalar), 'ogrenciler': ogrenciler})
+    return Karne(yol, ogrenciler, len(sayfalar), False)
+
+
+@olculen()
+def karneleri_oku(yollar, isci_sayisi=None, onbellek=None, sayfa_parcasi=8):
+    """PDF karnelerini oku; girdi sırasıyla Karne(yol, ogrenciler, sayfa_sayisi, onbellekten) üret
+
+    ogrenciler [(öğrenci, veriler)] listesidir. Önbellekte olmayan belgelerin
+    sayfaları en az sayfa_parcasi'lık parçalar halinde süreç havuzuna dağıtılır;
+    aynı anda en fazla 4 x isci_sayisi parça işlemde tutulur. isci_sayisi=1
+    havuz açmadan aynı süreçte çalışır.
+    """
+    isci_sayisi = isci_sayisi or os.cpu_count() or 1
+    if isci_sayisi == 1:
+        for yol in yollar:
+            anahtar, karne = _onbellekten(yol, onbellek)
+            yield karne or _karne_olustur(yol, anahtar, _sayfalari_coz(yol), onbellek)
+        return
+
+    with ProcessPoolExecutor(max_workers=isci_sayisi) as havuz:
+        bekleyenler = deque()
+        islemde = 0
+
+        def siradaki():
+            yol, anahtar, karne, gelecekler = bekleyenler.popleft()
+            if karne is None:
+                karne = _karne_olustur(yol, anahtar, [s for g in gelecekler for s in g.result()], onbellek)
+            return karne, len(gelecekler)
+
+        for yol in yollar:
+            anahtar, karne = _onbellekten(yol, onbellek)
+            gelecekler = []
+            if karne is None:
+                sayfa_sayisi = _sayfa_sayisi(yol)
+                # Her parça belgeyi yeniden açar; büyük belgeler işçi başına ~2 parçaya bölünür
+                parca = max(sayfa_parcasi, -(-sayfa_sayisi // (2 * isci_sayisi)))
+                gelecekler = [havuz.submit(_sayfalari_coz, yol, ilk, min(ilk + parca, sayfa_sayisi))
+                              for ilk in range(0, sayfa_sayisi, parca)]
+            bekleyenler.append((yol, anahtar, karne, gelecekler))
+            islemde += len(gelecekler)
+
+            # Sonuçlar girdi sırasıyla döner; işlemdeki parça sayısı sınırlı tutulur
+            while bekleyenler and (bekleyenler[0][2] is not None or islemde > 4 * isci_sayisi):
+                karne, tamamlanan = siradaki()
+                islemde -= tamamlanan
+                yield karne
+        while bekleyenler:
+            yield siradaki()[0]
+
+
+def karne_csv_yaz(karneler, cikti):
+    """Karnelerdeki öğrencileri kohort girdi biçiminde CSV'ye yaz; (öğrenci, sayfa) sayısını döndür
+
+    Karnede bulunmayan konuların hücreleri boş bırakılır.
+    """
+    alanlar = (('Doğru', 'dogru'), ('Yanlış', 'yanlis'), ('Boş', 'bos'), ('Soru', 'gercek_soru'))
+    ogrenci_sayisi = sayfa_sayisi = 0
+    with open(cikti, 'w', newline='', encoding='utf-8-sig') as f:
+        yazici = csv.writer(f)
+        yazici.writerow(['Öğrenci'] + [f"{ders} - {konu} {sonek}" for ders, konu in KONU_SIRASI for sonek, _ in alanlar])
+        for karne in karneler:
+            sayfa_sayisi += karne.sayfa_sayisi
+            for ogrenci, veriler in karne.ogrenciler:
+                satir = [ogrenci]
+                for ders, konu in KONU_SIRASI:
+                    kayit = veriler.get(ders, {}).get(konu)
+                    satir += [kayit[alan] for _, alan in alanlar] if kayit else [''] * len(alanlar)
+                yazici.writerow(satir)
+                ogrenci_sayisi += 1
+    return ogrenci_sayisi, sayfa_sayisi
+
+
+if __name__ == '__main__':
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="PDF karnelerini kohort girdi CSV'sine aktar")
+    parser.add_argument('girdi', help="PDF dosyası ya da PDF'lerin bulunduğu dizin")
+    parser.add_argument('cikti', help="CSV çıktı dosyası (python -m tyt.kohort girdisi)")
+    parser.add_argument('--isci', type=int, default=None, help="İşçi süreç sayısı")
+    parser.add_argument('--onbelleksiz', action='store_true', help="Karne önbelleğini kullanma")
+    args = parser.parse_args()
+
+    yollar = klasordeki_pdfler(args.girdi) if os.path.isdir(args.girdi) else [args.girdi]
+    onbellek = None if args.onbelleksiz else varsayilan_karne_onbellegi()
+    t0 = time.perf_counter()
+    ogrenci_sayisi, sayfa_sayisi = karne_csv_yaz(karneleri_oku(yollar, args.isci, onbellek), args.cikti)
+    sure = time.perf_counter() - t0
+    print(f"{len(yollar)} PDF, {sayfa_sayisi} sayfa, {ogrenci_sayisi} öğrenci aktarıldı "
+          f"({sure:.1f} s, {sayfa_sayisi / sure:.1f} sayfa/s)")
@@ -0,0 +1,47 @@
+"""Tam sayı kimlikli konu kataloğu
+
+KONU_VERILERI içe aktarmada bir kez düzleştirilir. Her konunun kimliği
+KONU_SIRASI'ndaki indeksidir; konuya bağlı sabitler (ders, zorluk, kategori,
+ortalama soru, önem ağırlığı) bu kimlikle indekslenen sütunlarda tutulur.
+NumPy sütunları toplu hesaplar içindir; aynı değerlerin liste karşılıkları tek
+konu erişimlerinde kullanılır (NumPy skaler indekslemesinden hızlıdır ve Python
+türleri döndürür). Bir dersin konuları KONU_SIRASI'nda ardışıktır.
+"""
+import numpy as np
+
+from .konular import KONU_VERILERI, ZAMAN_DILIMLERI, ZORLUK_KATSAYILARI
+
+DERSLER = list(KONU_VERILERI)
+DERS_INDEKSI = {ders: i for i, ders in enumerate(DERSLER)}
+ZORLUKLAR = list(ZORLUK_KATSAYILARI)
+KATEGORILER = list(dict.fromkeys(
+    [*ZAMAN_DILIMLERI, *(bilgi['kategori'] for konular in KONU_VERILERI.values() for bilgi in konular.values())]
+))
+
+# Ad <-> kimlik indeksleri
+KONU_SIRASI = [(ders, konu) for ders, konular in KONU_VERILERI.items() for konu in konular]
+KONU_INDEKSI = {ders_konu: i for i, ders_konu in enumerate(KONU_SIRASI)}
+KONU_ADLARI = [f"{ders} - {konu}" for ders, konu in KONU_SIRASI]
+KONU_AD_INDEKSI = {ad: i for i, ad in enumerate(KONU_ADLARI)}
+
+_BILGILER = [KONU_VERILERI[ders][konu] for ders, konu in KONU_SIRASI]
+
+# Tek konu erişimleri için listeler
+KONU_ZORLUKLARI = [bilgi['zorluk'] for bilgi in _BILGILER]
+KONU_KATEGORILERI = [bilgi['kategori'] for bilgi in _BILGILER]
+KONU_ORTALAMA_SORULARI = [bilgi['ortalama_soru'] for bilgi in _BILGILER]
+
+# Toplu hesaplar için sütunlar
+DERS_KODLARI = np.array([DERS_INDEKSI[ders] for ders, _ in KONU_SIRASI], dtype=np.int8)
+ZORLUK_KODLARI = np.array([ZORLUKLAR.index(z) for z in KONU_ZORLUKLARI], dtype=np.int8)
+KATEGORI_KODLARI = np.array([KATEGORILER.index(k) for k in KONU_KATEGORILERI], dtype=np.int8)
+ORTALAMA_SORU = np.array(KONU_ORTALAMA_SORULARI, dtype=np.int16)
+ZORLUK_KATSAYISI = np.array([ZORLUK_KATSAYILARI[z] for z in KONU_ZORLUKLARI], dtype=float)
+ONEM_AGIRLIGI = np.log1p(ORTALAMA_SORU.astype(float)) * 3
+
+# Dersin konu kimlikleri: DERS_KONULARI[ders] = range(ilk, son)
+DERS_BASLANGICLARI = np.flatnonzero(np.diff(DERS_KODLARI, prepend=-1))
+DERS_KONULARI = {
+    ders: range(bas, son)
+    for ders, bas, son in zip(DERSLER, DERS_BASLANGICLARI, [*DERS_BASLANGICLARI[1:], len(KONU_SIRASI)])
+}
@@ -0,0 +1,68 @@
+"""Ders bazlı kitap ve YouTube kaynak önerileri"""
+
+# Kitap ve YouTube kaynakları
+KITAP_ONERILERI = {
+    "Türkçe": {
+        "Kolay": ["3D Türkçe Soru Bankası (Başlangıç)", "Tonguç Paragrafik", "Palme Türkçe Konu Anlatımlı", "Karekök 0 Türkçe", "Bilgiseli Türkçe"],
+        "Orta": ["Limit Yayınları TYT Türkçe", "ÜçDörtBeş TYT Paragraf Soru Bankası", "Hız ve Renk Türkçe", "Apotemi Türkçe Soru Bankası", "Benim Hocam TYT Türkçe"]
+    },
+    "Matematik": {
+        "Kolay": ["Karekök 0 Matematik", "Tonguç Kampüs TYT Matematik", "3D Matematik Konu Anlatımı", "Kolay Matematik Serisi", "Palme TYT Temel Matematik"],
+        "Orta": ["ÜçDörtBeş TYT Matematik", "Limit Matematik", "Bilgiseli TYT Matematik", "Apotemi TYT Matematik", "Endemik TYT Matematik"]
+    },
+    "Geometri": {
+        "Kolay": ["Karekök 0 Geometri", "Tonguç Kampüs TYT Geometri", "3D Geometri Konu Anlatımı", "Kolay Geometri Serisi", "Palme TYT Geometri"],
+        "Orta": ["ÜçDörtBeş TYT Geometri", "Limit Geometri", "Bilgiseli TYT Geometri", "Apotemi TYT Geometri", "Endemik TYT Geometri"]
+    },
+    "Fizik": {
+        "Kolay": ["3D TYT Fizik", "Palme Fen Bilimleri Set", "Karekök 0 Fen Serisi", "Birey A Fen Bilimleri", "Kolay Fen Bilimleri"],
+        "Orta": ["ÜçDörtBeş TYT Fen Bilimleri", "Apotemi TYT Fen Set", "Hız ve Renk TYT Fizik", "Aydın TYT Fizik", "Benim Hocam Fen Seti"]
+    },
+    "Kimya": {
+        "Kolay": ["3D TYT Kimya", "Palme Fen Bilimleri Set", "Karekök 0 Fen Serisi", "Birey A Fen Bilimleri", "Kolay Fen Bilimleri"],
+        "Orta": ["ÜçDörtBeş TYT Fen Bilimleri", "Apotemi TYT Fen Set", "Hız ve Renk TYT Kimya", "Aydın TYT Kimya", "Benim Hocam Fen Seti"]
+    },
+    "Biyoloji": {
+        "Kolay": ["3D TYT Biyoloji", "Palme Fen Bilimleri Set", "Karekök 0 Fen Serisi", "Birey A Fen Bilimleri", "Kolay Fen Bilimleri"],
+        "Orta": ["ÜçDörtBeş TYT Fen Bilimleri", "Apotemi TYT Fen Set", "Hız ve Renk TYT Biyoloji", "Aydın TYT Biyoloji", "Benim Hocam Fen Seti"]
+    },
+    "Tarih": {
+        "Kolay": ["Karekök 0 Sosyal Bilimler", "3D TYT Sosyal Bilimler", "Tonguç TYT Sosyal", "Palme Sosyal Bilimler", "Hız ve Renk TYT Sosyal"],
+        "Orta": ["ÜçDörtBeş TYT Sosyal Bilimler", "Limit Yayınları TYT Sosyal", "Bilgiseli Sosyal Bilimler", "Endemik Sosyal Bilimler", "Karekök Sosyal Bilimler"]
+    },
+    "Coğrafya": {
+        "Kolay": ["Karekök 0 Sosyal Bilimler", "3D TYT Sosyal Bilimler", "Tonguç TYT Sosyal", "Palme Sosyal Bilimler", "Hız ve Renk TYT Sosyal"],
+        "Orta": ["ÜçDörtBeş TYT Sosyal Bilimler", "Limit Yayınları TYT Sosyal", "Bilgiseli Sosyal Bilimler", "Endemik Sosyal Bilimler", "Karekök Sosyal Bilimler"]
+    },
+    "Felsefe": {
+        "Kolay": ["Karekök 0 Sosyal Bilimler", "3D TYT Sosyal Bilimler", "Tonguç TYT Sosyal", "Palme Sosyal Bilimler", "Hız ve Renk TYT Sosyal"],
+        "Orta": ["ÜçDörtBeş TYT Sosyal Bilimler", "Limit Yayınları TYT Sosyal", "Bilgiseli Sosyal Bilimler", "Endemik Sosyal Bilimler", "Karekök Sosyal Bilimler"]
+    },
+    "Din Kültürü ve Ahlak Bilgisi": {
+        "Kolay": ["Karekök 0 Sosyal Bilimler", "3D TYT Sosyal Bilimler", "Tonguç TYT Sosyal", "Palme Sosyal Bilimler", "Hız ve Renk TYT Sosyal"],
+        "Orta": ["ÜçDörtBeş TYT Sosyal Bilimler", "Limit Yayınları TYT Sosyal", "Bilgiseli Sosyal Bilimler", "Endemik Sosyal Bilimler", "Karekök Sosyal Bilimler"]
+    }
+}
+
+YOUTUBE_KANALLARI = {
+    "Türkçe": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Matematik Sevdası", "Öğretmen Akademisi"],
+    "Matematik": ["Tonguç Akademi", "Matematik Sevdası", "Benim Hocam", "Ders Vakti", "Matematik Dünyası"],
+    "Geometri": ["Tonguç Akademi", "Matematik Sevdası", "Benim Hocam", "Ders Vakti", "Geometri Dünyası"],
+    "Fizik": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Fizik Dünyası", "Fen Bilimleri Akademisi"],
+    "Kimya": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Kimya Dünyası", "Fen Bilimleri Akademisi"],
+    "Biyoloji": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Biyoloji Dünyası", "Fen Bilimleri Akademisi"],
+    "Tarih": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Tarih Dünyası", "Sosyal Bilimler Akademisi"],
+    "Coğrafya": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Coğrafya Dünyası", "Sosyal Bilimler Akademisi"],
+    "Felsefe": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Felsefe Dünyası", "Sosyal Bilimler Akademisi"],
+    "Din Kültürü ve Ahlak Bilgisi": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Din Kültürü Akademisi", "Sosyal Bilimler Akademisi"]
+}
+
+
+def youtube_video_ara(ders_adi, konu_adi):
+    """YouTube'dan video ara"""
+    return [
+        f"TYT {ders_adi} {konu_adi} Konu Anlatımı",
+        f"TYT {ders_adi} {konu_adi} Soru Çözümü",
+        f"TYT {ders_adi} {konu_adi} Tekrar Videosu",
+        f"TYT {ders_adi} {konu_adi} Pratik Yöntemler"
+    ]
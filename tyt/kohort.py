@@ -0,0 +1,518 @@
+"""Sınıf (kohort) bazında toplu deneme analizi ve program oluşturma
+
+Deneme sonuçları her satırda bir öğrenci olacak şekilde CSV veya Excel
+dosyası olarak gelir. Dosya parça parça okunur; her parça toplu puanlayıcıdan
+geçirilir ve sonuçlar parça bitince çıktıya yazılır. Böylece bellek kullanımı
+dosya boyutundan bağımsız olarak parça boyutuyla sınırlı kalır.
+
+Beklenen sütunlar:
+    Öğrenci                 (ilk sütun veya "Öğrenci"/"ogrenci" başlıklı sütun)
+    <Ders> - <Konu> Doğru
+    <Ders> - <Konu> Yanlış
+    <Ders> - <Konu> Boş     (isteğe bağlı)
+    <Ders> - <Konu> Soru    (isteğe bağlı, denemedeki soru sayısı)
+
+Boş verilmezse Soru - Doğru - Yanlış olarak, Soru verilmezse Doğru + Yanlış
++ Boş olarak hesaplanır; ikisi de yoksa konunun ortalama soru sayısı
+kullanılır. Dosyada hiç sütunu olmayan konular denemede yok sayılır.
+Değerler elle girişteki sınırlara çekilir (giris.kayit_dogrula); sayıya
+çevrilemeyen hücresi olan satırlar atlanır ve atlananlar listesiyle
+bildirilir.
+
+Program oluşturma parçaları süreç havuzuna dağıtır; işçiler sözlük listeleri
+yerine sıkıştırılmış NumPy dizileri (ProgramParcasi) döndürür.
+"""
+import csv
+import os
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from operator import itemgetter
+
+import numpy as np
+
+from .analiz import analiz_et, hesapla_oncelik_puani_toplu
+from .dagitim import saat_dagit_toplu
+from .giris import MAKS_SORU, kayitlari_dogrula
+from .projeksiyon import VARSAYILAN_CEKILIS, VARSAYILAN_GUVEN, projeksiyon_ozeti, senaryo_netleri
+from .katalog import (
+    DERS_BASLANGICLARI, DERS_KODLARI, DERSLER, KONU_AD_INDEKSI, KONU_ADLARI, KONU_KATEGORILERI, KONU_SIRASI,
+    KONU_ZORLUKLARI, ORTALAMA_SORU
+)
+from .konular import ZAMAN_DILIMLERI
+from .program import GUNLUK_DILIM_SIRASI, program_atamalari
+
+ALAN_SONEKLERI = {'Doğru': 'dogru', 'Yanlış': 'yanlis', 'Boş': 'bos', 'Soru': 'gercek_soru'}
+OGRENCI_SUTUNLARI = ('Öğrenci', 'ogrenci', 'Ogrenci', 'öğrenci')
+
+# Sıkıştırılmış programlarda zaman dilimleri bu listedeki indeksleriyle tutulur
+ZAMAN_DILIMI_LISTESI = sorted(
+    {dilim for dilimler in ZAMAN_DILIMLERI.values() for dilim in dilimler} | set(GUNLUK_DILIM_SIRASI)
+)
+_ZAMAN_DILIMI_INDEKSI = {dilim: i for i, dilim in enumerate(ZAMAN_DILIMI_LISTESI)}
+
+# Bir parça öğrenci: sayı dizileri (öğrenci x konu) KONU_SIRASI düzenindedir,
+# konular ise dosyada sütunu bulunan konu indeksleridir.
+Parca = namedtuple('Parca', 'ogrenciler dogru yanlis bos soru konular')
+
+# Bir parçanın programları: s. öğrencinin atamaları ofsetler[s]:ofsetler[s + 1]
+# aralığındadır (gün indeksi, ZAMAN_DILIMI_LISTESI indeksi, KONU_SIRASI indeksi).
+ProgramParcasi = namedtuple('ProgramParcasi', 'ofsetler gun dilim konu')
+
+
+def _satirlari_oku(yol):
+    """CSV veya Excel dosyasının satırlarını (başlık dahil) tek tek üret"""
+    if os.path.splitext(yol)[1].lower() in ('.xlsx', '.xlsm'):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(yol, read_only=True, data_only=True)
+        try:
+            for satir in wb.worksheets[0].iter_rows(values_only=True):
+                yield ['' if v is None else v for v in satir]
+        finally:
+            wb.close()
+    else:
+        with open(yol, newline='', encoding='utf-8-sig') as f:
+            yield from csv.reader(f)
+
+
+def _sutun_eslemesi(baslik):
+    """Başlık satırından öğrenci sütununu ve (sütun, alan, konu) eşlemesini çıkar"""
+    baslik = [str(b).strip() for b in baslik]
+    ogrenci_sutunu = next((i for i, b in enumerate(baslik) if b in OGRENCI_SUTUNLARI), 0)
+
+    eslesme = {alan: [] for alan in ALAN_SONEKLERI.values()}
+    for sutun, ad in enumerate(baslik):
+        konu_adi, _, sonek = ad.rpartition(' ')
+        if sonek in ALAN_SONEKLERI and konu_adi in KONU_AD_INDEKSI:
+            eslesme[ALAN_SONEKLERI[sonek]].append((sutun, KONU_AD_INDEKSI[konu_adi]))
+
+    if not eslesme['dogru'] and not eslesme['yanlis']:
+        raise ValueError("Dosyada '<Ders> - <Konu> Doğru/Yanlış' biçiminde sütun bulunamadı")
+
+    return ogrenci_sutunu, eslesme
+
+
+def _sayilari_coz(satirlar, sutunlar):
+    """Satırların sayı sütunlarını float matrise çevir; (sayilar, gecerli satırlar) döndür
+
+    Boş hücre 0 sayılır. Sayıya çevrilemeyen ya da sonlu olmayan hücresi olan
+    satırlar geçersizdir.
+    """
+    al = itemgetter(*sutunlar)
+    ham = np.array([al(satir) for satir in satirlar], dtype=object).reshape(len(satirlar), len(sutunlar))
+    ham[ham == ''] = 0
+    try:
+        sayilar = ham.astype(float)
+    except (TypeError, ValueError):
+        # Hatalı hücreli satırları bulmak için satır satır çevir
+        sayilar = np.full(ham.shape, np.nan)
+        for i, satir in enumerate(ham):
+            try:
+                sayilar[i] = satir.astype(float)
+            except (TypeError, ValueError):
+                pass
+    return sayilar, np.isfinite(sayilar).all(axis=1)
+
+
+def _parca_olustur(ogrenciler, sayilar, eslesme):
+    """Sayı matrisini konu dizilerine çevir, eksik Boş/Soru alanlarını tamamla ve sınırlara çek"""
+    n = len(ogrenciler)
+    sayilar = np.clip(sayilar, 0, MAKS_SORU).astype(np.int32)
+
+    diziler = {}
+    j = 0
+    for alan, alan_sutunlari in eslesme.items():
+        dizi = np.zeros((n, len(KONU_SIRASI)), dtype=np.int32)
+        for _, konu in alan_sutunlari:
+            dizi[:, konu] = sayilar[:, j]
+            j += 1
+        diziler[alan] = dizi
+
+    dogru, yanlis, bos, soru = (diziler[a] for a in ('dogru', 'yanlis', 'bos', 'gercek_soru'))
+    bos_var = np.zeros(len(KONU_SIRASI), dtype=bool)
+    bos_var[[k for _, k in eslesme['bos']]] = True
+    soru_var = np.zeros(len(KONU_SIRASI), dtype=bool)
+    soru_var[[k for _, k in eslesme['gercek_soru']]] = True
+    konular = np.zeros(len(KONU_SIRASI), dtype=bool)
+    for sutunlar in eslesme.values():
+        konular[[k for _, k in sutunlar]] = True
+
+    # Soru yoksa: Boş varsa D+Y+B, o da yoksa ortalama soru sayısı
+    soru_eksik = konular & ~soru_var
+    soru[:, soru_eksik & bos_var] = (dogru + yanlis + bos)[:, soru_eksik & bos_var]
+    sadece_dy = soru_eksik & ~bos_var
+    soru[:, sadece_dy] = np.maximum(ORTALAMA_SORU[sadece_dy], (dogru + yanlis)[:, sadece_dy])
+
+    # Boş yoksa Soru - Doğru - Yanlış; sonra elle girişteki sınırlar (Doğru + Yanlış <= Soru <= MAKS_SORU)
+    dogru, yanlis, bos, soru = kayitlari_dogrula(soru, dogru, yanlis)
+
+    return Parca(ogrenciler, dogru, yanlis, bos, soru, np.flatnonzero(konular))
+
+
+def parcalari_oku(yol, parca_boyutu=5000, atlananlar=None):
+    """Dosyayı parça parça oku; her parça için Parca üret
+
+    Sayıya çevrilemeyen hücresi olan satırlar parçaya alınmaz; atlananlar
+    (liste) verilirse her biri için (dosya satır no, öğrenci) eklenir.
+    """
+    satirlar = _satirlari_oku(yol)
+    baslik = next(satirlar, None)
+    if baslik is None:
+        return
+    ogrenci_sutunu, eslesme = _sutun_eslemesi(baslik)
+    sutunlar = [sutun for alan in eslesme.values() for sutun, _ in alan]
+    genislik = len(baslik)
+
+    def parca_olustur(ogrenciler, tampon, satir_nolari):
+        sayilar, gecerli = _sayilari_coz(tampon, sutunlar)
+        if not gecerli.all():
+            if atlananlar is not None:
+                atlananlar.extend((satir_nolari[i], ogrenciler[i]) for i in np.flatnonzero(~gecerli))
+            ogrenciler = [o for o, g in zip(ogrenciler, gecerli) if g]
+            sayilar = sayilar[gecerli]
+        return _parca_olustur(ogrenciler, sayilar, eslesme) if ogrenciler else None
+
+    ogrenciler, tampon, satir_nolari = [], [], []
+    for satir_no, satir in enumerate(satirlar, start=2):
+        if all(v in ('', None) for v in satir):
+            continue
+        if len(satir) < genislik:
+            satir = list(satir) + [''] * (genislik - len(satir))
+        ogrenciler.append(str(satir[ogrenci_sutunu]))
+        tampon.append(satir)
+        satir_nolari.append(satir_no)
+        if len(tampon) >= parca_boyutu:
+            parca = parca_olustur(ogrenciler, tampon, satir_nolari)
+            if parca is not None:
+                yield parca
+            ogrenciler, tampon, satir_nolari = [], [], []
+    if tampon:
+        parca = parca_olustur(ogrenciler, tampon, satir_nolari)
+        if parca is not None:
+            yield parca
+
+
+def parca_verilere(parca):
+    """Parcadaki her öğrenci için (öğrenci, veriler) üret; veriler uygulamadaki yapıdadır"""
+    adlar = [KONU_SIRASI[i] for i in parca.konular]
+    sutunlar = [parca.dogru, parca.yanlis, parca.bos, parca.soru]
+    dogru, yanlis, bos, soru = (dizi[:, parca.konular].tolist() for dizi in sutunlar)
+
+    for s, ogrenci in enumerate(parca.ogrenciler):
+        veriler = {}
+        for j, (ders, konu) in enumerate(adlar):
+            veriler.setdefault(ders, {})[konu] = {
+                'dogru': dogru[s][j],
+                'yanlis': yanlis[s][j],
+                'bos': bos[s][j],
+                'gercek_soru': soru[s][j]
+            }
+        yield ogrenci, veriler
+
+
+def parca_puanla(parca):
+    """Parcanın tüm öncelik puanlarını hesapla; analize girmeyen konular NaN olur"""
+    puanlar = hesapla_oncelik_puani_toplu(parca.yanlis, parca.bos)
+    analizde = np.zeros(puanlar.shape, dtype=bool)
+    analizde[:, parca.konular] = (parca.dogru + parca.yanlis + parca.bos)[:, parca.konular] > 0
+    puanlar[~analizde] = np.nan
+    return puanlar
+
+
+def parca_ozeti(parca):
+    """hesapla_performans_ozeti'nin parça üzerinde vektörel karşılığı
+
+    Sonuç sözlüğündeki her değer öğrenci başına bir dizi, 'Ders Net' ise
+    (öğrenci x ders) matrisidir. Sayılar hesapla_performans_ozeti ile aynıdır.
+    """
+    toplam = parca.soru.sum(axis=1)
+    dogru = parca.dogru.sum(axis=1)
+    yanlis = parca.yanlis.sum(axis=1)
+    net = dogru - (yanlis / 4)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        basari = np.where(toplam > 0, dogru / toplam * 100, 0)
+
+    ders_dogru = np.add.reduceat(parca.dogru, DERS_BASLANGICLARI, axis=1)
+    ders_yanlis = np.add.reduceat(parca.yanlis, DERS_BASLANGICLARI, axis=1)
+
+    return {
+        'Toplam Soru': toplam,
+        'Toplam Doğru': dogru,
+        'Toplam Yanlış': yanlis,
+        'Toplam Boş': parca.bos.sum(axis=1),
+        'Net': net,
+        'Max Net': toplam,
+        'Kalan Net': toplam - net,
+        'Başarı Oranı': basari,
+        'Ders Net': ders_dogru - (ders_yanlis / 4)
+    }
+
+@contextmanager
+def _sonuc_yazici(yol, basliklar):
+    """CSV veya Excel (write-only) çıktısına satır yazan fonksiyon döndür"""
+    if os.path.splitext(yol)[1].lower() == '.xlsx':
+        from openpyxl import Workbook
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Kohort Analizi")
+        ws.append(basliklar)
+        yield ws.append
+        wb.save(yol)
+    else:
+        with open(yol, 'w', newline='', encoding='utf-8') as f:
+            yazici = csv.writer(f)
+            yazici.writerow(basliklar)
+            yield yazici.writerow
+
+
+def kohort_analiz(girdi, cikti, parca_boyutu=5000, oncelikli_konu_sayisi=5, atlananlar=None):
+    """Girdi dosyasındaki her öğrenciyi analiz et ve özetleri çıktıya parça parça yaz
+
+    Her öğrenci için hesapla_performans_ozeti sonuçları (parca_ozeti ile
+    parça başına tek geçişte), ders netleri ve analiz_et'e göre en öncelikli
+    konular (toplu puanlayıcıyla) yazılır. İşlenen öğrenci sayısını
+    döndürür; atlanan satırlar parcalari_oku'daki gibi atlananlar'a eklenir.
+    """
+    basliklar = (
+        ['Öğrenci', 'Toplam Soru', 'Toplam Doğru', 'Toplam Yanlış', 'Toplam Boş',
+         'Net', 'Max Net', 'Kalan Net', 'Başarı Oranı']
+        + [f"{ders} Net" for ders in DERSLER]
+        + ['Öncelikli Konular']
+    )
+
+    islenen = 0
+    with _sonuc_yazici(cikti, basliklar) as satir_yaz:
+        for parca in parcalari_oku(girdi, parca_boyutu, atlananlar):
+            puanlar = parca_puanla(parca)
+            # Eşit puanlarda analiz_et + sorted ile aynı sırayı korumak için kararlı sıralama
+            sira = np.argsort(-np.nan_to_num(puanlar, nan=-np.inf), axis=1, kind='stable')
+            ilk = sira[:, :oncelikli_konu_sayisi]
+            gecerli = ~np.isnan(np.take_along_axis(puanlar, ilk, axis=1))
+            ilk, gecerli = ilk.tolist(), gecerli.tolist()
+
+            ozet = parca_ozeti(parca)
+            genel = list(zip(*(ozet[alan].tolist() for alan in basliklar[1:9])))
+            ders_net = ozet['Ders Net'].tolist()
+            ders_var = np.unique(DERS_KODLARI[parca.konular]).tolist()
+
+            for s, ogrenci in enumerate(parca.ogrenciler):
+                oncelikli = [KONU_ADLARI[i] for i, g in zip(ilk[s], gecerli[s]) if g]
+                ders_netleri = [''] * len(DERSLER)
+                for d in ders_var:
+                    ders_netleri[d] = ders_net[s][d]
+                satir_yaz([ogrenci, *genel[s]] + ders_netleri + ['; '.join(oncelikli)])
+            islenen += len(parca.ogrenciler)
+
+    return islenen
+
+
+def kohort_saat_dagilimi(girdi, cikti, toplam_saat, parca_boyutu=5000, atlananlar=None):
+    """Her öğrencinin toplam_saat'ini net kazancına göre konulara dağıtıp çıktıya yaz
+
+    Her satır saat alan bir öğrenci-konu çiftidir; dağılım parça başına
+    saat_dagit_toplu ile tek geçişte hesaplanır. İşlenen öğrenci sayısını döndürür.
+    """
+    islenen = 0
+    with _sonuc_yazici(cikti, ['Öğrenci', 'Ders', 'Konu', 'Saat', 'Beklenen Net']) as satir_yaz:
+        for parca in parcalari_oku(girdi, parca_boyutu, atlananlar):
+            saatler, kazanclar = saat_dagit_toplu(parca.dogru, parca.yanlis, parca.bos, toplam_saat)
+            ogrenci, konu = np.nonzero(saatler > 0)
+            for s, k, saat, kazanc in zip(ogrenci.tolist(), konu.tolist(),
+                                          saatler[ogrenci, konu].round(2).tolist(),
+                                          kazanclar[ogrenci, konu].round(3).tolist()):
+                satir_yaz([parca.ogrenciler[s], *KONU_SIRASI[k], saat, kazanc])
+            islenen += len(parca.ogrenciler)
+
+    return islenen
+
+
+def kohort_net_projeksiyonu(girdi, cikti, toplam_saat, cekilis_sayisi=VARSAYILAN_CEKILIS,
+                            guven=VARSAYILAN_GUVEN, parca_boyutu=5000, atlananlar=None):
+    """Her öğrencinin bugünkü ve saat dağılımı sonrası net projeksiyonunu çıktıya yaz
+
+    Saatler saat_dagit_toplu ile dağıtılır; iki senaryo parça başına
+    senaryo_netleri ile simüle edilir. İşlenen öğrenci sayısını döndürür.
+    """
+    yuzde = f"%{guven * 100:.0f}"
+    basliklar = ['Öğrenci']
+    for durum in ('Bugünkü', 'Planlı'):
+        basliklar += [f"{durum} Net", f"{durum} Net {yuzde} Alt", f"{durum} Net {yuzde} Üst"]
+
+    islenen = 0
+    with _sonuc_yazici(cikti, basliklar) as satir_yaz:
+        for parca in parcalari_oku(girdi, parca_boyutu, atlananlar):
+            saatler, _ = saat_dagit_toplu(parca.dogru, parca.yanlis, parca.bos, toplam_saat)
+            ozetler = [
+                projeksiyon_ozeti(netler, guven)
+                for netler in senaryo_netleri(parca.dogru, parca.yanlis, parca.bos, [None, saatler], cekilis_sayisi)
+            ]
+            sutunlar = [ozet[alan].round(2).tolist() for ozet in ozetler for alan in ('ortalama', 'alt', 'ust')]
+            for ogrenci, degerler in zip(parca.ogrenciler, zip(*sutunlar)):
+                satir_yaz([ogrenci, *degerler])
+            islenen += len(parca.ogrenciler)
+
+    return islenen
+
+
+def _parca_programi(parca, gun_sayisi, gunluk_saat):
+    """İşçi süreçte: parçadaki her öğrenci için programı oluşturup sıkıştır"""
+    ofsetler = [0]
+    gun, dilim, konu = [], [], []
+    for _, veriler in parca_verilere(parca):
+        analiz = analiz_et(veriler)
+        for g, zaman_dilimi, konu_adi in program_atamalari(analiz, gun_sayisi, gunluk_saat):
+            gun.append(g)
+            dilim.append(_ZAMAN_DILIMI_INDEKSI[zaman_dilimi])
+            konu.append(KONU_AD_INDEKSI[konu_adi])
+        ofsetler.append(len(gun))
+
+    return ProgramParcasi(
+        np.array(ofsetler, dtype=np.int64),
+        np.array(gun, dtype=np.int16),
+        np.array(dilim, dtype=np.int8),
+        np.array(konu, dtype=np.int16)
+    )
+
+
+def kohort_programlari(parcalar, gun_sayisi, gunluk_saat, isci_sayisi=None):
+    """Parçaların programlarını süreç havuzunda oluştur; (parca, ProgramParcasi) üret
+
+    Sonuçlar girdi sırasıyla döner ve işçi sayısından bağımsızdır. Aynı anda
+    en fazla 2 x isci_sayisi parça işlemde tutulur, böylece büyük dosyalarda
+    bellek sınırlı kalır. isci_sayisi=1 havuz açmadan aynı süreçte çalışır.
+    """
+    isci_sayisi = isci_sayisi or os.cpu_count() or 1
+    if isci_sayisi == 1:
+        for parca in parcalar:
+            yield parca, _parca_programi(parca, gun_sayisi, gunluk_saat)
+        return
+
+    with ProcessPoolExecutor(max_workers=isci_sayisi) as havuz:
+        bekleyenler = deque()
+        for parca in parcalar:
+            bekleyenler.append((parca, havuz.submit(_parca_programi, parca, gun_sayisi, gunluk_saat)))
+            if len(bekleyenler) >= 2 * isci_sayisi:
+                parca, gelecek = bekleyenler.popleft()
+                yield parca, gelecek.result()
+        while bekleyenler:
+            parca, gelecek = bekleyenler.popleft()
+            yield parca, gelecek.result()
+
+
+def _program_degerleri(parca, program_parcasi, s, tarihler, puanlar):
+    """s. öğrencinin atamalarını program sütunları sırasıyla değer demetleri olarak üret"""
+    bas, son = program_parcasi.ofsetler[s], program_parcasi.ofsetler[s + 1]
+    puan = puanlar[s].tolist()
+    dogru, yanlis, bos = parca.dogru[s].tolist(), parca.yanlis[s].tolist(), parca.bos[s].tolist()
+
+    for g, d, k in zip(program_parcasi.gun[bas:son].tolist(),
+                       program_parcasi.dilim[bas:son].tolist(),
+                       program_parcasi.konu[bas:son].tolist()):
+        ders, konu = KONU_SIRASI[k]
+        yield (g + 1, tarihler[g], ZAMAN_DILIMI_LISTESI[d], ders, konu, puan[k],
+               KONU_ZORLUKLARI[k], KONU_KATEGORILERI[k], dogru[k], yanlis[k], bos[k])
+
+
+def program_satirlari(parca, program_parcasi, s, baslangic_tarihi, puanlar=None):
+    """Sıkıştırılmış programdan s. öğrencinin program_olustur_zaman_dilimli çıktısını geri kur"""
+    from .disa_aktarim import PROGRAM_BASLIKLARI
+
+    if puanlar is None:
+        puanlar = parca_puanla(parca)
+    gun_sayisi = int(program_parcasi.gun.max()) + 1 if len(program_parcasi.gun) else 0
+    tarihler = [(baslangic_tarihi + timedelta(days=g)).strftime('%d.%m.%Y') for g in range(gun_sayisi)]
+    return [dict(zip(PROGRAM_BASLIKLARI, degerler))
+            for degerler in _program_degerleri(parca, program_parcasi, s, tarihler, puanlar)]
+
+
+def kohort_ogrenci_programlari(girdi, baslangic_tarihi, gun_sayisi, gunluk_saat,
+                               isci_sayisi=None, parca_boyutu=256, atlananlar=None):
+    """Her öğrenci için (öğrenci, program satırları) üret
+
+    Programlar kohort_programlari ile süreç havuzunda oluşturulur; satırlar
+    disa_aktarim.PROGRAM_BASLIKLARI sırasında değer demetleridir ve tembel
+    üretilir. Toplu dışa aktarma fonksiyonlarına doğrudan verilebilir.
+    """
+    tarihler = [(baslangic_tarihi + timedelta(days=g)).strftime('%d.%m.%Y') for g in range(gun_sayisi)]
+    parcalar = parcalari_oku(girdi, parca_boyutu, atlananlar)
+    for parca, program in kohort_programlari(parcalar, gun_sayisi, gunluk_saat, isci_sayisi):
+        puanlar = parca_puanla(parca)
+        for s, ogrenci in enumerate(parca.ogrenciler):
+            yield ogrenci, _program_degerleri(parca, program, s, tarihler, puanlar)
+
+
+def kohort_program_yaz(girdi, cikti, baslangic_tarihi, gun_sayisi, gunluk_saat,
+                       isci_sayisi=None, parca_boyutu=256, atlananlar=None):
+    """Girdi dosyasındaki her öğrencinin programını paralel oluşturup CSV'ye yaz
+
+    Her satır bir öğrenci-zaman dilimi atamasıdır. Yazılan öğrenci sayısını döndürür.
+    """
+    tarihler = [(baslangic_tarihi + timedelta(days=g)).strftime('%d.%m.%Y') for g in range(gun_sayisi)]
+
+    islenen = 0
+    with open(cikti, 'w', newline='', encoding='utf-8') as f:
+        yazici = csv.writer(f)
+        yazici.writerow(['Öğrenci', 'Gün', 'Tarih', 'Zaman', 'Ders', 'Konu'])
+        parcalar = parcalari_oku(girdi, parca_boyutu, atlananlar)
+        for parca, program in kohort_programlari(parcalar, gun_sayisi, gunluk_saat, isci_sayisi):
+            ofsetler = program.ofsetler.tolist()
+            gun, dilim, konu = program.gun.tolist(), program.dilim.tolist(), program.konu.tolist()
+            for s, ogrenci in enumerate(parca.ogrenciler):
+                yazici.writerows(
+                    (ogrenci, gun[j] + 1, tarihler[gun[j]], ZAMAN_DILIMI_LISTESI[dilim[j]], *KONU_SIRASI[konu[j]])
+                    for j in range(ofsetler[s], ofsetler[s + 1])
+                )
+            islenen += len(parca.ogrenciler)
+
+    return islenen
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Kohort deneme sonuçlarını toplu analiz et")
+    parser.add_argument('girdi', help="CSV veya Excel girdi dosyası")
+    parser.add_argument('cikti', help="CSV veya Excel çıktı dosyası")
+    parser.add_argument('--parca', type=int, default=5000, help="Parça başına öğrenci sayısı")
+    parser.add_argument('--program', type=int, metavar='GUN',
+                        help="Analiz yerine GUN günlük program oluştur")
+    parser.add_argument('--dagilim', type=int, metavar='GUN',
+                        help="Analiz yerine GUN günlük toplam saatin konulara net kazancına göre dağılımını yaz")
+    parser.add_argument('--projeksiyon', type=int, metavar='GUN',
+                        help="Analiz yerine GUN günlük plan öncesi ve sonrası net projeksiyonunu yaz")
+    parser.add_argument('--cekilis', type=int, default=VARSAYILAN_CEKILIS,
+                        help="Öğrenci başına simüle edilen sınav sayısı (--projeksiyon ile)")
+    parser.add_argument('--saat', type=int, default=4,
+                        help="Günlük çalışma saati (--program, --dagilim veya --projeksiyon ile)")
+    parser.add_argument('--isci', type=int, default=None, help="İşçi süreç sayısı (--program ile)")
+    parser.add_argument('--excel', action='store_true',
+                        help="Programları öğrenci başına biçimli Excel olarak yaz (--program ile; "
+                             "çıktı .zip ise öğrenci başına dosya, .xlsx ise öğrenci başına sayfa)")
+    args = parser.parse_args()
+    atlananlar = []
+
+    if args.program and args.excel:
+        from .disa_aktarim import sinif_excel_akis, toplu_excel_zip
+
+        yazici = toplu_excel_zip if args.cikti.lower().endswith('.zip') else sinif_excel_akis
+        programlar = kohort_ogrenci_programlari(args.girdi, datetime.now(), args.program, args.saat,
+                                                args.isci, args.parca, atlananlar)
+        print(f"{yazici(programlar, args.cikti)} öğrencinin programı dışa aktarıldı")
+    elif args.program:
+        sayi = kohort_program_yaz(args.girdi, args.cikti, datetime.now(), args.program, args.saat,
+                                  args.isci, args.parca, atlananlar)
+        print(f"{sayi} öğrencinin programı oluşturuldu")
+    elif args.projeksiyon:
+        sayi = kohort_net_projeksiyonu(args.girdi, args.cikti, args.projeksiyon * args.saat, args.cekilis,
+                                       parca_boyutu=args.parca, atlananlar=atlananlar)
+        print(f"{sayi} öğrencinin net projeksiyonu oluşturuldu")
+    elif args.dagilim:
+        sayi = kohort_saat_dagilimi(args.girdi, args.cikti, args.dagilim * args.saat, args.parca, atlananlar)
+        print(f"{sayi} öğrencinin saat dağılımı oluşturuldu")
+    else:
+        print(f"{kohort_analiz(args.girdi, args.cikti, args.parca, atlananlar=atlananlar)} öğrenci analiz edildi")
+
+    for satir_no, ogrenci in atlananlar:
+        print(f"Atlandı: {satir_no}. satır ({ogrenci}), sayıya çevrilemeyen değer")
@@ -0,0 +1,101 @@
+"""TYT konu verileri, zaman dilimleri ve zorluk katsayıları"""
+
+# Güncellenmiş Konu verileri (yeni soru sayılarıyla)
+KONU_VERILERI = {
+"Türkçe": {
+    "Paragraf":              { "zorluk": "Zor",   "ortalama_soru": 23, "kategori": "Dil" },
+    "Cümlede Anlam":         { "zorluk": "Orta",  "ortalama_soru": 5,  "kategori": "Dil" },
+    "Sözcükte Anlam":        { "zorluk": "Orta",  "ortalama_soru": 3,  "kategori": "Dil" },
+    "Dil Bilgisi":           { "zorluk": "Orta",  "ortalama_soru": 4,  "kategori": "Ezber" },
+    "Yazım Kuralları":       { "zorluk": "Kolay", "ortalama_soru": 2,  "kategori": "Ezber" },
+    "Noktalama İşaretleri":  { "zorluk": "Kolay", "ortalama_soru": 2,  "kategori": "Ezber" },
+    "Ses Bilgisi":           { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Ezber" }
+  },
+  "Matematik": {
+    "Problemler":            { "zorluk": "Zor",   "ortalama_soru": 12, "kategori": "Zor" },
+    "Temel Kavramlar":       { "zorluk": "Orta",  "ortalama_soru": 3,  "kategori": "Zor" },
+    "Sayı Basamakları":      { "zorluk": "Orta",  "ortalama_soru": 2,  "kategori": "Zor" },
+    "Rasyonel Sayılar":      { "zorluk": "Orta",  "ortalama_soru": 2,  "kategori": "Zor" },
+    "Mutlak Değer":          { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Zor" },
+    "Üslü Sayılar":          { "zorluk": "Orta",  "ortalama_soru": 2,  "kategori": "Zor" },
+    "Köklü Sayılar":         { "zorluk": "Orta",  "ortalama_soru": 2,  "kategori": "Zor" },
+    "Oran-Orantı":           { "zorluk": "Orta",  "ortalama_soru": 2,  "kategori": "Zor" },
+    "Denklem Çözme":         { "zorluk": "Orta",  "ortalama_soru": 2,  "kategori": "Zor" },
+    "Kümeler":               { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Zor" },
+    "Fonksiyonlar":          { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Zor" }
+  },
+  "Geometri": {
+    "Açılar & Üçgenler":    { "zorluk": "Zor",   "ortalama_soru": 4,  "kategori": "Zor" },
+    "Katı Cisimler":         { "zorluk": "Zor",   "ortalama_soru": 2,  "kategori": "Zor" },
+    "Dikdörtgen":            { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Zor" },
+    "Daire":                 { "zorluk": "Zor",   "ortalama_soru": 2,  "kategori": "Zor" },
+    "Analitik Geometri":     { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Zor" }
+  },
+  "Tarih": {
+    "İlk ve Orta Çağ":       { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
+    "İslamiyetin Kabulü":    { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
+    "Osmanlı":               { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Kolay" },
+    "Milli Mücadele":        { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Kolay" },
+    "Atatürkçülük":          { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" }
+  },
+  "Coğrafya": {
+    "İklim":                 { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Kolay" },
+    "Yeryüzü Şekilleri":     { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Kolay" },
+    "Nüfus ve Yerleşme":     { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
+    "Harita":                { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
+    "Ekonomi":               { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Kolay" }
+  },
+  "Felsefe": {
+    "Felsefenin Konusu":     { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Kolay" },
+    "Bilgi Felsefesi":       { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Kolay" },
+    "Ahlak Felsefesi":       { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Kolay" },
+    "Varlık Felsefesi":      { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Kolay" },
+    "Bilim Felsefesi":       { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Kolay" }
+  },
+  "Din Kültürü ve Ahlak Bilgisi": {
+    "Bilgi ve İnanç":        { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
+    "Din ve İslam":          { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
+    "İslam ve İbadet":       { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
+    "Gençlik ve Değerler":   { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
+    "İslam ve Bilim":        { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" }
+  },
+  "Fizik": {
+    "Elektrik ve Manyetizma":{ "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Orta" },
+    "Optik":                 { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Orta" },
+    "Hareket ve Kuvvet":     { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Orta" },
+    "Isı ve Sıcaklık":       { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Orta" },
+    "Madde ve Özellikleri":  { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Orta" },
+    "Basınç":                { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Orta" },
+    "Dalgalar":              { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Orta" }
+  },
+  "Kimya": {
+    "Atom ve Periyodik Sistem": { "zorluk": "Orta", "ortalama_soru": 2, "kategori": "Orta" },
+    "Kimyasal Tepkimeler":      { "zorluk": "Zor",  "ortalama_soru": 2, "kategori": "Orta" },
+    "Asit-Baz":                 { "zorluk": "Orta", "ortalama_soru": 1, "kategori": "Orta" },
+    "Organik Kimya":            { "zorluk": "Zor",  "ortalama_soru": 1, "kategori": "Orta" },
+    "Kimya ve Enerji":          { "zorluk": "Orta", "ortalama_soru": 1, "kategori": "Orta" }
+  },
+  "Biyoloji": {
+    "Hücre":                     { "zorluk": "Orta", "ortalama_soru": 2, "kategori": "Orta" },
+    "Canlıların Sınıflandırılması": { "zorluk": "Kolay", "ortalama_soru": 1, "kategori": "Orta" },
+    "Ekoloji":                   { "zorluk": "Orta", "ortalama_soru": 1, "kategori": "Orta" },
+    "Genetik":                   { "zorluk": "Zor",  "ortalama_soru": 1, "kategori": "Orta" },
+    "Canlılar ve Çevre":         { "zorluk": "Orta", "ortalama_soru": 1, "kategori": "Orta" }
+  }
+}
+
+# Zaman dilimleri
+ZAMAN_DILIMLERI = {
+    "Zor": ["08:00-10:30", "16:00-18:00"],
+    "Orta": ["10:30-12:30", "19:00-21:00"],
+    "Kolay": ["13:30-15:30", "21:00-22:30"],
+    "Dil": ["06:30-08:00", "22:30-23:30"],
+    "Ezber": ["07:00-08:30", "22:00-23:00"]
+}
+
+# Zorluk katsayıları
+ZORLUK_KATSAYILARI = {
+    "Kolay": 0.5,
+    "Orta": 1,
+    "Zor": 2
+}
@@ -0,0 +1,256 @@
+"""Zaman aralığı (span) ölçümleri ve dışa aktarımı
+
+TYT_OLCUM ortam değişkeni açıkken (1/true/evet) olc() bağlamları ve @olculen
+ile işaretli fonksiyonlar süreyi ve süreç bellek (RSS) değişimini süreç
+genelindeki KAYIT'a yazar. Kayıt her ad için toplam sayı, süre ve hata
+sayısıyla son PENCERE ölçümü tutar; yüzdelikler bu pencereden hesaplanır.
+Sonuçlar Prometheus metin biçiminde veya JSON satırları olarak alınabilir;
+TYT_OLCUM_PORT verilirse sunucu_baslat bunları HTTP üzerinden sunar; uç nokta
+kimlik doğrulamasız olduğundan varsayılan olarak yalnızca 127.0.0.1'e bağlanır.
+gosterge_ekle ile kaydedilen fonksiyonların anlık değerleri (örneğin AI
+istek kuyruğunun derinliği) de aynı çıktılara eklenir.
+
+Ölçüm kapalıyken @olculen fonksiyonu hiç sarmalamaz ve olc() paylaşılan boş
+bir bağlam döndürür; maliyet bir genel değişken okumasıdır. Açık/kapalı durumu
+içe aktarmada okunur. Bellek değişimi süreç geneli olduğundan eşzamanlı
+oturumlarda yaklaşık bir değerdir.
+"""
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+ACIK = os.environ.get('TYT_OLCUM', '').strip().lower() in ('1', 'true', 'evet', 'acik', 'açık')
+
+PENCERE = 2048
+YUZDELIKLER = (0.5, 0.9, 0.99)
+
+_STATM = '/proc/self/statm'
+_SAYFA_BOYUTU = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def rss():
+    """Sürecin şu anki yerleşik bellek boyutu (bayt); okunamıyorsa tepe değeri"""
+    try:
+        with open(_STATM, 'rb') as f:
+            return int(f.read().split()[1]) * _SAYFA_BOYUTU
+    except OSError:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class _Seri:
+    __slots__ = ('sayi', 'toplam', 'hata', 'en_fazla', 'bellek_artis', 'bellek_azalis', 'bellek_en_fazla',
+                 'sureler')
+
+    def __init__(self):
+        self.sayi = 0
+        self.toplam = 0.0
+        self.hata = 0
+        self.en_fazla = 0.0
+        self.bellek_artis = 0
+        self.bellek_azalis = 0
+        self.bellek_en_fazla = 0
+        self.sureler = deque(maxlen=PENCERE)
+
+
+def _yuzdelik(sirali, oran):
+    """Sıralı listede en yakın sıra yöntemiyle yüzdelik"""
+    return sirali[min(len(sirali) - 1, max(0, int(oran * len(sirali) + 0.5) - 1))]
+
+
+class OlcumKaydi:
+    """Ad başına süre ve bellek değişimi toplamları (iş parçacığı güvenli)"""
+
+    def __init__(self):
+        self._seriler = {}
+        self._gostergeler = {}
+        self._kilit = threading.Lock()
+        self.baslangic = time.time()
+
+    def kaydet(self, ad, sure, bellek=0, hata=False):
+        with self._kilit:
+            seri = self._seriler.get(ad)
+            if seri is None:
+                seri = self._seriler[ad] = _Seri()
+            seri.sayi += 1
+            seri.toplam += sure
+            seri.hata += hata
+            seri.en_fazla = max(seri.en_fazla, sure)
+            # Prometheus sayaçları azalamaz; artış ve azalış ayrı toplanır
+            if bellek > 0:
+                seri.bellek_artis += bellek
+            else:
+                seri.bellek_azalis -= bellek
+            seri.bellek_en_fazla = max(seri.bellek_en_fazla, bellek)
+            seri.sureler.append(sure)
+
+    def gosterge_ekle(self, ad, fonksiyon):
+        """fonksiyon() -> {alt_ad: sayı} değerlerini 'ad.alt_ad' göstergeleri olarak ekle"""
+        with self._kilit:
+            self._gostergeler[ad] = fonksiyon
+
+    def gostergeler(self):
+        """Kayıtlı göstergelerin anlık değerleri: {'ad.alt_ad': sayı}"""
+        with self._kilit:
+            fonksiyonlar = list(self._gostergeler.items())
+        return {f"{ad}.{alt_ad}": deger for ad, fonksiyon in fonksiyonlar for alt_ad, deger in fonksiyon().items()}
+
+    def sifirla(self):
+        with self._kilit:
+            self._seriler.clear()
+            self.baslangic = time.time()
+
+    def ozet(self):
+        """Toplam süreye göre azalan sırada ad başına özet sözlükleri"""
+        with self._kilit:
+            kopyalar = [(ad, seri, sorted(seri.sureler)) for ad, seri in self._seriler.items()]
+        satirlar = []
+        for ad, seri, sirali in kopyalar:
+            satirlar.append({
+                'ad': ad,
+                'sayi': seri.sayi,
+                'hata': seri.hata,
+                'toplam_s': seri.toplam,
+                'ortalama_ms': seri.toplam / seri.sayi * 1000,
+                **{f"p{int(oran * 100)}_ms": _yuzdelik(sirali, oran) * 1000 for oran in YUZDELIKLER},
+                'en_fazla_ms': seri.en_fazla * 1000,
+                'bellek_ortalama_kb': (seri.bellek_artis - seri.bellek_azalis) / seri.sayi / 1024,
+                'bellek_en_fazla_kb': seri.bellek_en_fazla / 1024,
+            })
+        return sorted(satirlar, key=lambda s: s['toplam_s'], reverse=True)
+
+    def prometheus_metni(self):
+        """Prometheus metin biçimi (0.0.4): süre özeti, hata ve bellek sayaçları"""
+        with self._kilit:
+            kopyalar = [(ad, seri.sayi, seri.toplam, seri.hata, seri.bellek_artis, seri.bellek_azalis,
+                         seri.bellek_en_fazla, sorted(seri.sureler)) for ad, seri in self._seriler.items()]
+        satirlar = [
+            '# HELP tyt_span_sure_saniye Ölçülen aralıkların süresi (yüzdelikler son ölçümlerden)',
+            '# TYPE tyt_span_sure_saniye summary',
+        ]
+        for ad, sayi, toplam, _, _, _, _, sirali in kopyalar:
+            etiket = _etiket(ad)
+            satirlar += [f'tyt_span_sure_saniye{{ad="{etiket}",quantile="{oran}"}} {_yuzdelik(sirali, oran):.6g}'
+                         for oran in YUZDELIKLER]
+            satirlar.append(f'tyt_span_sure_saniye_sum{{ad="{etiket}"}} {toplam:.6g}')
+            satirlar.append(f'tyt_span_sure_saniye_count{{ad="{etiket}"}} {sayi}')
+        for metrik, tur, aciklama, sira in (
+            ('tyt_span_hata_toplam', 'counter', 'Hatayla biten aralık sayısı', 3),
+            ('tyt_span_bellek_artis_bayt_toplam', 'counter', 'Aralıklardaki RSS artışlarının toplamı', 4),
+            ('tyt_span_bellek_azalis_bayt_toplam', 'counter', 'Aralıklardaki RSS azalışlarının toplamı', 5),
+            ('tyt_span_bellek_bayt_en_fazla', 'gauge', 'Bir aralıktaki en büyük RSS artışı', 6),
+        ):
+            satirlar += [f'# HELP {metrik} {aciklama}', f'# TYPE {metrik} {tur}']
+            satirlar += [f'{metrik}{{ad="{_etiket(k[0])}"}} {k[sira]}' for k in kopyalar]
+        satirlar += ['# HELP tyt_gosterge Anlık durum göstergeleri', '# TYPE tyt_gosterge gauge']
+        satirlar += [f'tyt_gosterge{{ad="{_etiket(ad)}"}} {deger:.6g}' for ad, deger in self.gostergeler().items()]
+        return '\n'.join(satirlar) + '\n'
+
+    def json_satirlari(self):
+        """Her ad ve gösterge için zaman damgalı bir JSON satırı"""
+        zaman = time.strftime('%Y-%m-%dT%H:%M:%S')
+        satirlar = self.ozet() + [{'ad': ad, 'deger': deger} for ad, deger in self.gostergeler().items()]
+        return ''.join(
+            json.dumps({'zaman': zaman, 'pid': os.getpid(), **satir}, ensure_ascii=False) + '\n'
+            for satir in satirlar
+        )
+
+
+def _etiket(ad):
+    return ad.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+KAYIT = OlcumKaydi()
+
+
+class _Aralik:
+    __slots__ = ('ad', '_t0', '_rss0')
+
+    def __init__(self, ad):
+        self.ad = ad
+
+    def __enter__(self):
+        self._rss0 = rss()
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, hata_turu, hata, iz):
+        sure = time.perf_counter() - self._t0
+        # Yarıda bırakılan üreteçler (GeneratorExit) hata sayılmaz
+        hatali = hata_turu is not None and not issubclass(hata_turu, GeneratorExit)
+        KAYIT.kaydet(self.ad, sure, rss() - self._rss0, hatali)
+        return False
+
+
+_BOS = contextlib.nullcontext()
+
+
+def olc(ad):
+    """ad adlı aralığı ölçen bağlam; ölçüm kapalıyken paylaşılan boş bağlam"""
+    return _Aralik(ad) if ACIK else _BOS
+
+
+def olculen(ad=None):
+    """Fonksiyonun her çağrısını (üreteçlerde tükenene kadar) ölçen dekoratör
+
+    Ad verilmezse 'modül.fonksiyon' kullanılır (tyt. öneki olmadan). Ölçüm
+    kapalıyken fonksiyon olduğu gibi döner.
+    """
+    def sarmala(fonksiyon):
+        if not ACIK:
+            return fonksiyon
+        import inspect
+
+        aralik_adi = ad or f"{fonksiyon.__module__.removeprefix('tyt.')}.{fonksiyon.__qualname__}"
+
+        if inspect.isgeneratorfunction(fonksiyon):
+            @functools.wraps(fonksiyon)
+            def sarmalayici(*args, **kwargs):
+                with _Aralik(aralik_adi):
+                    return (yield from fonksiyon(*args, **kwargs))
+        else:
+            @functools.wraps(fonksiyon)
+            def sarmalayici(*args, **kwargs):
+                with _Aralik(aralik_adi):
+                    return fonksiyon(*args, **kwargs)
+        return sarmalayici
+
+    return sarmala
+
+
+def sunucu_baslat(port, adres='127.0.0.1'):
+    """/metrics (Prometheus) ve /metrics.jsonl yollarını sunan HTTP sunucusunu arka planda başlat
+
+    Uç nokta kimlik doğrulamasızdır; diğer arayüzlere açmak için adres açıkça verilmelidir.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _Isleyici(BaseHTTPRequestHandler):
+        def do_GET(self):
+            yol = self.path.split('?', 1)[0]
+            if yol == '/metrics':
+                govde, tur = KAYIT.prometheus_metni(), 'text/plain; version=0.0.4; charset=utf-8'
+            elif yol == '/metrics.jsonl':
+                govde, tur = KAYIT.json_satirlari(), 'application/jsonl; charset=utf-8'
+            else:
+                self.send_error(404)
+                return
+            veri = govde.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', tur)
+            self.send_header('Content-Length', str(len(veri)))
+            self.end_headers()
+            self.wfile.write(veri)
+
+        def log_message(self, *args):
+            pass
+
+    sunucu = ThreadingHTTPServer((adres, port), _Isleyici)
+    sunucu.daemon_threads = True
+    threading.Thread(target=sunucu.serve_forever, name='tyt-olcum', daemon=True).start()
+    return sunucu
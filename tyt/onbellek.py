@@ -0,0 +1,200 @@
+"""Önbellek yardımcıları
+
+DiskOnbellek, pahalı ve yavaş değişen sonuçları (örneğin AI önerileri)
+süreçler ve yeniden başlatmalar arasında saklayan SQLite tabanlı bir
+anahtar-değer deposudur. Girdiler hem yaşam süresi (TTL) dolunca hem de
+kapasite aşıldığında en uzun süredir kullanılmayan (LRU) sırayla silinir.
+
+BellekOnbellek ve bellekte_tut ise sık tekrarlanan hesapları süreç içinde,
+yani Streamlit'te tüm oturumlar arasında paylaşılarak, girdilerin içerik
+özetiyle saklar. Şu an grafikler modülündeki Plotly figürleri ve
+projeksiyon.net_projeksiyonu bu yolla saklanır; analiz ve özetler
+saklanmaz.
+"""
+import functools
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def varsayilan_onbellek_dizini():
+    """TYT_ONBELLEK_DIZINI ya da ~/.cache/tyt"""
+    return os.environ.get('TYT_ONBELLEK_DIZINI') or os.path.join(os.path.expanduser('~'), '.cache', 'tyt')
+
+
+class DiskOnbellek:
+    """SQLite tabanlı, LRU ve TTL ile sınırlanan kalıcı önbellek"""
+
+    def __init__(self, yol=None, kapasite=1000, ttl=7 * 24 * 3600):
+        if yol is None:
+            os.makedirs(varsayilan_onbellek_dizini(), exist_ok=True)
+            yol = os.path.join(varsayilan_onbellek_dizini(), 'onbellek.sqlite3')
+        self.yol = yol
+        self.kapasite = kapasite
+        self.ttl = ttl
+        self.isabet = 0
+        self.iska = 0
+        self._kilit = threading.Lock()
+        self._baglanti = sqlite3.connect(yol, check_same_thread=False, isolation_level=None)
+        self._baglanti.execute("PRAGMA journal_mode=WAL")
+        self._baglanti.execute(
+            "CREATE TABLE IF NOT EXISTS onbellek ("
+            " anahtar TEXT PRIMARY KEY,"
+            " deger TEXT NOT NULL,"
+            " olusturma REAL NOT NULL,"
+            " son_erisim REAL NOT NULL)"
+        )
+        self._baglanti.execute("CREATE INDEX IF NOT EXISTS onbellek_son_erisim ON onbellek (son_erisim)")
+
+    def al(self, anahtar):
+        """Anahtarın değerini döndür; yoksa veya süresi dolmuşsa None"""
+        simdi = time.time()
+        with self._kilit:
+            satir = self._baglanti.execute(
+                "SELECT deger, olusturma FROM onbellek WHERE anahtar = ?", (anahtar,)
+            ).fetchone()
+            if satir is not None and simdi - satir[1] > self.ttl:
+                self._baglanti.execute("DELETE FROM onbellek WHERE anahtar = ?", (anahtar,))
+                satir = None
+            if satir is None:
+                self.iska += 1
+                return None
+            self._baglanti.execute("UPDATE onbellek SET son_erisim = ? WHERE anahtar = ?", (simdi, anahtar))
+            self.isabet += 1
+        return json.loads(satir[0])
+
+    def koy(self, anahtar, deger):
+        """Değeri sakla; kapasite aşılırsa en eski erişilenleri sil"""
+        simdi = time.time()
+        with self._kilit:
+            self._baglanti.execute(
+                "INSERT OR REPLACE INTO onbellek (anahtar, deger, olusturma, son_erisim) VALUES (?, ?, ?, ?)",
+                (anahtar, json.dumps(deger, ensure_ascii=False), simdi, simdi)
+            )
+            self._baglanti.execute("DELETE FROM onbellek WHERE olusturma < ?", (simdi - self.ttl,))
+            fazla = self._baglanti.execute("SELECT COUNT(*) FROM onbellek").fetchone()[0] - self.kapasite
+            if fazla > 0:
+                self._baglanti.execute(
+                    "DELETE FROM onbellek WHERE anahtar IN "
+                    "(SELECT anahtar FROM onbellek ORDER BY son_erisim LIMIT ?)", (fazla,)
+                )
+
+    def temizle(self):
+        with self._kilit:
+            self._baglanti.execute("DELETE FROM onbellek")
+            self.isabet = self.iska = 0
+
+    def __len__(self):
+        with self._kilit:
+            return self._baglanti.execute("SELECT COUNT(*) FROM onbellek").fetchone()[0]
+
+    def istatistikler(self):
+        """İsabet/ıska sayaçları ve doluluk"""
+        toplam = self.isabet + self.iska
+        return {
+            'isabet': self.isabet,
+            'iska': self.iska,
+            'isabet_orani': self.isabet / toplam if toplam else 0.0,
+            'girdi_sayisi': len(self),
+            'kapasite': self.kapasite
+        }
+
+
+def parmak_izi(*parcalar):
+    """JSON'a çevrilebilir parçalardan kararlı bir SHA-256 özeti üret"""
+    metin = json.dumps(parcalar, ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(metin.encode('utf-8')).hexdigest()
+
+
+class BellekOnbellek:
+    """Süreç içi, kapasiteyle sınırlı LRU önbellek"""
+
+    def __init__(self, kapasite=128):
+        self.kapasite = kapasite
+        self.isabet = 0
+        self.iska = 0
+        self._girdiler = OrderedDict()
+        self._kilit = threading.Lock()
+
+    def al(self, anahtar, varsayilan=None):
+        with self._kilit:
+            if anahtar not in self._girdiler:
+                self.iska += 1
+                return varsayilan
+            self._girdiler.move_to_end(anahtar)
+            self.isabet += 1
+            return self._girdiler[anahtar]
+
+    def koy(self, anahtar, deger):
+        with self._kilit:
+            self._girdiler[anahtar] = deger
+            self._girdiler.move_to_end(anahtar)
+            while len(self._girdiler) > self.kapasite:
+                self._girdiler.popitem(last=False)
+
+    def temizle(self):
+        with self._kilit:
+            self._girdiler.clear()
+            self.isabet = self.iska = 0
+
+    def __len__(self):
+        return len(self._girdiler)
+
+    def istatistikler(self):
+        """İsabet/ıska sayaçları ve doluluk"""
+        toplam = self.isabet + self.iska
+        return {
+            'isabet': self.isabet,
+            'iska': self.iska,
+            'isabet_orani': self.isabet / toplam if toplam else 0.0,
+            'girdi_sayisi': len(self),
+            'kapasite': self.kapasite
+        }
+
+
+# Fonksiyon adı -> BellekOnbellek; aynı fonksiyon yeniden sarmalansa da
+# (örneğin Streamlit betiği her çalıştığında) aynı önbellek kullanılır.
+_BELLEK_ONBELLEKLERI = {}
+_YOK = object()
+
+
+def bellekte_tut(kapasite=128, kopyala=False):
+    """Sonucu argümanların parmak_izi ile süreç içinde önbelleğe alan dekoratör
+
+    Argümanlar JSON'a çevrilebilir olmalıdır. kopyala=True ise sonuç pickle
+    olarak saklanır ve her çağrı yeni bir kopya döndürür (sonucu değiştiren
+    çağıranlar için); aksi halde aynı nesne paylaşılır ve salt okunur
+    kullanılmalıdır. Girdileri özetlemek de zaman aldığından yalnızca
+    hesaplaması özetten belirgin biçimde pahalı fonksiyonlar (figürler,
+    net projeksiyonu) için uygundur.
+    """
+    def sarmala(fonksiyon):
+        ad = f"{fonksiyon.__module__}.{fonksiyon.__qualname__}"
+        onbellek = _BELLEK_ONBELLEKLERI.setdefault(ad, BellekOnbellek(kapasite))
+
+        @functools.wraps(fonksiyon)
+        def sarmalayici(*args, **kwargs):
+            anahtar = parmak_izi(args, kwargs)
+            sonuc = onbellek.al(anahtar, _YOK)
+            if sonuc is _YOK:
+                sonuc = fonksiyon(*args, **kwargs)
+                if kopyala:
+                    onbellek.koy(anahtar, pickle.dumps(sonuc, pickle.HIGHEST_PROTOCOL))
+                    return sonuc
+                onbellek.koy(anahtar, sonuc)
+            return pickle.loads(sonuc) if kopyala else sonuc
+
+        sarmalayici.onbellek = onbellek
+        return sarmalayici
+
+    return sarmala
+
+
+def bellek_onbellekleri():
+    """Fonksiyon adı -> BellekOnbellek sözlüğü"""
+    return dict(_BELLEK_ONBELLEKLERI)
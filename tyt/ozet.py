@@ -0,0 +1,113 @@
+"""Öğrenci performans özeti ve ders bazlı risk hesapları"""
+
+from .olcum import olculen
+
+
+@olculen()
+def hesapla_performans_ozeti(veriler):
+    """Öğrencinin genel performans özetini hesapla"""
+    ozet = {
+        'Toplam Soru': 0,
+        'Toplam Doğru': 0,
+        'Toplam Yanlış': 0,
+        'Toplam Boş': 0,
+        'Net': 0,
+        'Max Net': 0,
+        'Kalan Net': 0,
+        'Başarı Oranı': 0
+    }
+    
+    ders_bazli = {}
+    
+    for ders, konular in veriler.items():
+        ders_toplam = 0
+        ders_dogru = 0
+        ders_yanlis = 0
+        ders_bos = 0
+        
+        for konu, sonuclar in konular.items():
+            ders_toplam += sonuclar['gercek_soru']
+            ders_dogru += sonuclar['dogru']
+            ders_yanlis += sonuclar['yanlis']
+            ders_bos += sonuclar['bos']
+            
+            # Genel toplamlar
+            ozet['Toplam Soru'] += sonuclar['gercek_soru']
+            ozet['Toplam Doğru'] += sonuclar['dogru']
+            ozet['Toplam Yanlış'] += sonuclar['yanlis']
+            ozet['Toplam Boş'] += sonuclar['bos']
+        
+        # Ders neti (Doğru - Yanlış/4)
+        ders_net = ders_dogru - (ders_yanlis / 4)
+        ders_max_net = ders_toplam
+        
+        ders_bazli[ders] = {
+            'Toplam Soru': ders_toplam,
+            'Doğru': ders_dogru,
+            'Yanlış': ders_yanlis,
+            'Boş': ders_bos,
+            'Net': ders_net,
+            'Max Net': ders_max_net,
+            'Kalan Net': ders_max_net - ders_net,
+            'Başarı Oranı': (ders_dogru / ders_toplam * 100) if ders_toplam > 0 else 0
+        }
+    
+    # Genel net hesaplama
+    ozet['Net'] = ozet['Toplam Doğru'] - (ozet['Toplam Yanlış'] / 4)
+    ozet['Max Net'] = ozet['Toplam Soru']
+    ozet['Kalan Net'] = ozet['Max Net'] - ozet['Net']
+    ozet['Başarı Oranı'] = (ozet['Toplam Doğru'] / ozet['Toplam Soru'] * 100) if ozet['Toplam Soru'] > 0 else 0
+    
+    return ozet, ders_bazli
+
+def ders_toplamlari(analiz_sonucu):
+    """Ders başına toplam öncelik puanı, konu sayısı ve zayıf (puanı 5'ten büyük) konu sayısı
+    
+    hesapla_ders_basari_orani ve AI mesajları bu toplamlardan türetilir;
+    artımlı analiz yalnızca değişen derslerin toplamlarını yeniden hesaplar.
+    """
+    toplamlar = {}
+    
+    for konu_adi, bilgi in analiz_sonucu.items():
+        ders = bilgi['ders']
+        if ders not in toplamlar:
+            toplamlar[ders] = {'toplam_puan': 0, 'konu_sayisi': 0, 'zayif_konular': 0}
+        
+        toplamlar[ders]['toplam_puan'] += bilgi['oncelik_puani']
+        toplamlar[ders]['konu_sayisi'] += 1
+        if bilgi['oncelik_puani'] > 5:
+            toplamlar[ders]['zayif_konular'] += 1
+    
+    return toplamlar
+
+@olculen()
+def hesapla_ders_basari_orani(analiz_sonucu, toplamlar=None):
+    """Her ders için başarı oranını hesapla
+    
+    toplamlar (ders_toplamlari çıktısı) verilirse analiz yeniden taranmaz.
+    """
+    if toplamlar is None:
+        toplamlar = ders_toplamlari(analiz_sonucu)
+    
+    ders_analizi = {}
+    
+    # Ortalama hesapla ve seviye belirle (YENİ ALGORİTMA)
+    for ders, toplam in toplamlar.items():
+        ortalama = toplam['toplam_puan'] / toplam['konu_sayisi']
+        
+        # Yeni seviye algoritması
+        if ortalama >= 7:
+            seviye = 'Zor'
+        elif ortalama >= 4:
+            seviye = 'Orta'
+        else:
+            seviye = 'Kolay'
+        
+        ders_analizi[ders] = {
+            'toplam_puan': toplam['toplam_puan'],
+            'konu_sayisi': toplam['konu_sayisi'],
+            'ortalama_puan': ortalama,
+            'seviye': seviye
+        }
+    
+    return ders_analizi
@@ -0,0 +1,139 @@
+"""Zaman dilimli çalışma programı oluşturma"""
+import heapq
+from datetime import timedelta
+
+from .konular import ZAMAN_DILIMLERI
+from .olcum import olculen
+
+# Gün içindeki çalışma dilimleri, günlük saat arttıkça bu sırayla eklenir.
+# Ezber dilimleri diğerleriyle çakıştığı için ayrı dilim açılmaz; ezber
+# konuları kendi saatleriyle çakışan dilimlere yerleşir.
+GUNLUK_DILIM_SIRASI = [
+    "08:00-10:30", "16:00-18:00", "10:30-12:30", "19:00-21:00",
+    "06:30-08:00", "13:30-15:30", "21:00-22:30", "22:30-23:30"
+]
+
+
+def _dakikalar(zaman_dilimi):
+    """'08:00-10:30' -> (480, 630)"""
+    bas, son = zaman_dilimi.split('-')
+    return tuple(int(s[:2]) * 60 + int(s[3:]) for s in (bas, son))
+
+
+def _cakisir(a, b):
+    a_bas, a_son = _dakikalar(a)
+    b_bas, b_son = _dakikalar(b)
+    return a_bas < b_son and b_bas < a_son
+
+
+def gunluk_dilimler(gunluk_saat):
+    """Günlük saati karşılayacak dilimleri başlangıç saatine göre sıralı döndür"""
+    secilen, toplam = [], 0
+    for dilim in GUNLUK_DILIM_SIRASI:
+        if toplam >= gunluk_saat:
+            break
+        secilen.append(dilim)
+        bas, son = _dakikalar(dilim)
+        toplam += (son - bas) / 60
+    return sorted(secilen, key=_dakikalar)
+
+
+def _dilim_kategorileri(dilimler):
+    """Her dilim için tercih eden kategorileri bul
+
+    Bir kategori, kendi ZAMAN_DILIMLERI saatleriyle çakışan dilimleri tercih
+    eder. Günün dilimlerinden hiçbiriyle çakışmayan kategoriler (örneğin az
+    saatli programlarda Dil) her dilime yerleşebilir.
+    """
+    tercihler = {
+        dilim: {kat for kat, saatler in ZAMAN_DILIMLERI.items() if any(_cakisir(dilim, s) for s in saatler)}
+        for dilim in dilimler
+    }
+    yerlesemeyen = set(ZAMAN_DILIMLERI) - set().union(*tercihler.values())
+    return {dilim: kategoriler | yerlesemeyen for dilim, kategoriler in tercihler.items()}
+
+
+def program_atamalari(analiz, gun_sayisi, gunluk_saat):
+    """Her (gün, zaman dilimi) için bir konu seç; [(gun_indeksi, zaman_dilimi, konu_adi)] döndür
+
+    Konular kategori başına bir öncelik kuyruğunda (heap) tutulur. Bir konu her
+    planlandığında etkin puanı oncelik_puani / (1 + tekrar_sayisi) olarak
+    azaltılıp kuyruğa geri konur; böylece tüm ufuk boyunca her dilim dolar ve
+    konular öncelikleriyle orantılı sıklıkta tekrar eder. Dilime, saatleri o
+    dilimle çakışan kategorilerin en yüksek etkin puanlı konusu atanır;
+    mümkünse aynı gün aynı konu tekrarlanmaz.
+    """
+    sorted_konular = sorted(analiz.items(), key=lambda x: x[1]['oncelik_puani'], reverse=True)
+    if not sorted_konular:
+        return []
+
+    # Kuyruk öğesi: (-etkin_puan, sira, tekrar, konu_adi); sira eşit puanlarda
+    # eski programdaki öncelik sırasını korur.
+    kuyruklar = {kategori: [] for kategori in ZAMAN_DILIMLERI}
+    for sira, (konu_adi, bilgi) in enumerate(sorted_konular):
+        kuyruklar.setdefault(bilgi['kategori'], []).append((-bilgi['oncelik_puani'], sira, 0, konu_adi))
+    for kuyruk in kuyruklar.values():
+        heapq.heapify(kuyruk)
+
+    dilimler = gunluk_dilimler(gunluk_saat)
+    tercihler = _dilim_kategorileri(dilimler)
+    tum_kategoriler = list(kuyruklar)
+
+    atamalar = []
+    for gun in range(gun_sayisi):
+        bugun = set()
+        for zaman_dilimi in dilimler:
+            adaylar = [k for k in tercihler[zaman_dilimi] if kuyruklar.get(k)] or \
+                      [k for k in tum_kategoriler if kuyruklar[k]]
+
+            # Bugün planlanmış konuları geçici olarak kenara al
+            kenar = []
+            secilen = None
+            while adaylar:
+                kategori = min(adaylar, key=lambda k: kuyruklar[k][0])
+                oge = heapq.heappop(kuyruklar[kategori])
+                if oge[3] not in bugun:
+                    secilen = (kategori, oge)
+                    break
+                kenar.append((kategori, oge))
+                adaylar = [k for k in adaylar if kuyruklar[k]]
+            if secilen is None:
+                secilen = min(kenar, key=lambda x: x[1])
+                kenar.remove(secilen)
+            for kategori, oge in kenar:
+                heapq.heappush(kuyruklar[kategori], oge)
+
+            kategori, (_, sira, tekrar, konu_adi) = secilen
+            atamalar.append((gun, zaman_dilimi, konu_adi))
+            bugun.add(konu_adi)
+
+            tekrar += 1
+            etkin_puan = analiz[konu_adi]['oncelik_puani'] / (1 + tekrar)
+            heapq.heappush(kuyruklar[kategori], (-etkin_puan, sira, tekrar, konu_adi))
+
+    return atamalar
+
+
+@olculen()
+def program_olustur_zaman_dilimli(analiz, baslangic_tarihi, gun_sayisi, gunluk_saat):
+    """Zaman dilimli çalışma programı oluştur"""
+    tarihler = [(baslangic_tarihi + timedelta(days=gun)).strftime('%d.%m.%Y') for gun in range(gun_sayisi)]
+
+    program = []
+    for gun, zaman_dilimi, konu_adi in program_atamalari(analiz, gun_sayisi, gunluk_saat):
+        bilgi = analiz[konu_adi]
+        program.append({
+            'Gün': gun + 1,
+            'Tarih': tarihler[gun],
+            'Zaman': zaman_dilimi,
+            'Ders': bilgi['ders'],
+            'Konu': bilgi['konu'],
+            'Öncelik Puanı': bilgi['oncelik_puani'],
+            'Zorluk': bilgi['zorluk'],
+            'Kategori': bilgi['kategori'],
+            'Doğru': bilgi['dogru'],
+            'Yanlış': bilgi['yanlis'],
+            'Boş': bilgi['bos']
+        })
+
+    return program
@@ -0,0 +1,152 @@
+"""Sınav günü TYT neti için Monte Carlo projeksiyonu
+
+Her çekilişte konu başına soru sayısı ortalama_soru ortalamalı Poisson
+dağılımındadır. Öğrencinin doğru/yanlış/boş olasılıkları, denemedeki sayılara
+genel oranlarından bir önsel eklenerek Dirichlet dağılımından örneklenir. Plan
+bir konuya h saat ayırdıysa, dagitim modelindeki gibi yanlış ve boşların
+1 - exp(-h / sabit) kadarı doğruya döner.
+
+Soru sayısı Poisson olduğundan konunun doğru ve yanlış sayıları bağımsız
+Poisson(λ p) dağılımlarıdır ve konular üzerindeki toplamları da Poisson(Σ λ p)
+olur. Böylece her çekilişte konu başına cevap üretilmez: olasılıklar
+(öğrenci x çekiliş x konu) dizilerinde tek seferde çekilir, Σ λ p toplu matris
+çarpımıyla bulunur ve toplam doğru ile yanlış ikişer Poisson çekilişidir;
+net = doğru - yanlış / 4. Bellek sınırı için öğrenciler parça parça işlenir.
+Denemede hiç sorusu olmayan konular projeksiyona katılmaz.
+"""
+import numpy as np
+
+from .dagitim import _OGRENME_SABITLERI
+from .katalog import KONU_AD_INDEKSI, KONU_SIRASI, ORTALAMA_SORU
+from .olcum import olculen
+from .onbellek import bellekte_tut
+
+VARSAYILAN_CEKILIS = 10000
+VARSAYILAN_GUVEN = 0.9
+# Dirichlet önselinin ağırlığı (soru cinsinden). Önsel öğrencinin tüm konulardaki
+# doğru/yanlış/boş oranlarıdır; az soru görülen konular bu oranlara çekilir.
+ONSEL = 1.0
+# Bir parçadaki (öğrenci x çekiliş x konu) öğe sayısı üst sınırı
+_PARCA_OGESI = 2_000_000
+
+
+def _parca_simulasyonu(rng, dogru, yanlis, bos, senaryolar, cekilis_sayisi, onsel):
+    """(P x konu) sayılar için her saat senaryosunda (P x çekiliş) netler
+
+    Olasılık çekilişleri senaryolar arasında ortaktır.
+    """
+    boyut = (len(dogru), cekilis_sayisi, len(KONU_SIRASI))
+    gozlenen = (dogru + yanlis + bos) > 0
+    genel = np.stack([d.sum(axis=1) for d in (dogru, yanlis, bos)], axis=1)
+    genel /= np.maximum(genel.sum(axis=1, keepdims=True), 1)
+
+    # Doğru/yanlış/boş olasılıkları: Dirichlet = normalize edilmiş gama çekilişleri
+    gamalar = []
+    for j, sayi in enumerate((dogru, yanlis, bos)):
+        alfa = np.where(gozlenen, sayi + onsel * genel[:, j:j + 1], 1.0)
+        gamalar.append(rng.standard_gamma(np.broadcast_to(alfa[:, None, :], boyut)))
+    payda = gamalar[0] + gamalar[1] + gamalar[2]
+    p_dogru, p_yanlis = gamalar[0] / payda, gamalar[1] / payda
+    beklenen_soru = ORTALAMA_SORU * gozlenen
+
+    netler = []
+    for saatler in senaryolar:
+        # Çalışılan saatlerle yanlış ve boşların kapanan oranı
+        kapanan = 0.0 if saatler is None else -np.expm1(-saatler / _OGRENME_SABITLERI)
+        agirlik = (beklenen_soru * (1 - kapanan))[:, :, None]
+        # Σ_k λ_k (p_d + kapanan (1 - p_d)) ve Σ_k λ_k p_y (1 - kapanan)
+        dogru_orani = (p_dogru @ agirlik)[..., 0] + (beklenen_soru * kapanan).sum(axis=1, keepdims=True)
+        yanlis_orani = (p_yanlis @ agirlik)[..., 0]
+        netler.append(rng.poisson(dogru_orani) - rng.poisson(yanlis_orani) / 4)
+    return netler
+
+
+def senaryo_netleri(dogru, yanlis, bos, senaryolar, cekilis_sayisi=VARSAYILAN_CEKILIS, tohum=None, onsel=ONSEL):
+    """Öğrenci x konu matrisleri için her saat senaryosunda (öğrenci x çekiliş) netler
+
+    senaryolar, saatler matrisleri (ya da mevcut durum için None) listesidir;
+    senaryolar olasılık çekilişlerini paylaşır.
+    """
+    dogru, yanlis, bos = (np.atleast_2d(np.asarray(d, dtype=float)) for d in (dogru, yanlis, bos))
+    senaryolar = [
+        None if saatler is None else np.broadcast_to(np.atleast_2d(np.asarray(saatler, dtype=float)), dogru.shape)
+        for saatler in senaryolar
+    ]
+
+    rng = np.random.default_rng(tohum)
+    adim = max(1, _PARCA_OGESI // (cekilis_sayisi * len(KONU_SIRASI)))
+    netler = [np.empty((len(dogru), cekilis_sayisi)) for _ in senaryolar]
+    for bas in range(0, len(dogru), adim):
+        parca = slice(bas, bas + adim)
+        sonuclar = _parca_simulasyonu(
+            rng, dogru[parca], yanlis[parca], bos[parca],
+            [None if saatler is None else saatler[parca] for saatler in senaryolar], cekilis_sayisi, onsel
+        )
+        for hedef, sonuc in zip(netler, sonuclar):
+            hedef[parca] = sonuc
+    return netler
+
+
+def net_simulasyonu(dogru, yanlis, bos, saatler=None, cekilis_sayisi=VARSAYILAN_CEKILIS, tohum=None, onsel=ONSEL):
+    """Öğrenci x konu matrisleri için (öğrenci x çekiliş) sınav netleri
+
+    Sütunlar KONU_SIRASI düzenindedir; saatler (saat_dagit_toplu çıktısı)
+    verilmezse mevcut durum simüle edilir. Tek öğrencilik (konu) dizileri için
+    (çekiliş) dizisi döndürür.
+    """
+    netler = senaryo_netleri(dogru, yanlis, bos, [saatler], cekilis_sayisi, tohum, onsel)[0]
+    return netler[0] if np.ndim(dogru) == 1 else netler
+
+
+def projeksiyon_ozeti(netler, guven=VARSAYILAN_GUVEN):
+    """Çekilişlerden ortalama, standart sapma, medyan ve guven düzeyindeki aralık
+
+    Son eksen çekilişlerdir; değerler öğrenci başına dizi (tek öğrencide sayı) olur.
+    """
+    alt, medyan, ust = np.percentile(netler, [50 * (1 - guven), 50, 50 * (1 + guven)], axis=-1)
+    return {
+        'ortalama': netler.mean(axis=-1),
+        'std': netler.std(axis=-1),
+        'alt': alt,
+        'medyan': medyan,
+        'ust': ust,
+    }
+
+
+@olculen()
+@bellekte_tut(kapasite=32)
+def net_projeksiyonu(analiz, dagilim=None, cekilis_sayisi=VARSAYILAN_CEKILIS, guven=VARSAYILAN_GUVEN,
+                     tohum=0, kutu_sayisi=40):
+    """analiz_et sonucu ve saat_dagit dağılımı için mevcut ve planlı net projeksiyonu
+
+    {'mevcut': özet, 'planli': özet, 'dagilim': [{'Net', 'Olasılık', 'Durum'}]}
+    döndürür; dagilim iki durumun ortak kutulu histogramıdır. Dağılım yoksa
+    planlı özet None'dır. İki durum olasılık çekilişlerini paylaştığından
+    farkları büyük ölçüde plandan gelir. Tohum sabit olduğundan sonuç girdilerin
+    özetiyle önbelleğe alınır ve salt okunur kullanılmalıdır.
+    """
+    dogru, yanlis, bos = (np.zeros(len(KONU_SIRASI)) for _ in range(3))
+    saatler = np.zeros(len(KONU_SIRASI))
+    for konu_adi, bilgi in analiz.items():
+        i = KONU_AD_INDEKSI[konu_adi]
+        dogru[i], yanlis[i], bos[i] = bilgi['dogru'], bilgi['yanlis'], bilgi['bos']
+        if dagilim and konu_adi in dagilim:
+            saatler[i] = dagilim[konu_adi]['saat']
+
+    senaryolar = {'Mevcut': None, 'Planlı': saatler} if dagilim else {'Mevcut': None}
+    netler = senaryo_netleri(dogru, yanlis, bos, list(senaryolar.values()), cekilis_sayisi, tohum, ONSEL)
+    durumlar = {durum: n[0] for durum, n in zip(senaryolar, netler)}
+
+    kenarlar = np.histogram_bin_edges(np.concatenate(list(durumlar.values())), bins=kutu_sayisi)
+    merkezler = ((kenarlar[:-1] + kenarlar[1:]) / 2).round(2).tolist()
+    kayitlar = []
+    for durum, netler in durumlar.items():
+        sayilar, _ = np.histogram(netler, bins=kenarlar)
+        kayitlar += [
+            {'Net': net, 'Olasılık': oran, 'Durum': durum}
+            for net, oran in zip(merkezler, (sayilar / len(netler)).tolist())
+        ]
+
+    ozetler = {durum: {k: float(v) for k, v in projeksiyon_ozeti(netler, guven).items()}
+               for durum, netler in durumlar.items()}
+    return {'mevcut': ozetler['Mevcut'], 'planli': ozetler.get('Planlı'), 'dagilim': kayitlar}
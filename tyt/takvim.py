@@ -0,0 +1,76 @@
+"""Program sekmesindeki takvim görünümü
+
+Program satırları tek geçişte haftalara ve günlere gruplanır; her hafta
+tek bir HTML bloğu olarak üretilir. Arayüz yalnızca görünen sayfadaki
+haftaları gönderir.
+"""
+from collections import namedtuple
+from datetime import datetime
+from html import escape
+
+from .olcum import olculen
+
+# yil, hafta: ISO yıl ve hafta numarası; gunler: [(tarih_metni, gun_adi, satirlar)]
+Hafta = namedtuple('Hafta', 'yil hafta gunler')
+
+GUN_ADLARI = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+ZORLUK_RENKLERI = {"Zor": "#FF6B6B", "Orta": "#4ECDC4"}
+VARSAYILAN_RENK = "#FFD166"
+
+HAFTA_SAYFA_BOYUTU = 4
+
+
+@olculen()
+def takvim_haftalari(program):
+    """Program satırlarını (sözlükler) tarih sırasıyla haftalara ve günlere grupla"""
+    gunler = {}
+    for satir in program:
+        tarih_metni = satir['Tarih']
+        gun = gunler.get(tarih_metni)
+        if gun is None:
+            gun = gunler[tarih_metni] = (datetime.strptime(tarih_metni, '%d.%m.%Y').date(), [])
+        gun[1].append(satir)
+
+    haftalar = []
+    for tarih_metni, (tarih, satirlar) in sorted(gunler.items(), key=lambda x: x[1][0]):
+        yil, hafta, gun_no = tarih.isocalendar()
+        if not haftalar or (haftalar[-1].yil, haftalar[-1].hafta) != (yil, hafta):
+            haftalar.append(Hafta(yil, hafta, []))
+        haftalar[-1].gunler.append((tarih_metni, GUN_ADLARI[gun_no - 1], satirlar))
+    return haftalar
+
+
+def _kart_html(satir):
+    renk = ZORLUK_RENKLERI.get(satir['Zorluk'], VARSAYILAN_RENK)
+    return (
+        f'<div style="background-color: {renk}; border-radius: 10px; padding: 15px; '
+        f'margin-bottom: 15px; box-shadow: 0 4px 8px rgba(0,0,0,0.1);">'
+        f'<div style="display: flex; justify-content: space-between;">'
+        f'<div><b>{escape(satir["Zaman"])}</b></div>'
+        f'<div>Öncelik: {satir["Öncelik Puanı"]:.1f}</div></div>'
+        f'<h3 style="margin: 10px 0;">{escape(satir["Ders"])}</h3>'
+        f'<p style="margin: 0;"><b>{escape(satir["Konu"])}</b></p>'
+        f'<p style="margin: 0; font-size: 0.9em;">Zorluk: {escape(satir["Zorluk"])}</p>'
+        f'</div>'
+    )
+
+
+@olculen()
+def hafta_html(hafta):
+    """Bir haftanın tüm günlerini ve kartlarını tek HTML bloğu olarak üret"""
+    parcalar = [f'<h3>🗓️ Hafta {hafta.hafta}</h3>']
+    for tarih_metni, gun_adi, satirlar in hafta.gunler:
+        parcalar.append(f'<h4>📅 {tarih_metni} ({gun_adi})</h4>')
+        parcalar.extend(_kart_html(satir) for satir in satirlar)
+    return ''.join(parcalar)
+
+
+def sayfa_haftalari(haftalar, sayfa, sayfa_boyutu=HAFTA_SAYFA_BOYUTU):
+    """1 tabanlı sayfa numarasındaki haftaları döndür"""
+    bas = (sayfa - 1) * sayfa_boyutu
+    return haftalar[bas:bas + sayfa_boyutu]
+
+
+def sayfa_sayisi(haftalar, sayfa_boyutu=HAFTA_SAYFA_BOYUTU):
+    return max(1, -(-len(haftalar) // sayfa_boyutu))
@@ -0,0 +1,213 @@
+"""Deneme geçmişinden konu ve ders bazlı gelişim eğilimleri
+
+Geçmiş, her satırı bir denemedeki bir konu sonucu olan uzun biçimli bir
+tablodur (DenemeDeposu.gecmis_tablosu çıktısı: ogrenci, deneme, tarih,
+konu_indeksi, dogru, yanlis). Her (öğrenci, konu) ve (öğrenci, ders) serisi
+için kayan net, son N denemedeki doğrusal eğim (deneme başına net değişimi) ve
+oynaklık (netin standart sapması) tüm geçmiş üzerinde tek sıralama, kümülatif
+toplam ve bincount toplamlarıyla hesaplanır; seriler üzerinde Python döngüsü
+yoktur. Satırsız geçmiş aynı sütunlarla boş tablo verir.
+"""
+import numpy as np
+
+from .katalog import DERS_KODLARI, DERSLER, KONU_SIRASI
+from .olcum import olculen
+
+VARSAYILAN_PENCERE = 5
+
+_KONU_DERS_ADLARI = np.array([ders for ders, _ in KONU_SIRASI], dtype=object)
+_KONU_ADLARI = np.array([konu for _, konu in KONU_SIRASI], dtype=object)
+
+
+def net_hesapla(dogru, yanlis):
+    """TYT neti: doğru - yanlış / 4"""
+    return np.asarray(dogru, dtype=float) - np.asarray(yanlis, dtype=float) / 4
+
+
+def _zaman_sirasinda(gecmis):
+    """Satırları öğrenci içinde (tarih, deneme) sırasına getir; zaten sıralıysa kopyalamaz"""
+    import pandas as pd
+
+    ogrenci_kodlari, ogrenciler = pd.factorize(gecmis['ogrenci'])
+    tarih = gecmis['tarih'].to_numpy()
+    deneme = gecmis['deneme'].to_numpy()
+    sirali = (
+        (np.diff(ogrenci_kodlari) >= 0).all()
+        and ((np.diff(ogrenci_kodlari) > 0) | (tarih[1:] > tarih[:-1])
+             | ((tarih[1:] == tarih[:-1]) & (deneme[1:] >= deneme[:-1]))).all()
+    )
+    if not sirali:
+        sira = np.lexsort((deneme, tarih, ogrenci_kodlari))
+        gecmis = gecmis.iloc[sira].reset_index(drop=True)
+        ogrenci_kodlari, tarih, deneme = ogrenci_kodlari[sira], tarih[sira], deneme[sira]
+    return gecmis, ogrenci_kodlari, np.asarray(ogrenciler, dtype=object), tarih, deneme
+
+
+def _deneme_numaralari(ogrenci_kodlari, deneme):
+    """Zaman sıralı satırlar için (genel deneme numarası, öğrenci içindeki deneme sırası)"""
+    yeni = np.ones(len(deneme), dtype=bool)
+    yeni[1:] = (deneme[1:] != deneme[:-1]) | (ogrenci_kodlari[1:] != ogrenci_kodlari[:-1])
+    numara = np.cumsum(yeni) - 1
+
+    ogrenci_basi = np.ones(len(deneme), dtype=bool)
+    ogrenci_basi[1:] = ogrenci_kodlari[1:] != ogrenci_kodlari[:-1]
+    ilk_numara = np.maximum.accumulate(np.where(ogrenci_basi, numara, 0))
+    return numara, numara - ilk_numara
+
+
+def _seri_istatistikleri(grup, net, pencere, seri=True):
+    """Grup, sonra zaman sırasındaki (grup, net) satırları için seri istatistikleri
+
+    Satır başına kayan neti (seri=False ise None) ve grup başına (grup,
+    deneme_sayisi, son_net, kayan_net, egim, oynaklik) dizilerini döndürür.
+    Kayan net, eğim ve oynaklık son `pencere` denemeden hesaplanır; ikiden az
+    denemesi olan gruplarda eğim ve oynaklık NaN'dır.
+    """
+    n = len(net)
+    satir = np.arange(n)
+    yeni = np.ones(n, dtype=bool)
+    yeni[1:] = grup[1:] != grup[:-1]
+    grup_no = np.cumsum(yeni) - 1
+    baslangic = np.flatnonzero(yeni)
+    bitis = np.append(baslangic[1:], n)
+
+    kayan = None
+    if seri:
+        # Kümülatif toplamdan pencere (ya da grup başı) kadar gerideki çıkarılır
+        kumulatif = np.concatenate(([0.0], np.cumsum(net)))
+        alt = np.maximum(satir + 1 - pencere, baslangic[grup_no])
+        kayan = (kumulatif[satir + 1] - kumulatif[alt]) / (satir + 1 - alt)
+
+    # Son pencere: x = pencere içindeki sıra (0..k-1)
+    k = np.minimum(bitis - baslangic, pencere)
+    pencere_basi = bitis - k
+    icinde = satir >= pencere_basi[grup_no]
+    g = grup_no[icinde]
+    x = (satir[icinde] - pencere_basi[g]).astype(float)
+    y = net[icinde]
+    k = k.astype(float)
+    toplam_y = np.bincount(g, y, minlength=len(k))
+    toplam_xy = np.bincount(g, x * y, minlength=len(k))
+    toplam_yy = np.bincount(g, y * y, minlength=len(k))
+    toplam_x = k * (k - 1) / 2
+    toplam_xx = (k - 1) * k * (2 * k - 1) / 6
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        egim = (k * toplam_xy - toplam_x * toplam_y) / (k * toplam_xx - toplam_x ** 2)
+        oynaklik = np.sqrt(np.maximum(toplam_yy - toplam_y ** 2 / k, 0) / (k - 1))
+    egim[k < 2] = np.nan
+    oynaklik[k < 2] = np.nan
+
+    return kayan, (grup[baslangic], bitis - baslangic, net[bitis - 1], toplam_y / k, egim, oynaklik)
+
+
+def _bos_istatistikler():
+    """Satırsız geçmiş için _seri_istatistikleri ile aynı biçimde boş diziler"""
+    bos = np.empty(0)
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), bos, bos, bos, bos
+
+
+def _ozet_tablosu(sutunlar, istatistikler):
+    import pandas as pd
+
+    _, deneme_sayisi, son_net, kayan_net, egim, oynaklik = istatistikler
+    return pd.DataFrame({
+        **sutunlar,
+        'deneme_sayisi': deneme_sayisi,
+        'son_net': son_net,
+        'kayan_net': kayan_net,
+        'egim': egim,
+        'oynaklik': oynaklik,
+    })
+
+
+@olculen()
+def konu_trendleri(gecmis, pencere=VARSAYILAN_PENCERE):
+    """Her (öğrenci, konu) için deneme sayısı, son net, kayan net, eğim ve oynaklık"""
+    if gecmis.empty:
+        bos = np.empty(0, dtype=object)
+        return _ozet_tablosu({'ogrenci': bos, 'ders': bos, 'konu': bos}, _bos_istatistikler())
+    gecmis, ogrenci_kodlari, ogrenciler, _, deneme = _zaman_sirasinda(gecmis)
+    _, sira = _deneme_numaralari(ogrenci_kodlari, deneme)
+    konu = gecmis['konu_indeksi'].to_numpy()
+
+    # Önce (öğrenci, konu), sonra deneme sırası
+    grup = ogrenci_kodlari.astype(np.int64) * len(KONU_SIRASI) + konu
+    duzen = np.argsort(grup * (int(sira.max()) + 1) + sira, kind='stable')
+    net = net_hesapla(gecmis['dogru'].to_numpy()[duzen], gecmis['yanlis'].to_numpy()[duzen])
+    _, istatistikler = _seri_istatistikleri(grup[duzen], net, pencere, seri=False)
+
+    gruplar = istatistikler[0]
+    konular = gruplar % len(KONU_SIRASI)
+    return _ozet_tablosu({
+        'ogrenci': ogrenciler[gruplar // len(KONU_SIRASI)],
+        'ders': _KONU_DERS_ADLARI[konular],
+        'konu': _KONU_ADLARI[konular],
+    }, istatistikler)
+
+
+def _ders_serileri(gecmis, pencere, seri=True):
+    """Deneme başına ders netleri (seri=False ise None) ve bunların seri istatistikleri"""
+    if gecmis.empty:
+        bos = np.empty(0, dtype=object)
+        satirlar = None
+        if seri:
+            satirlar = {
+                'ogrenci': bos,
+                'deneme': gecmis['deneme'].to_numpy(),
+                'tarih': gecmis['tarih'].to_numpy(),
+                'ders': bos,
+                'net': np.empty(0),
+                'kayan_net': np.empty(0),
+            }
+        return satirlar, bos, _bos_istatistikler()
+    gecmis, ogrenci_kodlari, ogrenciler, tarih, deneme = _zaman_sirasinda(gecmis)
+    numara, sira = _deneme_numaralari(ogrenci_kodlari, deneme)
+    ders = DERS_KODLARI[gecmis['konu_indeksi'].to_numpy()]
+    net = net_hesapla(gecmis['dogru'].to_numpy(), gecmis['yanlis'].to_numpy())
+
+    # (deneme, ders) hücrelerine topla; deneme numaraları zaman sırasındadır
+    hucre = numara * len(DERSLER) + ders
+    hucre_sayisi = (int(numara[-1]) + 1) * len(DERSLER)
+    ders_neti = np.bincount(hucre, net, minlength=hucre_sayisi)
+    dolu = np.flatnonzero(np.bincount(hucre, minlength=hucre_sayisi))
+
+    ilk_satir = np.flatnonzero(np.diff(numara, prepend=-1))
+    deneme_no, ders_kodu = dolu // len(DERSLER), dolu % len(DERSLER)
+    ogrenci = ogrenci_kodlari[ilk_satir][deneme_no].astype(np.int64)
+    deneme_sirasi = sira[ilk_satir][deneme_no]
+
+    grup = ogrenci * len(DERSLER) + ders_kodu
+    duzen = np.argsort(grup * (int(deneme_sirasi.max()) + 1) + deneme_sirasi, kind='stable')
+    kayan, istatistikler = _seri_istatistikleri(grup[duzen], ders_neti[dolu][duzen], pencere, seri)
+    if not seri:
+        return None, ogrenciler, istatistikler
+    satirlar = {
+        'ogrenci': ogrenciler[ogrenci[duzen]],
+        'deneme': deneme[ilk_satir][deneme_no][duzen],
+        'tarih': tarih[ilk_satir][deneme_no][duzen],
+        'ders': np.asarray(DERSLER, dtype=object)[ders_kodu[duzen]],
+        'net': ders_neti[dolu][duzen],
+        'kayan_net': kayan,
+    }
+    return satirlar, ogrenciler, istatistikler
+
+
+@olculen()
+def ders_trendleri(gecmis, pencere=VARSAYILAN_PENCERE):
+    """Her (öğrenci, ders) için deneme başına ders netinin trend özeti"""
+    _, ogrenciler, istatistikler = _ders_serileri(gecmis, pencere, seri=False)
+    gruplar = istatistikler[0]
+    return _ozet_tablosu({
+        'ogrenci': ogrenciler[gruplar // len(DERSLER)],
+        'ders': np.asarray(DERSLER, dtype=object)[gruplar % len(DERSLER)],
+    }, istatistikler)
+
+
+@olculen()
+def ders_net_serisi(gecmis, pencere=VARSAYILAN_PENCERE):
+    """Deneme başına ders neti ve kayan net: ogrenci, deneme, tarih, ders, net, kayan_net"""
+    import pandas as pd
+
+    satirlar, _, _ = _ders_serileri(gecmis, pencere)
+    return pd.DataFrame(satirlar)
@@ -1,550 +1,106 @@
+import os
+import uuid
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-from datetime import datetime, timedelta
-import io
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
-from groq import Groq
-import numpy as np
-import math
+from datetime import datetime
+
+from tyt.konular import KONU_VERILERI
+from tyt.kaynaklar import KITAP_ONERILERI, YOUTUBE_KANALLARI, youtube_video_ara
+from tyt.artimli import ArtimliAnaliz
+from tyt.giris import GIRIS_SUTUNLARI, MAKS_SORU, duzenlemeleri_uygula, giris_tablosu, varsayilan_kayit
+from tyt.ozet import hesapla_performans_ozeti, hesapla_ders_basari_orani
+from tyt.program import program_olustur_zaman_dilimli
+from tyt.dagitim import saat_dagit
+from tyt.projeksiyon import net_projeksiyonu
+from tyt.takvim import HAFTA_SAYFA_BOYUTU, hafta_html, sayfa_haftalari, sayfa_sayisi, takvim_haftalari
+from tyt.ai_kocu import groq_istemcisi_olustur, get_ai_suggestion
+from tyt.ai_kapisi import IstekKapisi
+from tyt.onbellek import DiskOnbellek
+from tyt.olcum import ACIK as OLCUM_ACIK, KAYIT, olc, sunucu_baslat
+from tyt.depo import DenemeDeposu
+from tyt.karne import karneleri_oku, varsayilan_karne_onbellegi
+from tyt.trend import VARSAYILAN_PENCERE, ders_net_serisi, ders_trendleri, konu_trendleri
+from tyt.grafikler import (
+    oncelik_grafigi, risk_haritasi, haftalik_ilerleme_grafigi, ders_dagilimi_grafikleri, ders_net_grafigi,
+    ders_trend_grafigi, konu_egim_grafigi, net_projeksiyon_grafigi
+)
 
 # Groq AI Client
 @st.cache_resource
 def init_groq_client():
     try:
         api_key = st.secrets.get("GROQ_API_KEY", "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")
-        return Groq(api_key=api_key)
+        return groq_istemcisi_olustur(api_key)
     except Exception as e:
         st.error(f"Groq client başlatılamadı: {str(e)}")
         return None
 
-client = init_groq_client()
-
-# Güncellenmiş Konu verileri (yeni soru sayılarıyla)
-KONU_VERILERI = {
-"Türkçe": {
-    "Paragraf":              { "zorluk": "Zor",   "ortalama_soru": 23, "kategori": "Dil" },
-    "Cümlede Anlam":         { "zorluk": "Orta",  "ortalama_soru": 5,  "kategori": "Dil" },
-    "Sözcükte Anlam":        { "zorluk": "Orta",  "ortalama_soru": 3,  "kategori": "Dil" },
-    "Dil Bilgisi":           { "zorluk": "Orta",  "ortalama_soru": 4,  "kategori": "Ezber" },
-    "Yazım Kuralları":       { "zorluk": "Kolay", "ortalama_soru": 2,  "kategori": "Ezber" },
-    "Noktalama İşaretleri":  { "zorluk": "Kolay", "ortalama_soru": 2,  "kategori": "Ezber" },
-    "Ses Bilgisi":           { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Ezber" }
-  },
-  "Matematik": {
-    "Problemler":            { "zorluk": "Zor",   "ortalama_soru": 12, "kategori": "Zor" },
-    "Temel Kavramlar":       { "zorluk": "Orta",  "ortalama_soru": 3,  "kategori": "Zor" },
-    "Sayı Basamakları":      { "zorluk": "Orta",  "ortalama_soru": 2,  "kategori": "Zor" },
-    "Rasyonel Sayılar":      { "zorluk": "Orta",  "ortalama_soru": 2,  "kategori": "Zor" },
-    "Mutlak Değer":          { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Zor" },
-    "Üslü Sayılar":          { "zorluk": "Orta",  "ortalama_soru": 2,  "kategori": "Zor" },
-    "Köklü Sayılar":         { "zorluk": "Orta",  "ortalama_soru": 2,  "kategori": "Zor" },
-    "Oran-Orantı":           { "zorluk": "Orta",  "ortalama_soru": 2,  "kategori": "Zor" },
-    "Denklem Çözme":         { "zorluk": "Orta",  "ortalama_soru": 2,  "kategori": "Zor" },
-    "Kümeler":               { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Zor" },
-    "Fonksiyonlar":          { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Zor" }
-  },
-  "Geometri": {
-    "Açılar & Üçgenler":    { "zorluk": "Zor",   "ortalama_soru": 4,  "kategori": "Zor" },
-    "Katı Cisimler":         { "zorluk": "Zor",   "ortalama_soru": 2,  "kategori": "Zor" },
-    "Dikdörtgen":            { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Zor" },
-    "Daire":                 { "zorluk": "Zor",   "ortalama_soru": 2,  "kategori": "Zor" },
-    "Analitik Geometri":     { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Zor" }
-  },
-  "Tarih": {
-    "İlk ve Orta Çağ":       { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
-    "İslamiyetin Kabulü":    { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
-    "Osmanlı":               { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Kolay" },
-    "Milli Mücadele":        { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Kolay" },
-    "Atatürkçülük":          { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" }
-  },
-  "Coğrafya": {
-    "İklim":                 { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Kolay" },
-    "Yeryüzü Şekilleri":     { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Kolay" },
-    "Nüfus ve Yerleşme":     { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
-    "Harita":                { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
-    "Ekonomi":               { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Kolay" }
-  },
-  "Felsefe": {
-    "Felsefenin Konusu":     { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Kolay" },
-    "Bilgi Felsefesi":       { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Kolay" },
-    "Ahlak Felsefesi":       { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Kolay" },
-    "Varlık Felsefesi":      { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Kolay" },
-    "Bilim Felsefesi":       { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Kolay" }
-  },
-  "Din Kültürü ve Ahlak Bilgisi": {
-    "Bilgi ve İnanç":        { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
-    "Din ve İslam":          { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
-    "İslam ve İbadet":       { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
-    "Gençlik ve Değerler":   { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" },
-    "İslam ve Bilim":        { "zorluk": "Kolay", "ortalama_soru": 1,  "kategori": "Kolay" }
-  },
-  "Fizik": {
-    "Elektrik ve Manyetizma":{ "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Orta" },
-    "Optik":                 { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Orta" },
-    "Hareket ve Kuvvet":     { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Orta" },
-    "Isı ve Sıcaklık":       { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Orta" },
-    "Madde ve Özellikleri":  { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Orta" },
-    "Basınç":                { "zorluk": "Zor",   "ortalama_soru": 1,  "kategori": "Orta" },
-    "Dalgalar":              { "zorluk": "Orta",  "ortalama_soru": 1,  "kategori": "Orta" }
-  },
-  "Kimya": {
-    "Atom ve Periyodik Sistem": { "zorluk": "Orta", "ortalama_soru": 2, "kategori": "Orta" },
-    "Kimyasal Tepkimeler":      { "zorluk": "Zor",  "ortalama_soru": 2, "kategori": "Orta" },
-    "Asit-Baz":                 { "zorluk": "Orta", "ortalama_soru": 1, "kategori": "Orta" },
-    "Organik Kimya":            { "zorluk": "Zor",  "ortalama_soru": 1, "kategori": "Orta" },
-    "Kimya ve Enerji":          { "zorluk": "Orta", "ortalama_soru": 1, "kategori": "Orta" }
-  },
-  "Biyoloji": {
-    "Hücre":                     { "zorluk": "Orta", "ortalama_soru": 2, "kategori": "Orta" },
-    "Canlıların Sınıflandırılması": { "zorluk": "Kolay", "ortalama_soru": 1, "kategori": "Orta" },
-    "Ekoloji":                   { "zorluk": "Orta", "ortalama_soru": 1, "kategori": "Orta" },
-    "Genetik":                   { "zorluk": "Zor",  "ortalama_soru": 1, "kategori": "Orta" },
-    "Canlılar ve Çevre":         { "zorluk": "Orta", "ortalama_soru": 1, "kategori": "Orta" }
-  }
-};
-
-
-# Kitap ve YouTube kaynakları
-KITAP_ONERILERI = {
-    "Türkçe": {
-        "Kolay": ["3D Türkçe Soru Bankası (Başlangıç)", "Tonguç Paragrafik", "Palme Türkçe Konu Anlatımlı", "Karekök 0 Türkçe", "Bilgiseli Türkçe"],
-        "Orta": ["Limit Yayınları TYT Türkçe", "ÜçDörtBeş TYT Paragraf Soru Bankası", "Hız ve Renk Türkçe", "Apotemi Türkçe Soru Bankası", "Benim Hocam TYT Türkçe"]
-    },
-    "Matematik": {
-        "Kolay": ["Karekök 0 Matematik", "Tonguç Kampüs TYT Matematik", "3D Matematik Konu Anlatımı", "Kolay Matematik Serisi", "Palme TYT Temel Matematik"],
-        "Orta": ["ÜçDörtBeş TYT Matematik", "Limit Matematik", "Bilgiseli TYT Matematik", "Apotemi TYT Matematik", "Endemik TYT Matematik"]
-    },
-    "Geometri": {
-        "Kolay": ["Karekök 0 Geometri", "Tonguç Kampüs TYT Geometri", "3D Geometri Konu Anlatımı", "Kolay Geometri Serisi", "Palme TYT Geometri"],
-        "Orta": ["ÜçDörtBeş TYT Geometri", "Limit Geometri", "Bilgiseli TYT Geometri", "Apotemi TYT Geometri", "Endemik TYT Geometri"]
-    },
-    "Fizik": {
-        "Kolay": ["3D TYT Fizik", "Palme Fen Bilimleri Set", "Karekök 0 Fen Serisi", "Birey A Fen Bilimleri", "Kolay Fen Bilimleri"],
-        "Orta": ["ÜçDörtBeş TYT Fen Bilimleri", "Apotemi TYT Fen Set", "Hız ve Renk TYT Fizik", "Aydın TYT Fizik", "Benim Hocam Fen Seti"]
-    },
-    "Kimya": {
-        "Kolay": ["3D TYT Kimya", "Palme Fen Bilimleri Set", "Karekök 0 Fen Serisi", "Birey A Fen Bilimleri", "Kolay Fen Bilimleri"],
-        "Orta": ["ÜçDörtBeş TYT Fen Bilimleri", "Apotemi TYT Fen Set", "Hız ve Renk TYT Kimya", "Aydın TYT Kimya", "Benim Hocam Fen Seti"]
-    },
-    "Biyoloji": {
-        "Kolay": ["3D TYT Biyoloji", "Palme Fen Bilimleri Set", "Karekök 0 Fen Serisi", "Birey A Fen Bilimleri", "Kolay Fen Bilimleri"],
-        "Orta": ["ÜçDörtBeş TYT Fen Bilimleri", "Apotemi TYT Fen Set", "Hız ve Renk TYT Biyoloji", "Aydın TYT Biyoloji", "Benim Hocam Fen Seti"]
-    },
-    "Tarih": {
-        "Kolay": ["Karekök 0 Sosyal Bilimler", "3D TYT Sosyal Bilimler", "Tonguç TYT Sosyal", "Palme Sosyal Bilimler", "Hız ve Renk TYT Sosyal"],
-        "Orta": ["ÜçDörtBeş TYT Sosyal Bilimler", "Limit Yayınları TYT Sosyal", "Bilgiseli Sosyal Bilimler", "Endemik Sosyal Bilimler", "Karekök Sosyal Bilimler"]
-    },
-    "Coğrafya": {
-        "Kolay": ["Karekök 0 Sosyal Bilimler", "3D TYT Sosyal Bilimler", "Tonguç TYT Sosyal", "Palme Sosyal Bilimler", "Hız ve Renk TYT Sosyal"],
-        "Orta": ["ÜçDörtBeş TYT Sosyal Bilimler", "Limit Yayınları TYT Sosyal", "Bilgiseli Sosyal Bilimler", "Endemik Sosyal Bilimler", "Karekök Sosyal Bilimler"]
-    },
-    "Felsefe": {
-        "Kolay": ["Karekök 0 Sosyal Bilimler", "3D TYT Sosyal Bilimler", "Tonguç TYT Sosyal", "Palme Sosyal Bilimler", "Hız ve Renk TYT Sosyal"],
-        "Orta": ["ÜçDörtBeş TYT Sosyal Bilimler", "Limit Yayınları TYT Sosyal", "Bilgiseli Sosyal Bilimler", "Endemik Sosyal Bilimler", "Karekök Sosyal Bilimler"]
-    },
-    "Din Kültürü ve Ahlak Bilgisi": {
-        "Kolay": ["Karekök 0 Sosyal Bilimler", "3D TYT Sosyal Bilimler", "Tonguç TYT Sosyal", "Palme Sosyal Bilimler", "Hız ve Renk TYT Sosyal"],
-        "Orta": ["ÜçDörtBeş TYT Sosyal Bilimler", "Limit Yayınları TYT Sosyal", "Bilgiseli Sosyal Bilimler", "Endemik Sosyal Bilimler", "Karekök Sosyal Bilimler"]
-    }
-}
-
-YOUTUBE_KANALLARI = {
-    "Türkçe": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Matematik Sevdası", "Öğretmen Akademisi"],
-    "Matematik": ["Tonguç Akademi", "Matematik Sevdası", "Benim Hocam", "Ders Vakti", "Matematik Dünyası"],
-    "Geometri": ["Tonguç Akademi", "Matematik Sevdası", "Benim Hocam", "Ders Vakti", "Geometri Dünyası"],
-    "Fizik": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Fizik Dünyası", "Fen Bilimleri Akademisi"],
-    "Kimya": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Kimya Dünyası", "Fen Bilimleri Akademisi"],
-    "Biyoloji": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Biyoloji Dünyası", "Fen Bilimleri Akademisi"],
-    "Tarih": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Tarih Dünyası", "Sosyal Bilimler Akademisi"],
-    "Coğrafya": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Coğrafya Dünyası", "Sosyal Bilimler Akademisi"],
-    "Felsefe": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Felsefe Dünyası", "Sosyal Bilimler Akademisi"],
-    "Din Kültürü ve Ahlak Bilgisi": ["Benim Hocam", "Tonguç Akademi", "Ders Vakti", "Din Kültürü Akademisi", "Sosyal Bilimler Akademisi"]
-}
-
-# Zaman dilimleri
-ZAMAN_DILIMLERI = {
-    "Zor": ["08:00-10:30", "16:00-18:00"],
-    "Orta": ["10:30-12:30", "19:00-21:00"],
-    "Kolay": ["13:30-15:30", "21:00-22:30"],
-    "Dil": ["06:30-08:00", "22:30-23:30"],
-    "Ezber": ["07:00-08:30", "22:00-23:00"]
-}
-
-# Zorluk katsayıları
-ZORLUK_KATSAYILARI = {
-    "Kolay": 0.5,
-    "Orta": 1,
-    "Zor": 2
-}
+# Groq çağrıları için tüm oturumlarca paylaşılan hız sınırı ve istek birleştirme
+@st.cache_resource
+def init_ai_kapisi():
+    kapi = IstekKapisi()
+    if OLCUM_ACIK:
+        KAYIT.gosterge_ekle('ai_kapisi', kapi.istatistikler)
+    return kapi
 
+ai_kapisi = init_ai_kapisi()
 
-# Geliştirilmiş AI Öneri Sistemi
-def get_ai_suggestion(konu_analizi, gunluk_saat, gun_sayisi):
-    """Geliştirilmiş ve daha detaylı AI önerisi"""
-    if not client:
-        return "AI hizmeti şu anda kullanılamıyor. Lütfen manuel olarak öncelikli konulara odaklanın."
-    
+# AI yanıt önbelleği (tüm oturumlarca paylaşılır)
+@st.cache_resource
+def init_ai_onbellek():
     try:
-        sorted_topics = sorted(konu_analizi.items(), key=lambda x: x[1]['oncelik_puani'], reverse=True)
-        kotu_konular = sorted_topics[:8]
-        orta_konular = sorted_topics[8:16] if len(sorted_topics) > 8 else []
-        iyi_konular = sorted_topics[-5:]
-        
-        # Ders bazında analiz
-        ders_analizi = {}
-        for konu, info in konu_analizi.items():
-            ders = info['ders']
-            if ders not in ders_analizi:
-                ders_analizi[ders] = {'toplam_puan': 0, 'konu_sayisi': 0, 'zayif_konular': 0}
-            ders_analizi[ders]['toplam_puan'] += info['oncelik_puani']
-            ders_analizi[ders]['konu_sayisi'] += 1
-            if info['oncelik_puani'] > 5:
-                ders_analizi[ders]['zayif_konular'] += 1
-        
-        for ders in ders_analizi:
-            ders_analizi[ders]['ortalama'] = ders_analizi[ders]['toplam_puan'] / ders_analizi[ders]['konu_sayisi']
-            ders_analizi[ders]['zayiflik_orani'] = ders_analizi[ders]['zayif_konular'] / ders_analizi[ders]['konu_sayisi']
-        
-        en_zayif_ders = max(ders_analizi.items(), key=lambda x: x[1]['ortalama'])
-        
-        # Hedef belirleme
-        toplam_saat = gunluk_saat * gun_sayisi
-        kritik_konu_sayisi = len([k for k, v in konu_analizi.items() if v['oncelik_puani'] > 5])
-        
-        prompt = f"""
-        Sen TYT'de uzman bir eğitim koçusun. Türkçe cevaplamalısın sadece. Öğrencinin detaylı performans analizini yapıp, kişiselleştirilmiş {gun_sayisi} günlük strateji hazırlayacaksın.
-
-        📊 ÖĞRENCİ PROFİLİ:
-        • Toplam çalışma süresi: {toplam_saat} saat ({gun_sayisi} gün x {gunluk_saat} saat)
-        • Kritik durumdaki konu sayısı: {kritik_konu_sayisi}
-        • En zayıf alan: {en_zayif_ders[0]} (Risk skoru: {en_zayif_ders[1]['ortalama']:.1f})
-        
-        🔴 ACİL MÜDAHALE GEREKTİREN KONULAR:
-        {chr(10).join([f"• {konu.split(' - ')[1]} ({konu.split(' - ')[0]}) - Risk: {info['oncelik_puani']:.1f}/10" for konu, info in kotu_konular])}
-        
-        🟡 GELİŞTİRİLMESİ GEREKEN KONULAR:
-        {chr(10).join([f"• {konu.split(' - ')[1]} ({konu.split(' - ')[0]}) - Risk: {info['oncelik_puani']:.1f}/10" for konu, info in orta_konular])}
-        
-        🟢 GÜÇLÜ ALANLAR (Koruma altında):
-        {chr(10).join([f"• {konu.split(' - ')[1]} ({konu.split(' - ')[0]}) - Risk: {info['oncelik_puani']:.1f}/10" for konu, info in iyi_konular])}
-        
-        📈 DERS BAZLI ZAYIFLIK ANALİZİ:
-        {chr(10).join([f"• {ders}: %{data['zayiflik_orani']*100:.0f} zayıf konu oranı" for ders, data in ders_analizi.items()])}
-        
-        GÖREV: Aşağıdaki kriterlere göre {gun_sayisi} günlük DETAYLI strateji hazırla (en az 800 kelime):
-        1. Kritik konular için haftalık çalışma planı (konu bazlı)
-        2. Her kritik konu için özel çalışma teknikleri
-        3. Zaman yönetimi stratejileri
-        4. Kaynak önerileri (kitap, video, uygulama)
-        5. Motivasyon teknikleri ve başarı hikayeleri
-        6. Deneme sınavı takvimi
-        7. Ölçme-değerlendirme yöntemleri
-        8. Uyku ve beslenme düzeni önerileri
-        9. Stres yönetimi teknikleri
-        10. Son hafta için özel taktikler
-        
-        Çıktıyı başlıklar halinde düzenle ve her bölüm için en az 3-5 madde içeren detaylı açıklamalar yap.
-        """
-        
-        chat_completion = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system", 
-                    "content": "Sen TYT'de uzman, analitik düşünen ve öğrenci psikolojisini iyi bilen bir eğitim koçusun. Veriye dayalı, kişiselleştirilmiş ve motive edici stratejiler sunuyorsun. Önerilerin en az 800 kelime olmalı ve tüm detayları kapsamalı."
-                },
-                {"role": "user", "content": prompt}
-            ],
-            model="llama3-70b-8192",
-            max_tokens=4000,
-            temperature=0.7
-        )
-        
-        return chat_completion.choices[0].message.content
+        return DiskOnbellek(kapasite=500, ttl=3 * 24 * 3600)
     except Exception as e:
-        return f"AI önerisi alınırken hata oluştu: {str(e)}"
+        st.error(f"AI önbelleği açılamadı: {str(e)}")
+        return None
 
+ai_onbellek = init_ai_onbellek()
 
-def hesapla_oncelik_puani(dogru, yanlis, bos, zorluk, ortalama_soru):
-    """Geliştirilmiş öncelik puanı hesapla"""
-    zorluk_katsayisi = ZORLUK_KATSAYILARI[zorluk]
-    
-    # Yeni formül: Yanlış ve boşları birlikte değerlendir
-    puan = ((yanlis + bos) * 1.2) + (zorluk_katsayisi * 3)
-    
-    # Konu önem ağırlığı (logaritmik ölçek)
-    onem_agirligi = np.log1p(ortalama_soru) * 3
-    
-    # Final puan
-    oncelik_puani = puan * onem_agirligi
-    
-    return oncelik_puani
+# Öğrenci deneme geçmişi (tüm oturumlarca paylaşılan SQLite deposu)
+@st.cache_resource
+def init_deneme_deposu():
+    try:
+        return DenemeDeposu()
+    except Exception as e:
+        st.error(f"Deneme geçmişi açılamadı: {str(e)}")
+        return None
 
-def analiz_et(veriler):
-    """Tüm verileri analiz et"""
-    analiz = {}
-    for ders, konular in veriler.items():
-        for konu, sonuclar in konular.items():
-            if sonuclar['dogru'] + sonuclar['yanlis'] + sonuclar['bos'] > 0:
-                konu_bilgi = KONU_VERILERI[ders][konu]
-                
-                oncelik_puani = hesapla_oncelik_puani(
-                    sonuclar['dogru'], 
-                    sonuclar['yanlis'], 
-                    sonuclar['bos'],
-                    konu_bilgi['zorluk'],
-                    konu_bilgi['ortalama_soru']
-                )
-                
-                analiz[f"{ders} - {konu}"] = {
-                    'ders': ders,
-                    'konu': konu,
-                    'oncelik_puani': oncelik_puani,
-                    'dogru': sonuclar['dogru'],
-                    'yanlis': sonuclar['yanlis'],
-                    'bos': sonuclar['bos'],
-                    'zorluk': konu_bilgi['zorluk'],
-                    'kategori': konu_bilgi['kategori'],
-                    'gercek_soru': sonuclar['gercek_soru']
-                }
-    return analiz
+deneme_deposu = init_deneme_deposu()
 
-def program_olustur_zaman_dilimli(analiz, baslangic_tarihi, gun_sayisi, gunluk_saat):
-    """Zaman dilimli çalışma programı oluştur"""
-    sorted_konular = sorted(analiz.items(), key=lambda x: x[1]['oncelik_puani'], reverse=True)
-    
-    program = []
-    current_date = baslangic_tarihi
-    
-    # Kategorilere göre konuları ayır
-    kategoriler = {
-        "Zor": [],
-        "Orta": [],
-        "Kolay": [],
-        "Dil": [],
-        "Ezber": []
-    }
-    
-    for konu_adi, bilgi in sorted_konular:
-        kategori = bilgi['kategori']
-        kategoriler[kategori].append((konu_adi, bilgi))
-    
-    # Her gün için program oluştur
-    for gun in range(gun_sayisi):
-        tarih = current_date + timedelta(days=gun)
-        
-        # Günlük saate göre zaman dilimlerini belirle
-        if gunluk_saat <= 2:
-            secilen_dilimler = ["08:00-10:30"]
-        elif gunluk_saat <= 4:
-            secilen_dilimler = ["08:00-10:30", "16:00-18:00"]
-        elif gunluk_saat <= 6:
-            secilen_dilimler = ["08:00-10:30", "10:30-12:30", "19:00-21:00"]
-        else:
-            secilen_dilimler = ["08:00-10:30", "10:30-12:30", "16:00-18:00", "19:00-21:00"]
-        
-        # Her zaman dilimine konu ata
-        for zaman_dilimi in secilen_dilimler:
-            # Öncelikli konu bul
-            secilen_konu = None
-            for kategori, konular in kategoriler.items():
-                if konular:
-                    secilen_konu = konular.pop(0)
-                    break
-            
-            if secilen_konu:
-                konu_adi, bilgi = secilen_konu
-                
-                program.append({
-                    'Gün': gun + 1,
-                    'Tarih': tarih.strftime('%d.%m.%Y'),
-                    'Zaman': zaman_dilimi,
-                    'Ders': bilgi['ders'],
-                    'Konu': bilgi['konu'],
-                    'Öncelik Puanı': bilgi['oncelik_puani'],
-                    'Zorluk': bilgi['zorluk'],
-                    'Kategori': bilgi['kategori'],
-                    'Doğru': bilgi['dogru'],
-                    'Yanlış': bilgi['yanlis'],
-                    'Boş': bilgi['bos']
-                })
-    
-    return program
+# Çözülmüş PDF karneleri dosya özetiyle önbelleğe alınır
+@st.cache_resource
+def init_karne_onbellegi():
+    try:
+        return varsayilan_karne_onbellegi()
+    except Exception as e:
+        st.error(f"Karne önbelleği açılamadı: {str(e)}")
+        return None
 
-def excel_export_professional(program_df):
-    """Profesyonel Excel çıktısı"""
-    output = io.BytesIO()
-    
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "TYT Çalışma Programı"
-    
-    # Başlık stilleri
-    header_font = Font(bold=True, color="FFFFFF", size=12)
-    header_fill = PatternFill(start_color="2F4F4F", end_color="2F4F4F", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center")
-    
-    # Kenarlık
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    # Koşullu biçimlendirme renkleri
-    high_priority_fill = PatternFill(start_color="FFE4E1", end_color="FFE4E1", fill_type="solid")
-    hard_topic_fill = PatternFill(start_color="FFF8DC", end_color="FFF8DC", fill_type="solid")
-    
-    # Başlıkları ekle
-    for col, header in enumerate(program_df.columns, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
-    
-    # Verileri ekle
-    for row_idx, row in enumerate(dataframe_to_rows(program_df, index=False, header=False), 2):
-        for col_idx, value in enumerate(row, 1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=value)
-            cell.border = thin_border
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            # Koşullu biçimlendirme
-            if col_idx == 6:  # Öncelik Puanı sütunu
-                if isinstance(value, (int, float)) and value > 5:
-                    cell.fill = high_priority_fill
-                    cell.font = Font(bold=True, color="8B0000")
-            
-            if col_idx == 7:  # Zorluk sütunu
-                if value == "Zor":
-                    cell.fill = hard_topic_fill
-                    cell.font = Font(bold=True, color="FF8C00")
-    
-    # Sütun genişliklerini ayarla
-    column_widths = {
-        'A': 8,   # Gün
-        'B': 12,  # Tarih
-        'C': 15,  # Zaman
-        'D': 12,  # Ders
-        'E': 35,  # Konu
-        'F': 15,  # Öncelik Puanı
-        'G': 12,  # Zorluk
-        'H': 12,  # Kategori
-        'I': 8,   # Doğru
-        'J': 8,   # Yanlış
-        'K': 8    # Boş
-    }
-    
-    for col, width in column_widths.items():
-        ws.column_dimensions[col].width = width
-    
-    # Dosyayı kaydet
-    wb.save(output)
-    output.seek(0)
-    
-    return output.getvalue()
+karne_onbellegi = init_karne_onbellegi()
 
-# Yeni fonksiyon: Öğrenci performans özeti
-def hesapla_performans_ozeti(veriler):
-    """Öğrencinin genel performans özetini hesapla"""
-    ozet = {
-        'Toplam Soru': 0,
-        'Toplam Doğru': 0,
-        'Toplam Yanlış': 0,
-        'Toplam Boş': 0,
-        'Net': 0,
-        'Max Net': 0,
-        'Kalan Net': 0,
-        'Başarı Oranı': 0
-    }
-    
-    ders_bazli = {}
-    
-    for ders, konular in veriler.items():
-        ders_toplam = 0
-        ders_dogru = 0
-        ders_yanlis = 0
-        ders_bos = 0
-        
-        for konu, sonuclar in konular.items():
-            ders_toplam += sonuclar['gercek_soru']
-            ders_dogru += sonuclar['dogru']
-            ders_yanlis += sonuclar['yanlis']
-            ders_bos += sonuclar['bos']
-            
-            # Genel toplamlar
-            ozet['Toplam Soru'] += sonuclar['gercek_soru']
-            ozet['Toplam Doğru'] += sonuclar['dogru']
-            ozet['Toplam Yanlış'] += sonuclar['yanlis']
-            ozet['Toplam Boş'] += sonuclar['bos']
-        
-        # Ders neti (Doğru - Yanlış/4)
-        ders_net = ders_dogru - (ders_yanlis / 4)
-        ders_max_net = ders_toplam
-        
-        ders_bazli[ders] = {
-            'Toplam Soru': ders_toplam,
-            'Doğru': ders_dogru,
-            'Yanlış': ders_yanlis,
-            'Boş': ders_bos,
-            'Net': ders_net,
-            'Max Net': ders_max_net,
-            'Kalan Net': ders_max_net - ders_net,
-            'Başarı Oranı': (ders_dogru / ders_toplam * 100) if ders_toplam > 0 else 0
-        }
-    
-    # Genel net hesaplama
-    ozet['Net'] = ozet['Toplam Doğru'] - (ozet['Toplam Yanlış'] / 4)
-    ozet['Max Net'] = ozet['Toplam Soru']
-    ozet['Kalan Net'] = ozet['Max Net'] - ozet['Net']
-    ozet['Başarı Oranı'] = (ozet['Toplam Doğru'] / ozet['Toplam Soru'] * 100) if ozet['Toplam Soru'] > 0 else 0
-    
-    return ozet, ders_bazli
+# TYT_OLCUM açıkken TYT_OLCUM_PORT verilirse ölçümler /metrics üzerinden sunulur;
+# sunucu yalnızca yerel adrese bağlanır, daha geniş erişim için TYT_OLCUM_ADRES verilir
+@st.cache_resource
+def init_olcum_sunucusu():
+    port = os.environ.get("TYT_OLCUM_PORT")
+    if not (OLCUM_ACIK and port):
+        return None
+    try:
+        return sunucu_baslat(int(port), os.environ.get("TYT_OLCUM_ADRES", "127.0.0.1"))
+    except Exception as e:
+        st.error(f"Ölçüm sunucusu başlatılamadı: {str(e)}")
+        return None
 
-def hesapla_ders_basari_orani(analiz_sonucu):
-    """Her ders için başarı oranını hesapla"""
-    ders_analizi = {}
-    
-    for konu_adi, bilgi in analiz_sonucu.items():
-        ders = bilgi['ders']
-        if ders not in ders_analizi:
-            ders_analizi[ders] = {
-                'toplam_puan': 0,
-                'konu_sayisi': 0,
-                'ortalama_puan': 0,
-                'seviye': 'Kolay'
-            }
-        
-        ders_analizi[ders]['toplam_puan'] += bilgi['oncelik_puani']
-        ders_analizi[ders]['konu_sayisi'] += 1
-    
-    # Ortalama hesapla ve seviye belirle (YENİ ALGORİTMA)
-    for ders in ders_analizi:
-        ortalama = ders_analizi[ders]['toplam_puan'] / ders_analizi[ders]['konu_sayisi']
-        ders_analizi[ders]['ortalama_puan'] = ortalama
-        
-        # Yeni seviye algoritması
-        if ortalama >= 7:
-            ders_analizi[ders]['seviye'] = 'Zor'
-        elif ortalama >= 4:
-            ders_analizi[ders]['seviye'] = 'Orta'
-        else:
-            ders_analizi[ders]['seviye'] = 'Kolay'
-    
-    return ders_analizi
+init_olcum_sunucusu()
 
-def youtube_video_ara(ders_adi, konu_adi):
-    """YouTube'dan video ara"""
-    return [
-        f"TYT {ders_adi} {konu_adi} Konu Anlatımı",
-        f"TYT {ders_adi} {konu_adi} Soru Çözümü",
-        f"TYT {ders_adi} {konu_adi} Tekrar Videosu",
-        f"TYT {ders_adi} {konu_adi} Pratik Yöntemler"
-    ]
+# Analiz bir kez yapıldıktan sonra veri değişiklikleri yalnızca değişen konuları yeniden puanlar
+def guncel_artimli_analiz():
+    artimli = st.session_state.get('artimli_analiz')
+    if artimli is None or artimli.veriler is not st.session_state.get('veriler'):
+        return None
+    if artimli.esitle():
+        artimli.uygula()
+    return artimli
 
 # Streamlit arayüzü
 st.set_page_config(page_title="TYT Hazırlık Uygulaması", layout="wide")
@@ -552,6 +108,10 @@ st.set_page_config(page_title="TYT Hazırlık Uygulaması", layout="wide")
 st.title("🎯 TYT Hazırlık Uygulaması")
 st.markdown("---")
 
+# AI istek kuyruğunda oturumlar arası adil sıra için oturum kimliği
+if 'oturum_kimligi' not in st.session_state:
+    st.session_state.oturum_kimligi = uuid.uuid4().hex
+
 # Sidebar - AI Koç
 with st.sidebar:
     st.header("🤖 AI Koçun")
@@ -561,472 +121,677 @@ with st.sidebar:
     gunluk_saat = st.slider("Günlük Çalışma Saati", 1, 12, 4)
     gun_sayisi = st.number_input("Kaç Gün Çalışacaksınız?", min_value=1, max_value=365, value=30)
     
-    if client:
-        if st.button("🔥 Kişisel Strateji Al"):
-            if 'analiz_sonucu' in st.session_state:
-                with st.spinner("AI senin için özel strateji hazırlıyor..."):
-                    suggestion = get_ai_suggestion(st.session_state['analiz_sonucu'], gunluk_saat, gun_sayisi)
-                    st.success("🎯 **Senin İçin Özel Strateji:**")
-                    st.info(suggestion)
-            else:
-                st.warning("⚠️ Önce veri giriş yapın!")
+    if st.button("🔥 Kişisel Strateji Al"):
+        # groq paketi ve istemci yalnızca ilk kullanımda yüklenir
+        client = init_groq_client()
+        if not client:
+            st.warning("AI hizmeti şu anda kullanılamıyor.")
+        elif 'analiz_sonucu' in st.session_state:
+            st.success("🎯 **Senin İçin Özel Strateji:**")
+            alan = st.empty()
+            alan.info("AI senin için özel strateji hazırlıyor...")
+            
+            # Yanıt geldikçe parça parça göster
+            suggestion = ""
+            artimli = guncel_artimli_analiz()
+            for parca in get_ai_suggestion(st.session_state['analiz_sonucu'], gunluk_saat, gun_sayisi,
+                                           client, ai_onbellek, akis=True,
+                                           toplamlar=artimli.toplamlar if artimli else None,
+                                           kapi=ai_kapisi, oturum=st.session_state.oturum_kimligi):
+                suggestion += parca
+                alan.info(suggestion + " ▌")
+            alan.info(suggestion)
+        else:
+            st.warning("⚠️ Önce veri giriş yapın!")
+    
+    kapi_durumu = ai_kapisi.istatistikler()
+    if kapi_durumu['kuyruk_derinligi'] or kapi_durumu['ucustaki_istek']:
+        st.caption(
+            f"⏳ AI kuyruğu: {kapi_durumu['kuyruk_derinligi']} bekleyen, "
+            f"{kapi_durumu['ucustaki_istek']} süren istek, ortalama bekleme {kapi_durumu['ortalama_bekleme_s']:.1f} sn"
+        )
+    
+    if ai_onbellek:
+        istatistik = ai_onbellek.istatistikler()
+        st.caption(
+            f"🗄️ AI önbelleği: {istatistik['isabet']} isabet / {istatistik['iska']} ıska "
+            f"(%{istatistik['isabet_orani'] * 100:.0f}), {istatistik['girdi_sayisi']} kayıt"
+        )
+
+# Toplu giriş formu gönderildiğinde tüm tabloları tek seferde kaydet
+def toplu_giris_kaydet(ders_gruplari):
+    surum = st.session_state.get('toplu_giris_surumu', 0)
+    duzeltilenler = []
+    for grup_adi, dersler in ders_gruplari.items():
+        durum = st.session_state.get(f"toplu_giris_{grup_adi}_{surum}") or {}
+        duzeltilenler += duzenlemeleri_uygula(st.session_state.veriler, dersler, durum.get('edited_rows', {}))
+    # Tablolar kaydedilen (düzeltilmiş) değerlerle yeniden kurulsun
+    st.session_state.toplu_giris_surumu = surum + 1
+    st.session_state.toplu_giris_duzeltmeleri = duzeltilenler
+    st.session_state.toplu_giris_kaydedildi = True
+
+# Yüklenen sonuçları mevcut verilerin yerine yaz (olmayan konular varsayılana döner)
+def verileri_yukle(yuklenen):
+    # veriler yerinde güncellenir; mevcut analiz değişen konuları artımlı olarak yeniden puanlar
+    veriler = st.session_state.setdefault('veriler', {})
+    for ders, konular in KONU_VERILERI.items():
+        ders_verileri = veriler.setdefault(ders, {})
+        for konu in konular:
+            ders_verileri[konu] = yuklenen.get(ders, {}).get(konu) or varsayilan_kayit(ders, konu)
+            for alan in ('gercek', 'dogru', 'yanlis'):
+                st.session_state.pop(f"{ders}_{konu}_{alan}", None)
+    st.session_state.toplu_giris_surumu = st.session_state.get('toplu_giris_surumu', 0) + 1
+
+# Öğrencinin son kayıtlı denemesini mevcut verilerin yerine yükle
+def son_denemeyi_yukle():
+    ogrenci = st.session_state.get('ogrenci_adi', '').strip()
+    yuklenen = deneme_deposu.son_veriler(ogrenci) if ogrenci else None
+    if yuklenen is None:
+        st.session_state.deneme_gecmisi_mesaji = ('warning', f"⚠️ '{ogrenci}' için kayıtlı deneme bulunamadı.")
+        return
+    verileri_yukle(yuklenen)
+    st.session_state.deneme_gecmisi_mesaji = ('success', f"✅ {ogrenci} için son deneme yüklendi.")
+
+def denemeyi_kaydet():
+    ogrenci = st.session_state.get('ogrenci_adi', '').strip()
+    if not ogrenci:
+        st.session_state.deneme_gecmisi_mesaji = ('warning', "⚠️ Önce öğrenci adını girin.")
+        return
+    deneme_deposu.deneme_kaydet(ogrenci, st.session_state.veriler, st.session_state.get('deneme_tarihi'))
+    st.session_state.deneme_gecmisi_mesaji = ('success', f"✅ Deneme {ogrenci} adına kaydedildi.")
+
+# PDF karneyi çöz; tek öğrenci varsa doğrudan yükle, birden çoksa seçime bırak
+def karneden_aktar():
+    import tempfile
+
+    dosya = st.session_state.get('karne_pdf')
+    if dosya is None:
+        st.session_state.karne_mesaji = ('warning', "⚠️ Önce bir PDF karne seçin.")
+        return
+    try:
+        with tempfile.TemporaryDirectory() as dizin:
+            yol = os.path.join(dizin, os.path.basename(dosya.name))
+            with open(yol, "wb") as f:
+                f.write(dosya.getbuffer())
+            karne = next(karneleri_oku([yol], onbellek=karne_onbellegi))
+    except Exception as e:
+        st.session_state.karne_mesaji = ('error', f"Karne okunamadı: {str(e)}")
+        return
+
+    st.session_state.karne_ogrencileri = karne.ogrenciler
+    if not karne.ogrenciler:
+        st.session_state.karne_mesaji = ('warning', "⚠️ Karnede tanınan konu satırı bulunamadı.")
+    elif len(karne.ogrenciler) == 1:
+        karne_ogrencisini_yukle(0)
     else:
-        st.warning("AI hizmeti şu anda kullanılamıyor.")
+        st.session_state.karne_mesaji = (
+            'info', f"ℹ️ Karnede {len(karne.ogrenciler)} öğrenci var ({karne.sayfa_sayisi} sayfa); yükleneni seçin."
+        )
+
+def karne_ogrencisini_yukle(sira=None):
+    if sira is None:
+        sira = st.session_state.get('karne_secimi', 0)
+    ogrenci, veriler = st.session_state.karne_ogrencileri[sira]
+    verileri_yukle(veriler)
+    st.session_state.ogrenci_adi = ogrenci
+    konu_sayisi = sum(len(konular) for konular in veriler.values())
+    st.session_state.karne_mesaji = ('success', f"✅ {ogrenci}: {konu_sayisi} konunun sonucu karneden aktarıldı.")
+
+# Tüm konular için varsayılan kayıtlar (her sekme bu verileri kullanır)
+if 'veriler' not in st.session_state:
+    st.session_state.veriler = {}
+for ders, konular in KONU_VERILERI.items():
+    ders_verileri = st.session_state.veriler.setdefault(ders, {})
+    for konu in konular:
+        if konu not in ders_verileri:
+            ders_verileri[konu] = varsayilan_kayit(ders, konu)
+
+# Yalnızca seçili sekmenin gövdesi çalışır. Çizilmeyen widget'ların değerleri
+# Streamlit tarafından silindiğinden sekmeler arasında korunacaklar yeniden yazılır.
+KALICI_ANAHTARLAR = ("ogrenci_adi", "deneme_tarihi", "karne_secimi", "giris_modu", "takvim_sayfasi")
+for anahtar in KALICI_ANAHTARLAR:
+    if anahtar in st.session_state:
+        st.session_state[anahtar] = st.session_state[anahtar]
 
 # Ana içerik - Yeni tab ekledik
-tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Veri Giriş", "📈 Analiz", "📅 Program", "📚 Kaynaklar", "📝 Öğrenci Özeti"])
+tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(
+    ["📊 Veri Giriş", "📈 Analiz", "📅 Program", "📚 Kaynaklar", "📝 Öğrenci Özeti", "📉 Gelişim"],
+    key="aktif_sekme", on_change="rerun"
+)
 
-with tab1:
-    st.header("Deneme Sonuçlarını Girin")
-    
-    if 'veriler' not in st.session_state:
-        st.session_state.veriler = {}
-    
-    ders_gruplari = {
-        "Türkçe": ["Türkçe"],
-        "Matematik": ["Matematik", "Geometri"],
-        "Fen Bilimleri": ["Fizik", "Kimya", "Biyoloji"],
-        "Sosyal Bilimler": ["Tarih", "Coğrafya", "Felsefe", "Din Kültürü ve Ahlak Bilgisi"]
-    }
-    
-    for grup_adi, dersler in ders_gruplari.items():
-        with st.expander(f"📚 {grup_adi}", expanded=False):
-            for ders in dersler:
-                st.subheader(f"{ders}")
-                
-                if ders not in st.session_state.veriler:
-                    st.session_state.veriler[ders] = {}
+if tab1.open:
+    with tab1, olc('sekme.veri_giris'):
+        st.header("Deneme Sonuçlarını Girin")
+        
+        ders_gruplari = {
+            "Türkçe": ["Türkçe"],
+            "Matematik": ["Matematik", "Geometri"],
+            "Fen Bilimleri": ["Fizik", "Kimya", "Biyoloji"],
+            "Sosyal Bilimler": ["Tarih", "Coğrafya", "Felsefe", "Din Kültürü ve Ahlak Bilgisi"]
+        }
+        
+        if deneme_deposu:
+            with st.expander("🗂️ Deneme Geçmişi", expanded=False):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.text_input("Öğrenci Adı", key="ogrenci_adi")
+                with col2:
+                    st.date_input("Deneme Tarihi", key="deneme_tarihi")
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.button("📂 Son Denemeyi Yükle", on_click=son_denemeyi_yukle)
+                with col2:
+                    st.button("💾 Denemeyi Geçmişe Kaydet", on_click=denemeyi_kaydet)
                 
-                cols = st.columns(3)
-                for i, (konu, bilgi) in enumerate(KONU_VERILERI[ders].items()):
-                    col_idx = i % 3
-                        
-                    with cols[col_idx]:
-                        st.markdown(f"**{konu}**")
-                        st.caption(f"Zorluk: {bilgi['zorluk']} | Ortalama: {bilgi['ortalama_soru']} soru")
+                mesaj = st.session_state.pop('deneme_gecmisi_mesaji', None)
+                if mesaj:
+                    getattr(st, mesaj[0])(mesaj[1])
+                ogrenci = st.session_state.get('ogrenci_adi', '').strip()
+                if ogrenci:
+                    denemeler = deneme_deposu.denemeler(ogrenci)
+                    if denemeler:
+                        st.caption(f"📚 {len(denemeler)} kayıtlı deneme, son: {denemeler[-1][1]}")
+        
+        with st.expander("📄 Karneden Aktar (PDF)", expanded=False):
+            st.file_uploader("Yayınevi Karnesi", type=["pdf"], key="karne_pdf",
+                             help="Konu satırlarındaki doğru/yanlış/boş sayıları okunur; "
+                                  "her sayfası ayrı öğrenci olan sınıf karneleri de desteklenir.")
+            st.button("📥 Karneden Aktar", on_click=karneden_aktar)
+            
+            karne_ogrencileri = st.session_state.get('karne_ogrencileri') or []
+            if len(karne_ogrencileri) > 1:
+                st.selectbox("Öğrenci", range(len(karne_ogrencileri)), key="karne_secimi",
+                             format_func=lambda i: karne_ogrencileri[i][0])
+                st.button("📂 Seçili Öğrenciyi Yükle", on_click=karne_ogrencisini_yukle)
+            
+            mesaj = st.session_state.pop('karne_mesaji', None)
+            if mesaj:
+                getattr(st, mesaj[0])(mesaj[1])
+        
+        giris_modu = st.radio(
+            "Giriş Modu", ["📋 Toplu (tablo)", "⌨️ Anlık (konu konu)"], horizontal=True, key="giris_modu",
+            help="Toplu modda değerler 'Sonuçları Kaydet' ile tek seferde kaydedilir; "
+                 "anlık modda her değişiklik sayfayı yeniden çalıştırır."
+        )
+        
+        if giris_modu.startswith("📋"):
+            # Form içindeki düzenlemeler gönderilene kadar sayfayı yeniden çalıştırmaz
+            surum = st.session_state.get('toplu_giris_surumu', 0)
+            with st.form("toplu_giris"):
+                for grup_adi, dersler in ders_gruplari.items():
+                    with st.expander(f"📚 {grup_adi}", expanded=False):
+                        st.data_editor(
+                            pd.DataFrame(giris_tablosu(st.session_state.veriler, dersler), columns=GIRIS_SUTUNLARI),
+                            key=f"toplu_giris_{grup_adi}_{surum}",
+                            column_config={
+                                'Soru': st.column_config.NumberColumn(
+                                    "Soru", help="Denemede bu konudan kaç soru vardı?",
+                                    min_value=0, max_value=MAKS_SORU, step=1
+                                ),
+                                'Doğru': st.column_config.NumberColumn("Doğru", min_value=0, max_value=MAKS_SORU, step=1),
+                                'Yanlış': st.column_config.NumberColumn("Yanlış", min_value=0, max_value=MAKS_SORU, step=1),
+                                'Boş': st.column_config.NumberColumn("Boş (Otomatik)"),
+                            },
+                            disabled=['Ders', 'Konu', 'Zorluk', 'Boş'],
+                            hide_index=True,
+                            use_container_width=True
+                        )
+                st.form_submit_button("💾 Sonuçları Kaydet", on_click=toplu_giris_kaydet, args=(ders_gruplari,))
+            
+            if st.session_state.pop('toplu_giris_kaydedildi', False):
+                st.success("✅ Tüm sonuçlar kaydedildi.")
+                duzeltilenler = st.session_state.get('toplu_giris_duzeltmeleri', [])
+                if duzeltilenler:
+                    st.warning(
+                        "⚠️ Bazı değerler giriş sınırlarını aşıyordu ve düzeltildi: "
+                        + ", ".join(duzeltilenler)
+                    )
+        else:
+            for grup_adi, dersler in ders_gruplari.items():
+                with st.expander(f"📚 {grup_adi}", expanded=False):
+                    for ders in dersler:
+                        st.subheader(f"{ders}")
+                    
+                        if ders not in st.session_state.veriler:
+                            st.session_state.veriler[ders] = {}
+                    
+                        cols = st.columns(3)
+                        for i, (konu, bilgi) in enumerate(KONU_VERILERI[ders].items()):
+                            col_idx = i % 3
+                            
+                            with cols[col_idx]:
+                                st.markdown(f"**{konu}**")
+                                st.caption(f"Zorluk: {bilgi['zorluk']} | Ortalama: {bilgi['ortalama_soru']} soru")
+                                
+                                if konu not in st.session_state.veriler[ders]:
+                                    st.session_state.veriler[ders][konu] = {
+                                        'dogru': 0, 'yanlis': 0, 'bos': 0, 'gercek_soru': bilgi['ortalama_soru']
+                                    }
+                                
+                                # Gerçek soru sayısı
+                                gercek_soru = st.number_input(
+                                    f"Denemede Bu Konudan Kaç Soru Vardı?",
+                                    min_value=0,
+                                    max_value=50,
+                                    key=f"{ders}_{konu}_gercek",
+                                    value=st.session_state.veriler[ders][konu]['gercek_soru']
+                                )
                             
-                        if konu not in st.session_state.veriler[ders]:
-                            st.session_state.veriler[ders][konu] = {
-                                'dogru': 0, 'yanlis': 0, 'bos': 0, 'gercek_soru': bilgi['ortalama_soru']
-                            }
+                                # Doğru cevaplar
+                                current_dogru = st.session_state.veriler[ders][konu]['dogru']
+                                if current_dogru > gercek_soru:
+                                    current_dogru = gercek_soru
+                                
+                                dogru = st.number_input(
+                                    f"Doğru", 
+                                    min_value=0, 
+                                    max_value=gercek_soru,
+                                    key=f"{ders}_{konu}_dogru", 
+                                    value=current_dogru
+                                )
                             
-                        # Gerçek soru sayısı
-                        gercek_soru = st.number_input(
-                            f"Denemede Bu Konudan Kaç Soru Vardı?",
-                            min_value=0,
-                            max_value=50,
-                            key=f"{ders}_{konu}_gercek",
-                            value=st.session_state.veriler[ders][konu]['gercek_soru']
-                        )
-                        
-                        # Doğru cevaplar
-                        current_dogru = st.session_state.veriler[ders][konu]['dogru']
-                        if current_dogru > gercek_soru:
-                            current_dogru = gercek_soru
+                                # Yanlış cevaplar
+                                current_yanlis = st.session_state.veriler[ders][konu]['yanlis']
+                                max_yanlis = gercek_soru - dogru
                             
-                        dogru = st.number_input(
-                            f"Doğru", 
-                            min_value=0, 
-                            max_value=gercek_soru,
-                            key=f"{ders}_{konu}_dogru", 
-                            value=current_dogru
-                        )
-                        
-                        # Yanlış cevaplar
-                        current_yanlis = st.session_state.veriler[ders][konu]['yanlis']
-                        max_yanlis = gercek_soru - dogru
-                        
-                        if current_yanlis > max_yanlis:
-                            current_yanlis = max_yanlis
+                                if current_yanlis > max_yanlis:
+                                    current_yanlis = max_yanlis
+                                
+                                yanlis = st.number_input(
+                                    f"Yanlış", 
+                                    min_value=0, 
+                                    max_value=max_yanlis,
+                                    key=f"{ders}_{konu}_yanlis",
+                                    value=current_yanlis
+                                )
                             
-                        yanlis = st.number_input(
-                            f"Yanlış", 
-                            min_value=0, 
-                            max_value=max_yanlis,
-                            key=f"{ders}_{konu}_yanlis",
-                            value=current_yanlis
-                        )
-                        
-                        # Boş otomatik hesapla
-                        bos = max(0, gercek_soru - dogru - yanlis)
-                        
-                        st.text_input(
-                            f"Boş (Otomatik)", 
-                            value=str(bos),
-                            key=f"{ders}_{konu}_bos_display",
-                            disabled=True
-                        )
-                        
-                        st.session_state.veriler[ders][konu] = {
-                            'dogru': dogru,
-                            'yanlis': yanlis,
-                            'bos': bos,
-                            'gercek_soru': gercek_soru
-                        }
-                        
-                        # Kontrol
-                        toplam = dogru + yanlis + bos
-                        if toplam == gercek_soru:
-                            st.success(f"✅ Toplam: {toplam}")
-                        else:
-                            st.error(f"❌ Toplam: {toplam}/{gercek_soru}")
-with tab2:
-    st.header("📊 Analiz Sonuçları")
-    
-    if st.button("🔍 Analiz Et"):
-        analiz_sonucu = analiz_et(st.session_state.veriler)
-        st.session_state.analiz_sonucu = analiz_sonucu
-        
-        if analiz_sonucu:
-            sorted_analiz = sorted(analiz_sonucu.items(), key=lambda x: x[1]['oncelik_puani'], reverse=True)
+                                # Boş otomatik hesapla
+                                bos = max(0, gercek_soru - dogru - yanlis)
+                            
+                                st.text_input(
+                                    f"Boş (Otomatik)", 
+                                    value=str(bos),
+                                    key=f"{ders}_{konu}_bos_display",
+                                    disabled=True
+                                )
+                            
+                                st.session_state.veriler[ders][konu] = {
+                                    'dogru': dogru,
+                                    'yanlis': yanlis,
+                                    'bos': bos,
+                                    'gercek_soru': gercek_soru
+                                }
+                            
+                                # Kontrol
+                                toplam = dogru + yanlis + bos
+                                if toplam == gercek_soru:
+                                    st.success(f"✅ Toplam: {toplam}")
+                                else:
+                                    st.error(f"❌ Toplam: {toplam}/{gercek_soru}")
+if tab2.open:
+    with tab2, olc('sekme.analiz'):
+        st.header("📊 Analiz Sonuçları")
+        
+        # Veriler değiştiyse mevcut analizi (ve analiz_sonucu'nu) yerinde güncelle
+        artimli = guncel_artimli_analiz()
+        
+        if st.button("🔍 Analiz Et"):
+            if artimli is None:
+                artimli = ArtimliAnaliz(st.session_state.veriler)
+                st.session_state.artimli_analiz = artimli
+            analiz_sonucu = artimli.analiz
+            st.session_state.analiz_sonucu = analiz_sonucu
             
+            if analiz_sonucu:
+                sorted_analiz = sorted(analiz_sonucu.items(), key=lambda x: x[1]['oncelik_puani'], reverse=True)
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.subheader("🔴 Öncelikli Konular")
+                    for i, (konu, bilgi) in enumerate(sorted_analiz[:10]):
+                        st.error(f"{i+1}. {konu} (Puan: {bilgi['oncelik_puani']:.1f})")
+                
+                with col2:
+                    st.subheader("🟢 İyi Durumda Olan Konular")
+                    for i, (konu, bilgi) in enumerate(sorted_analiz[-10:]):
+                        st.success(f"{i+1}. {konu} (Puan: {bilgi['oncelik_puani']:.1f})")
+                
+                st.plotly_chart(oncelik_grafigi(analiz_sonucu), use_container_width=True)
+                
+                # Risk haritası (Heatmap)
+                st.subheader("🔥 Konu Bazlı Risk Haritası")
+                st.plotly_chart(risk_haritasi(analiz_sonucu), use_container_width=True)
+            else:
+                st.warning("Analiz için veri bulunamadı!")
+
+if tab3.open:
+    with tab3, olc('sekme.program'):
+        st.header("📅 Çalışma Programı")
+        
+        # Analiz sekmesi bu çalıştırmada açık olmayabilir; analiz_sonucu'nu burada da güncelle
+        guncel_artimli_analiz()
+        
+        if 'analiz_sonucu' in st.session_state:
             col1, col2 = st.columns(2)
             
             with col1:
-                st.subheader("🔴 Öncelikli Konular")
-                for i, (konu, bilgi) in enumerate(sorted_analiz[:10]):
-                    st.error(f"{i+1}. {konu} (Puan: {bilgi['oncelik_puani']:.1f})")
-            
-            with col2:
-                st.subheader("🟢 İyi Durumda Olan Konular")
-                for i, (konu, bilgi) in enumerate(sorted_analiz[-10:]):
-                    st.success(f"{i+1}. {konu} (Puan: {bilgi['oncelik_puani']:.1f})")
-            
-            df_analiz = pd.DataFrame([
-                {
-                    'Konu': konu,
-                    'Öncelik Puanı': bilgi['oncelik_puani'],
-                    'Ders': bilgi['ders'],
-                    'Zorluk': bilgi['zorluk']
-                }
-                for konu, bilgi in analiz_sonucu.items()
-            ])
-            
-            fig = px.bar(df_analiz.head(20), 
-                        x='Öncelik Puanı', 
-                        y='Konu',
-                        color='Ders',
-                        title='En Öncelikli 20 Konu')
-            fig.update_layout(height=600)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Risk haritası (Heatmap)
-            st.subheader("🔥 Konu Bazlı Risk Haritası")
-            
-            # Heatmap için veri hazırlama
-            heatmap_data = []
-            for konu, bilgi in analiz_sonucu.items():
-                heatmap_data.append({
-                    'Ders': bilgi['ders'],
-                    'Konu': bilgi['konu'],
-                    'Öncelik Puanı': bilgi['oncelik_puani']
-                })
+                baslangic_tarihi = st.date_input("Başlangıç Tarihi", datetime.now())
             
-            df_heatmap = pd.DataFrame(heatmap_data)
+            if st.button("📋 Zaman Dilimli Program Oluştur"):
+                with st.spinner("Biyolojik saatinize uygun program hazırlanıyor..."):
+                    program = program_olustur_zaman_dilimli(
+                        st.session_state.analiz_sonucu, 
+                        baslangic_tarihi, 
+                        gun_sayisi, 
+                        gunluk_saat
+                    )
+                    st.session_state.program_df = pd.DataFrame(program)
+                    # Takvim gruplaması program başına bir kez yapılır
+                    st.session_state.takvim_haftalari = takvim_haftalari(program)
+                    st.session_state.takvim_sayfasi = 1
             
-            # Pivot tablo oluşturma
-            pivot_df = df_heatmap.pivot_table(
-                index='Ders', 
-                columns='Konu', 
-                values='Öncelik Puanı', 
-                aggfunc='first'
-            ).fillna(0)
-            
-            # Heatmap oluşturma
-            fig = px.imshow(
-                pivot_df,
-                labels=dict(x="Konu", y="Ders", color="Risk Puanı"),
-                color_continuous_scale='RdYlGn_r',  # Kırmızı-Yeşil renk skalası (ters)
-                title='Ders ve Konulara Göre Risk Dağılımı'
-            )
-            fig.update_layout(
-                height=700,
-                xaxis_title="Konular",
-                yaxis_title="Dersler",
-                coloraxis_colorbar=dict(title="Risk Puanı")
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.warning("Analiz için veri bulunamadı!")
-
-with tab3:
-    st.header("📅 Çalışma Programı")
-    
-    if 'analiz_sonucu' in st.session_state:
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            baslangic_tarihi = st.date_input("Başlangıç Tarihi", datetime.now())
-        
-        if st.button("📋 Zaman Dilimli Program Oluştur"):
-            with st.spinner("Biyolojik saatinize uygun program hazırlanıyor..."):
-                program = program_olustur_zaman_dilimli(
-                    st.session_state.analiz_sonucu, 
-                    baslangic_tarihi, 
-                    gun_sayisi, 
-                    gunluk_saat
-                )
-                program_df = pd.DataFrame(program)
-                st.session_state.program_df = program_df
+            if 'program_df' in st.session_state:
+                program_df = st.session_state.program_df
+                if 'takvim_haftalari' not in st.session_state:
+                    st.session_state.takvim_haftalari = takvim_haftalari(program_df.to_dict('records'))
+                haftalar = st.session_state.takvim_haftalari
                 
                 # YENİ: Takvim görünümünde ders programı
                 st.subheader("📅 Kişiselleştirilmiş Çalışma Takvimi")
                 
-                # Takvim görünümü için veriyi hazırla
-                takvim_df = program_df.copy()
-                takvim_df['Tarih'] = pd.to_datetime(takvim_df['Tarih'], format='%d.%m.%Y')
-                takvim_df['Hafta'] = takvim_df['Tarih'].dt.isocalendar().week
-                takvim_df['Gün Adı'] = takvim_df['Tarih'].dt.day_name()
-                
-                # Haftalara göre grupla
-                haftalar = takvim_df['Hafta'].unique()
+                # Yalnızca seçili sayfadaki haftalar gönderilir
+                toplam_sayfa = sayfa_sayisi(haftalar)
+                if toplam_sayfa > 1:
+                    sayfa = st.number_input(
+                        f"Sayfa (toplam {toplam_sayfa}, sayfa başına {HAFTA_SAYFA_BOYUTU} hafta)",
+                        min_value=1, max_value=toplam_sayfa, key="takvim_sayfasi"
+                    )
+                else:
+                    sayfa = 1
                 
-                for hafta in sorted(haftalar):
-                    st.markdown(f"### 🗓️ Hafta {hafta}")
-                    
-                    # Haftanın günlerini al
-                    hafta_df = takvim_df[takvim_df['Hafta'] == hafta]
-                    gunler = hafta_df['Tarih'].unique()
-                    
-                    # Günlere göre tablolar oluştur
-                    for tarih in sorted(gunler):
-                        tarih_df = hafta_df[hafta_df['Tarih'] == tarih]
-                        tarih_str = tarih.strftime('%d.%m.%Y')
-                        
-                        with st.container():
-                            st.markdown(f"#### 📅 {tarih_str} ({tarih_df.iloc[0]['Gün Adı']})")
-                            
-                            # Her zaman dilimi için kart
-                            for _, row in tarih_df.iterrows():
-                                # Zorluk seviyesine göre renk
-                                renk = "#FF6B6B" if row['Zorluk'] == "Zor" else "#4ECDC4" if row['Zorluk'] == "Orta" else "#FFD166"
-                                
-                                st.markdown(
-                                    f"""
-                                    <div style="
-                                        background-color: {renk};
-                                        border-radius: 10px;
-                                        padding: 15px;
-                                        margin-bottom: 15px;
-                                        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-                                    ">
-                                        <div style="display: flex; justify-content: space-between;">
-                                            <div><b>{row['Zaman']}</b></div>
-                                            <div>Öncelik: {row['Öncelik Puanı']:.1f}</div>
-                                        </div>
-                                        <h3 style="margin: 10px 0;">{row['Ders']}</h3>
-                                        <p style="margin: 0;"><b>{row['Konu']}</b></p>
-                                        <p style="margin: 0; font-size: 0.9em;">Zorluk: {row['Zorluk']}</p>
-                                    </div>
-                                    """,
-                                    unsafe_allow_html=True
-                                )
+                for hafta in sayfa_haftalari(haftalar, sayfa):
+                    st.markdown(hafta_html(hafta), unsafe_allow_html=True)
                 
                 # İlerleme takibi
                 st.subheader("📊 İlerleme Takibi")
                 
                 # Haftalık ilerleme grafiği
                 st.markdown("#### 📈 Haftalık Konu İlerlemesi")
-                haftalik_ilerleme = takvim_df.groupby('Hafta').size().reset_index(name='Konu Sayısı')
-                
-                fig = px.bar(haftalik_ilerleme,
-                            x='Hafta',
-                            y='Konu Sayısı',
-                            title='Haftalık Konu İlerlemesi',
-                            text='Konu Sayısı',
-                            color='Konu Sayısı',
-                            color_continuous_scale='Blues')
-                fig.update_traces(textposition='outside')
+                fig = haftalik_ilerleme_grafigi(
+                    [f"{h.yil}-H{h.hafta:02d}" for h in haftalar],
+                    [sum(len(satirlar) for _, _, satirlar in h.gunler) for h in haftalar]
+                )
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # Ders bazlı ilerleme
                 st.markdown("#### 📚 Derslere Göre Dağılım")
                 col1, col2 = st.columns(2)
+                ders_sayilari = {ders: int(sayi) for ders, sayi in program_df.groupby('Ders').size().items()}
+                pasta, cubuk = ders_dagilimi_grafikleri(ders_sayilari)
                 
                 with col1:
-                    ders_ilerleme = takvim_df.groupby('Ders').size().reset_index(name='Konu Sayısı')
-                    fig = px.pie(ders_ilerleme, 
-                                names='Ders', 
-                                values='Konu Sayısı',
-                                title='Derslere Göre Konu Dağılımı',
-                                hole=0.3)
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(pasta, use_container_width=True)
                 
                 with col2:
-                    fig = px.bar(ders_ilerleme.sort_values('Konu Sayısı', ascending=False),
-                                x='Ders',
-                                y='Konu Sayısı',
-                                color='Ders',
-                                title='Derslere Göre Konu Sayısı')
-                    st.plotly_chart(fig, use_container_width=True)
-    else:
-        st.warning("Önce analiz yapın!")
+                    st.plotly_chart(cubuk, use_container_width=True)
+
+            # Toplam saatin beklenen net kazancını en yükselten konu dağılımı
+            st.subheader("⏱️ Net Kazancına Göre Saat Dağılımı")
+            toplam_saat = gunluk_saat * gun_sayisi
+            dagilim = saat_dagit(st.session_state.analiz_sonucu, toplam_saat)
+            dagilim_satirlari = [
+                {
+                    'Ders': st.session_state.analiz_sonucu[konu_adi]['ders'],
+                    'Konu': st.session_state.analiz_sonucu[konu_adi]['konu'],
+                    'Saat': round(bilgi['saat'], 1),
+                    'Beklenen Net': round(bilgi['beklenen_net'], 2),
+                    'Potansiyel Net': round(bilgi['potansiyel_net'], 2)
+                }
+                for konu_adi, bilgi in sorted(dagilim.items(), key=lambda x: x[1]['saat'], reverse=True)
+                if bilgi['saat'] > 0
+            ]
+            if dagilim_satirlari:
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Toplam Saat", toplam_saat)
+                col2.metric("Beklenen Net Artışı", f"{sum(b['beklenen_net'] for b in dagilim.values()):.2f}")
+                col3.metric("Çalışılacak Konu", len(dagilim_satirlari))
+                st.dataframe(pd.DataFrame(dagilim_satirlari), use_container_width=True, hide_index=True)
+                st.caption("Her konuda kazanç azalan verimle artar; saatler, son saatin getirdiği net "
+                           "tüm konularda eşit olacak biçimde dağıtılır.")
+            else:
+                st.info("Yanlış veya boş sorusu olan konu yok.")
+            
+            # Binlerce sınav çekilişiyle mevcut ve plan sonrası net dağılımı
+            st.subheader("🎲 Sınav Günü Net Projeksiyonu")
+            projeksiyon = net_projeksiyonu(st.session_state.analiz_sonucu, dagilim)
+            mevcut, planli = projeksiyon['mevcut'], projeksiyon['planli']
+            col1, col2 = st.columns(2)
+            col1.metric("Bugünkü Beklenen Net", f"{mevcut['ortalama']:.1f}")
+            col1.caption(f"%90 aralık: {mevcut['alt']:.1f} – {mevcut['ust']:.1f}")
+            if planli:
+                col2.metric("Plan Sonrası Beklenen Net", f"{planli['ortalama']:.1f}",
+                            delta=f"{planli['ortalama'] - mevcut['ortalama']:+.1f}")
+                col2.caption(f"%90 aralık: {planli['alt']:.1f} – {planli['ust']:.1f}")
+            st.plotly_chart(net_projeksiyon_grafigi(projeksiyon['dagilim']), use_container_width=True)
+        else:
+            st.warning("Önce analiz yapın!")
 
 # TAB4 İÇERİĞİ
-with tab4:
-    st.header("📚 Akıllı Kaynak Önerileri")
-    
-    if 'analiz_sonucu' in st.session_state:
-        ders_basari = hesapla_ders_basari_orani(st.session_state.analiz_sonucu)
-        
-        st.subheader("🎯 Genel Durum Analizi")
-        col1, col2, col3 = st.columns(3)
-        
-        zayif_dersler = [ders for ders, bilgi in ders_basari.items() if bilgi['ortalama_puan'] >= 5]
-        iyi_dersler = [ders for ders, bilgi in ders_basari.items() if bilgi['ortalama_puan'] < 5]
-        ortalama_risk = sum(bilgi['ortalama_puan'] for bilgi in ders_basari.values()) / len(ders_basari) if ders_basari else 0
-        
-        col1.metric("Zayıf Dersler", len(zayif_dersler))
-        col2.metric("İyi Dersler", len(iyi_dersler))
-        col3.metric("Genel Risk Skoru", f"{ortalama_risk:.1f}")
-        st.markdown("---")
-        
-        for ders, bilgi in sorted(ders_basari.items(), key=lambda x: x[1]['ortalama_puan'], reverse=True):
-            # expanded_value'yu native Python bool'una dönüştür
-            expanded_value = bool(bilgi['ortalama_puan'] >= 5)
+if tab4.open:
+    with tab4, olc('sekme.kaynaklar'):
+        st.header("📚 Akıllı Kaynak Önerileri")
+        
+        if 'analiz_sonucu' in st.session_state:
+            artimli = guncel_artimli_analiz()
+            if artimli is not None and artimli.analiz is st.session_state.analiz_sonucu:
+                ders_basari = artimli.ders_basari_orani()
+            else:
+                ders_basari = hesapla_ders_basari_orani(st.session_state.analiz_sonucu)
             
-            with st.expander(
-                f"📖 {ders} - Seviye: {bilgi['seviye']} (Risk: {bilgi['ortalama_puan']:.1f})",
-                expanded=expanded_value
-            ):
-                st.subheader(f"📚 {ders} için Kitap Önerileri")
-                seviye = bilgi['seviye']
-                
-                if ders in KITAP_ONERILERI and seviye in KITAP_ONERILERI[ders]:
-                    kitaplar = KITAP_ONERILERI[ders][seviye]
-                    cols = st.columns(2)
-                    for i, kitap in enumerate(kitaplar):
-                        with cols[i % 2]:
-                            st.info(f"📖 {kitap}")
-                else:
-                    st.warning(f"{ders} için {seviye} seviye kitap önerisi bulunamadı")
-                
-                st.subheader(f"🎥 {ders} için YouTube Kanalları")
-                if ders in YOUTUBE_KANALLARI:
-                    kanallar = YOUTUBE_KANALLARI[ders]
-                    cols = st.columns(3)
-                    for i, kanal in enumerate(kanallar):
-                        with cols[i % 3]:
-                            st.success(f"📺 {kanal}")
-                else:
-                    st.warning(f"{ders} için YouTube kanal önerisi bulunamadı")
-                
-                st.subheader(f"🔍 {ders} - Zayıf Konular")
-                ders_zayif_konular = [
-                    (konu_adi, konu_bilgi) for konu_adi, konu_bilgi in st.session_state.analiz_sonucu.items()
-                    if konu_bilgi['ders'] == ders and konu_bilgi['oncelik_puani'] >= 3
-                ]
+            st.subheader("🎯 Genel Durum Analizi")
+            col1, col2, col3 = st.columns(3)
+            
+            zayif_dersler = [ders for ders, bilgi in ders_basari.items() if bilgi['ortalama_puan'] >= 5]
+            iyi_dersler = [ders for ders, bilgi in ders_basari.items() if bilgi['ortalama_puan'] < 5]
+            ortalama_risk = sum(bilgi['ortalama_puan'] for bilgi in ders_basari.values()) / len(ders_basari) if ders_basari else 0
+            
+            col1.metric("Zayıf Dersler", len(zayif_dersler))
+            col2.metric("İyi Dersler", len(iyi_dersler))
+            col3.metric("Genel Risk Skoru", f"{ortalama_risk:.1f}")
+            st.markdown("---")
+            
+            for ders, bilgi in sorted(ders_basari.items(), key=lambda x: x[1]['ortalama_puan'], reverse=True):
+                # expanded_value'yu native Python bool'una dönüştür
+                expanded_value = bool(bilgi['ortalama_puan'] >= 5)
                 
-                if ders_zayif_konular:
-                    sorted_zayif = sorted(ders_zayif_konular, key=lambda x: x[1]['oncelik_puani'], reverse=True)
+                with st.expander(
+                    f"📖 {ders} - Seviye: {bilgi['seviye']} (Risk: {bilgi['ortalama_puan']:.1f})",
+                    expanded=expanded_value
+                ):
+                    st.subheader(f"📚 {ders} için Kitap Önerileri")
+                    seviye = bilgi['seviye']
+                    
+                    if ders in KITAP_ONERILERI and seviye in KITAP_ONERILERI[ders]:
+                        kitaplar = KITAP_ONERILERI[ders][seviye]
+                        cols = st.columns(2)
+                        for i, kitap in enumerate(kitaplar):
+                            with cols[i % 2]:
+                                st.info(f"📖 {kitap}")
+                    else:
+                        st.warning(f"{ders} için {seviye} seviye kitap önerisi bulunamadı")
                     
-                    for konu_adi, konu_bilgi in sorted_zayif[:5]:
-                        konu_adi_clean = konu_adi.split(' - ')[1]
+                    st.subheader(f"🎥 {ders} için YouTube Kanalları")
+                    if ders in YOUTUBE_KANALLARI:
+                        kanallar = YOUTUBE_KANALLARI[ders]
+                        cols = st.columns(3)
+                        for i, kanal in enumerate(kanallar):
+                            with cols[i % 3]:
+                                st.success(f"📺 {kanal}")
+                    else:
+                        st.warning(f"{ders} için YouTube kanal önerisi bulunamadı")
+                    
+                    st.subheader(f"🔍 {ders} - Zayıf Konular")
+                    ders_zayif_konular = [
+                        (konu_adi, konu_bilgi) for konu_adi, konu_bilgi in st.session_state.analiz_sonucu.items()
+                        if konu_bilgi['ders'] == ders and konu_bilgi['oncelik_puani'] >= 3
+                    ]
+                    
+                    if ders_zayif_konular:
+                        sorted_zayif = sorted(ders_zayif_konular, key=lambda x: x[1]['oncelik_puani'], reverse=True)
                         
-                        with st.container():
-                            st.write(f"**{konu_adi_clean}** (Risk: {konu_bilgi['oncelik_puani']:.1f})")
-                            
-                            cols = st.columns(2)
-                            with cols[0]:
-                                st.write("🎬 **Video Önerileri:**")
-                                for video in youtube_video_ara(ders, konu_adi_clean)[:3]:
-                                    st.write(f"• {video}")
-                            
-                            with cols[1]:
-                                st.write("📝 **Çalışma Önerileri:**")
-                                if konu_bilgi['zorluk'] == 'Zor':
-                                    st.write("• Temel kavramları tekrar edin")
-                                    st.write("• Bol örnek çözün")
-                                    st.write("• Günde 30 dk ayırın")
-                                elif konu_bilgi['zorluk'] == 'Orta':
-                                    st.write("• Soru bankası çözün")
-                                    st.write("• Testler yapın")
-                                    st.write("• Günde 20 dk ayırın")
-                                else:
-                                    st.write("• Kısa tekrarlar yapın")
-                                    st.write("• Formülleri ezberleyin")
-                                    st.write("• Günde 10 dk ayırın")
+                        for konu_adi, konu_bilgi in sorted_zayif[:5]:
+                            konu_adi_clean = konu_bilgi['konu']
                             
-                            st.markdown("---")
-                else:
-                    st.info(f"🎉 {ders} dersinde kritik zayıflık yok!")
-        
-        st.markdown("---")
-        st.subheader("💡 Genel Strateji Önerileri")
-        risk_skoru = sum(bilgi['ortalama_puan'] for bilgi in ders_basari.values()) / len(ders_basari)
+                            with st.container():
+                                st.write(f"**{konu_adi_clean}** (Risk: {konu_bilgi['oncelik_puani']:.1f})")
+                                
+                                cols = st.columns(2)
+                                with cols[0]:
+                                    st.write("🎬 **Video Önerileri:**")
+                                    for video in youtube_video_ara(ders, konu_adi_clean)[:3]:
+                                        st.write(f"• {video}")
+                                
+                                with cols[1]:
+                                    st.write("📝 **Çalışma Önerileri:**")
+                                    if konu_bilgi['zorluk'] == 'Zor':
+                                        st.write("• Temel kavramları tekrar edin")
+                                        st.write("• Bol örnek çözün")
+                                        st.write("• Günde 30 dk ayırın")
+                                    elif konu_bilgi['zorluk'] == 'Orta':
+                                        st.write("• Soru bankası çözün")
+                                        st.write("• Testler yapın")
+                                        st.write("• Günde 20 dk ayırın")
+                                    else:
+                                        st.write("• Kısa tekrarlar yapın")
+                                        st.write("• Formülleri ezberleyin")
+                                        st.write("• Günde 10 dk ayırın")
+                                
+                                st.markdown("---")
+                    else:
+                        st.info(f"🎉 {ders} dersinde kritik zayıflık yok!")
+            
+            st.markdown("---")
+            st.subheader("💡 Genel Strateji Önerileri")
+            risk_skoru = sum(bilgi['ortalama_puan'] for bilgi in ders_basari.values()) / len(ders_basari)
+            
+            if risk_skoru >= 5:
+                st.error("🚨 **Acil Durum Stratejisi:**")
+                st.write("• Temel konulara odaklanın")
+                st.write("• Günde en az 6 saat çalışın")
+                st.write("• Kolay kitaplardan başlayın")
+                st.write("• YouTube'dan konu anlatımları izleyin")
+            elif risk_skoru >= 3:
+                st.warning("⚠️ **Orta Seviye Strateji:**")
+                st.write("• Zayıf konulara ağırlık verin")
+                st.write("• Günde 4-5 saat çalışın")
+                st.write("• Soru bankası çözmeye odaklanın")
+                st.write("• Düzenli testler yapın")
+            else:
+                st.success("✅ **Pekiştirme Stratejisi:**")
+                st.write("• Tüm konuları dengeli çalışın")
+                st.write("• Günde 3-4 saat çalışın")
+                st.write("• Deneme sınavlarına odaklanın")
+                st.write("• Hızınızı artırmaya çalışın")
         
-        if risk_skoru >= 5:
-            st.error("🚨 **Acil Durum Stratejisi:**")
-            st.write("• Temel konulara odaklanın")
-            st.write("• Günde en az 6 saat çalışın")
-            st.write("• Kolay kitaplardan başlayın")
-            st.write("• YouTube'dan konu anlatımları izleyin")
-        elif risk_skoru >= 3:
-            st.warning("⚠️ **Orta Seviye Strateji:**")
-            st.write("• Zayıf konulara ağırlık verin")
-            st.write("• Günde 4-5 saat çalışın")
-            st.write("• Soru bankası çözmeye odaklanın")
-            st.write("• Düzenli testler yapın")
         else:
-            st.success("✅ **Pekiştirme Stratejisi:**")
-            st.write("• Tüm konuları dengeli çalışın")
-            st.write("• Günde 3-4 saat çalışın")
-            st.write("• Deneme sınavlarına odaklanın")
-            st.write("• Hızınızı artırmaya çalışın")
-    
-    else:
-        st.warning("⚠️ Kaynak önerileri için önce analiz yapın!")
+            st.warning("⚠️ Kaynak önerileri için önce analiz yapın!")
 
-with tab5:
-    st.header("📝 Öğrenci Genel Özeti")
-    
-    if 'veriler' in st.session_state and st.session_state.veriler:
-        genel_ozet, ders_bazli_ozet = hesapla_performans_ozeti(st.session_state.veriler)
-        
-        st.subheader("📊 Genel İstatistikler")
-        col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Toplam Soru", genel_ozet['Toplam Soru'])
-        col2.metric("Toplam Doğru", genel_ozet['Toplam Doğru'])
-        col3.metric("Toplam Yanlış", genel_ozet['Toplam Yanlış'])
-        col4.metric("Toplam Boş", genel_ozet['Toplam Boş'])
+if tab5.open:
+    with tab5, olc('sekme.ogrenci_ozeti'):
+        st.header("📝 Öğrenci Genel Özeti")
         
-        col1, col2, col3 = st.columns(3)
-        col1.metric("Net", f"{genel_ozet['Net']:.2f}")
-        col2.metric("Max Net", genel_ozet['Max Net'])
-        col3.metric("Kalan Net", f"{genel_ozet['Kalan Net']:.2f}")
-        
-        st.subheader("📈 Başarı Oranı")
-        basari_orani = genel_ozet['Başarı Oranı']
-        st.progress(basari_orani / 100)
-        st.markdown(f"**{basari_orani:.2f}%** Başarı Oranı")
-        
-        st.subheader("📚 Ders Bazlı Performans")
-        ders_performans = []
-        for ders, bilgi in ders_bazli_ozet.items():
-            ders_performans.append({
-                'Ders': ders, 
-                'Net': bilgi['Net'], 
-                'Max Net': bilgi['Max Net'], 
-                'Kalan Net': bilgi['Kalan Net'], 
-                'Başarı Oranı': bilgi['Başarı Oranı']
-            })
-        
-        ders_df = pd.DataFrame(ders_performans)
-        fig = px.bar(ders_df, x='Ders', y=['Net', 'Kalan Net'],
-                     title='Derslere Göre Net Durumu', 
-                     labels={'value': 'Net', 'variable': 'Durum'},
-                     barmode='group')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        st.subheader("🔍 Detaylı Performans Tablosu")
-        st.dataframe(ders_df, use_container_width=True)
-        
-        st.subheader("🎯 İyileştirme Alanları")
-        en_cok_kalan = ders_df.sort_values('Kalan Net', ascending=False).head(3)
-        for i, row in en_cok_kalan.iterrows():
-            st.error(f"{row['Ders']}: {row['Kalan Net']:.2f} net kazanma potansiyeli")
-    else:
-        st.warning("⚠️ Önce veri girişi yapın!")
+        if 'veriler' in st.session_state and st.session_state.veriler:
+            genel_ozet, ders_bazli_ozet = hesapla_performans_ozeti(st.session_state.veriler)
+            
+            st.subheader("📊 Genel İstatistikler")
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Toplam Soru", genel_ozet['Toplam Soru'])
+            col2.metric("Toplam Doğru", genel_ozet['Toplam Doğru'])
+            col3.metric("Toplam Yanlış", genel_ozet['Toplam Yanlış'])
+            col4.metric("Toplam Boş", genel_ozet['Toplam Boş'])
+            
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Net", f"{genel_ozet['Net']:.2f}")
+            col2.metric("Max Net", genel_ozet['Max Net'])
+            col3.metric("Kalan Net", f"{genel_ozet['Kalan Net']:.2f}")
+            
+            st.subheader("📈 Başarı Oranı")
+            basari_orani = genel_ozet['Başarı Oranı']
+            st.progress(basari_orani / 100)
+            st.markdown(f"**{basari_orani:.2f}%** Başarı Oranı")
+            
+            st.subheader("📚 Ders Bazlı Performans")
+            ders_performans = []
+            for ders, bilgi in ders_bazli_ozet.items():
+                ders_performans.append({
+                    'Ders': ders, 
+                    'Net': bilgi['Net'], 
+                    'Max Net': bilgi['Max Net'], 
+                    'Kalan Net': bilgi['Kalan Net'], 
+                    'Başarı Oranı': bilgi['Başarı Oranı']
+                })
+            
+            ders_df = pd.DataFrame(ders_performans)
+            st.plotly_chart(ders_net_grafigi(ders_performans), use_container_width=True)
+            
+            st.subheader("🔍 Detaylı Performans Tablosu")
+            st.dataframe(ders_df, use_container_width=True)
+            
+            st.subheader("🎯 İyileştirme Alanları")
+            en_cok_kalan = ders_df.sort_values('Kalan Net', ascending=False).head(3)
+            for i, row in en_cok_kalan.iterrows():
+                st.error(f"{row['Ders']}: {row['Kalan Net']:.2f} net kazanma potansiyeli")
+        else:
+            st.warning("⚠️ Önce veri girişi yapın!")
+
+if tab6.open:
+    with tab6, olc('sekme.gelisim'):
+        st.header("📉 Gelişim Trendi")
+        
+        ogrenci = st.session_state.get('ogrenci_adi', '').strip()
+        if not deneme_deposu:
+            st.warning("⚠️ Deneme geçmişi kullanılamıyor.")
+        elif not ogrenci:
+            st.info("ℹ️ Veri Giriş sekmesindeki Deneme Geçmişi bölümünden öğrenci adını girin.")
+        else:
+            gecmis = deneme_deposu.gecmis_tablosu([ogrenci])
+            deneme_sayisi = gecmis['deneme'].nunique()
+            if deneme_sayisi < 2:
+                st.info(f"ℹ️ Trend için en az 2 kayıtlı deneme gerekli ({ogrenci}: {deneme_sayisi}).")
+            else:
+                pencere = st.slider("Son Kaç Deneme?", 2, max(2, min(20, deneme_sayisi)),
+                                    min(VARSAYILAN_PENCERE, deneme_sayisi),
+                                    help="Kayan net, eğim ve oynaklık son bu kadar denemeden hesaplanır.")
+                
+                ders_ozet = ders_trendleri(gecmis, pencere)
+                cols = st.columns(len(ders_ozet))
+                for col, satir in zip(cols, ders_ozet.itertuples()):
+                    col.metric(satir.ders, f"{satir.kayan_net:.2f}", f"{satir.egim:+.2f} / deneme")
+                
+                seri = ders_net_serisi(gecmis, pencere)
+                st.plotly_chart(ders_trend_grafigi([
+                    {'Tarih': str(satir.tarih.date()), 'Ders': satir.ders, 'Net': satir.net, 'Kayan Net': satir.kayan_net}
+                    for satir in seri.itertuples()
+                ]), use_container_width=True)
+                
+                konu_ozet = konu_trendleri(gecmis, pencere).sort_values('egim')
+                degisen = konu_ozet[konu_ozet['egim'].fillna(0) != 0]
+                if len(degisen):
+                    hareketli = pd.concat([degisen.head(10), degisen.tail(10)]).drop_duplicates(['ders', 'konu'])
+                    st.plotly_chart(konu_egim_grafigi([
+                        {'Konu': f"{satir.ders} - {satir.konu}", 'Eğim': satir.egim}
+                        for satir in hareketli.itertuples()
+                    ]), use_container_width=True)
+                
+                st.subheader("🔍 Konu Bazlı Trend Tablosu")
+                st.dataframe(
+                    konu_ozet.drop(columns='ogrenci').rename(columns={
+                        'ders': 'Ders', 'konu': 'Konu', 'deneme_sayisi': 'Deneme', 'son_net': 'Son Net',
+                        'kayan_net': 'Kayan Net', 'egim': 'Eğim', 'oynaklik': 'Oynaklık'
+                    }).round(2),
+                    use_container_width=True, hide_index=True
+                )
 
 # Export butonu
 if 'program_df' in st.session_state:
@@ -1034,6 +799,9 @@ if 'program_df' in st.session_state:
     st.subheader("📁 Dışa Aktarma")
     
     if st.button("💾 Profesyonel Excel Oluştur"):
+        # openpyxl yalnızca dışa aktarım istendiğinde yüklenir
+        from tyt.disa_aktarim import excel_export_professional
+        
         try:
             excel_data = excel_export_professional(st.session_state.program_df)
             st.download_button(
@@ -1045,5 +813,50 @@ if 'program_df' in st.session_state:
         except Exception as e:
             st.error(f"Excel export hatası: {str(e)}")
 
+# Sınıf için toplu dışa aktarma
+with st.expander("👥 Sınıf Programlarını Toplu İndir"):
+    st.caption("Her satırı bir öğrenci olan deneme sonuçları dosyası (CSV/Excel) yükleyin; "
+               "her öğrencinin programı ayrı bir Excel dosyası olarak zip arşivinde indirilir.")
+    sinif_dosyasi = st.file_uploader("Sınıf Deneme Sonuçları", type=["csv", "xlsx"])
+    sinif_baslangic = st.date_input("Sınıf Programı Başlangıç Tarihi", datetime.now())
+
+    if sinif_dosyasi and st.button("📦 Sınıf Arşivini Oluştur"):
+        import io
+        import tempfile
+
+        from tyt.disa_aktarim import toplu_excel_zip
+        from tyt.kohort import kohort_ogrenci_programlari
+
+        try:
+            with st.spinner("Öğrenci programları hazırlanıyor..."):
+                uzanti = os.path.splitext(sinif_dosyasi.name)[1].lower()
+                with tempfile.TemporaryDirectory() as dizin:
+                    girdi = os.path.join(dizin, "sinif" + uzanti)
+                    with open(girdi, "wb") as f:
+                        f.write(sinif_dosyasi.getbuffer())
+                    arsiv = io.BytesIO()
+                    atlananlar = []
+                    # Çok iş parçacıklı Streamlit sunucusundan süreç havuzu çatallamak
+                    # güvenli değil; bir sınıf zaten birkaç parçaya sığar
+                    ogrenci_sayisi = toplu_excel_zip(
+                        kohort_ogrenci_programlari(girdi, sinif_baslangic, gun_sayisi, gunluk_saat,
+                                                   isci_sayisi=1, atlananlar=atlananlar), arsiv
+                    )
+            st.success(f"{ogrenci_sayisi} öğrencinin programı hazır.")
+            if atlananlar:
+                st.warning(
+                    f"{len(atlananlar)} satır sayıya çevrilemeyen değer içerdiği için atlandı: "
+                    + ", ".join(f"{satir_no}. satır ({ogrenci})" for satir_no, ogrenci in atlananlar[:10])
+                    + (" ..." if len(atlananlar) > 10 else "")
+                )
+            st.download_button(
+                label="Zip Arşivini İndir",
+                data=arsiv,
+                file_name=f"tyt_sinif_programlari_{datetime.now().strftime('%Y%m%d')}.zip",
+                mime="application/zip"
+            )
+        except Exception as e:
+            st.error(f"Toplu export hatası: {str(e)}")
+
 st.markdown("---")
 st.markdown("💡 **İpucu:** Düzenli olarak deneme sonuçlarınızı güncelleyin ve programınızı yenileyin!")